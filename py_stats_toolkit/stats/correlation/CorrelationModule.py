@@ -66,11 +66,28 @@ class CorrelationModule(BaseCapsule):
         """
         pass 
 
+from collections.abc import Iterator
+
 import numpy as np
 import pandas as pd
 from scipy import stats
 from ..core.AbstractClassBase import StatisticalModule
 from ...utils.parallel import ParallelProcessor, get_optimal_chunk_size
+from .engine import DEFAULT_TILE_SIZE, in_waves, pairwise_counts, tiled_correlation
+from .lagged import lagged_correlation, peak_lags
+from .masked import masked_correlation
+from .pairs import correlated_pairs, top_correlations
+from .rank import kendall_correlation, rank_columns, spearman_correlation
+from .shrinkage import shrunk_covariance
+from .significance import correlation_significance
+from .storage import CorrelationStore, stored_correlation
+from .streaming import StreamingCorrelation
+
+
+def _fit_chunk(chunk):
+    """Accumulateur partiel d'un chunk (exécuté dans un worker)."""
+    return StreamingCorrelation().partial_fit(chunk)
+
 
 class CorrelationModule(StatisticalModule):
     """Module pour l'analyse de corrélation."""
@@ -78,59 +95,331 @@ class CorrelationModule(StatisticalModule):
     def __init__(self, n_jobs: int = -1):
         super().__init__()
         self.method = None
+        self.accumulator = None
+        self.n_obs = None
+        self.lagged = None
+        self.shrinkage_intensity = None
         self.parallel_processor = ParallelProcessor(n_jobs=n_jobs)
     
-    def _compute_correlation_chunk(self, chunk_data):
-        """Calcule la corrélation pour un chunk de données."""
-        return chunk_data.corr(method=self.method)
+    def _tile_size(self, n_cols, tile_size=None):
+        """Largeur des tuiles : assez de tuiles pour occuper tous les workers."""
+        if tile_size is not None:
+            return int(tile_size)
+        return max(1, min(DEFAULT_TILE_SIZE, get_optimal_chunk_size(n_cols, self.parallel_processor.n_jobs)))
     
-    def process(self, data, method="pearson", **kwargs):
+    def process(self, data, method="pearson", tile_size=None, min_periods=1, output_path=None,
+                dtype=np.float32, layout=None, **kwargs):
         """
         Calcule la corrélation entre les variables en parallèle.
         
+        En Pearson sans valeurs manquantes, la matrice est standardisée une
+        fois puis calculée par tuiles Z_i.T @ Z_j (BLAS) réparties entre les
+        workers et assemblées dans une matrice préallouée. Spearman réutilise
+        ce moteur sur les rangs de chaque colonne ; Kendall applique
+        l'algorithme de Knight (O(n log n)) à chaque paire, en parallèle.
+        Avec des valeurs manquantes, Pearson est calculé sur les observations
+        complètes par paire par produits matriciels du masque de présence,
+        répartis par tuiles, et Kendall écarte les valeurs manquantes paire
+        par paire avant l'algorithme de Knight ; les effectifs par paire
+        sont conservés dans n_obs.
+        
+        Avec output_path, les tuiles sont écrites au fil du calcul dans un
+        fichier .npy projeté en mémoire et le résultat est un
+        CorrelationStore (lecture par blocs, get_correlation_pairs) : la
+        matrice n'est jamais entièrement en mémoire.
+        
         Args:
-            data: Données d'entrée (pandas DataFrame)
+            data: Données d'entrée (pandas DataFrame) ; un itérateur de
+                chunks (générateur, pd.read_csv(chunksize=...)) est accumulé
+                en Pearson (process_chunks). Une liste de chunks doit passer
+                par process_chunks ou iter(...)
             method: Méthode de corrélation ('pearson', 'spearman', 'kendall')
+            tile_size: Largeur des tuiles de colonnes
+            min_periods: Effectif minimal d'une paire avec valeurs manquantes
+            output_path: Chemin d'un fichier .npy où écrire la matrice
+                (Pearson et Spearman)
+            dtype: Type du stockage sur disque (np.float32 ou np.float64)
+            layout: 'upper' (carré p x p, triangle supérieur écrit : deux
+                fois la taille utile pour un accès direct) ou 'packed'
+                (p(p + 1) / 2 coefficients) ; par défaut 'packed' à partir
+                de 4096 variables
             **kwargs: Arguments additionnels
             
         Returns:
-            Matrice de corrélation
+            Matrice de corrélation (CorrelationStore avec output_path)
         """
+        if isinstance(data, Iterator):
+            if method != "pearson":
+                raise ValueError("Le mode par chunks ne supporte que method='pearson'")
+            self.method = method
+            return self.process_chunks(data)
+        
         self.validate_data(data)
         self.method = method
         
         if not isinstance(data, pd.DataFrame):
             raise TypeError("Les données doivent être un pandas DataFrame")
         
-        # Pour les petits DataFrames, calcul direct
-        if len(data.columns) < 100:
-            self.result = data.corr(method=method)
+        if method not in ("pearson", "spearman", "kendall"):
+            raise ValueError(f"Méthode {method} non supportée")
+        values = data.to_numpy(dtype=np.float64)
+        n_jobs = max(1, self.parallel_processor.n_jobs)
+        if output_path is not None:
+            return self._process_stored(values, data.columns, method, output_path, dtype, layout, tile_size,
+                                        min_periods)
+        if np.isnan(values).any():
+            if method == "pearson":
+                matrix, self.n_obs = masked_correlation(
+                    values,
+                    tile_size=self._tile_size(values.shape[1], tile_size),
+                    map_func=self.parallel_processor.parallel_map,
+                    wave_size=n_jobs * 2,
+                    min_periods=min_periods,
+                )
+                self.result = pd.DataFrame(matrix, index=data.columns, columns=data.columns, copy=False)
+                return self.result
+            self.n_obs = pairwise_counts(values)
+            if method == "kendall":
+                matrix = kendall_correlation(
+                    values, map_func=self.parallel_processor.parallel_map,
+                    wave_size=n_jobs * 4, min_periods=min_periods,
+                )
+                self.result = pd.DataFrame(matrix, index=data.columns, columns=data.columns, copy=False)
+                return self.result
+            self.result = data.corr(method=method, min_periods=min_periods)
             return self.result
         
-        # Pour les grands DataFrames, traitement parallèle
-        n_cols = len(data.columns)
-        chunk_size = get_optimal_chunk_size(n_cols, self.parallel_processor.n_jobs)
+        self.n_obs = len(values)
+        if method == "kendall":
+            matrix = kendall_correlation(
+                values, map_func=self.parallel_processor.parallel_map, wave_size=n_jobs * 4
+            )
+        else:
+            engine = tiled_correlation if method == "pearson" else spearman_correlation
+            matrix = engine(
+                values,
+                tile_size=self._tile_size(values.shape[1], tile_size),
+                map_func=self.parallel_processor.parallel_map,
+                wave_size=n_jobs * 2,
+            )
+        self.result = pd.DataFrame(matrix, index=data.columns, columns=data.columns, copy=False)
+        return self.result
+    
+    def _process_stored(self, values, columns, method, output_path, dtype, layout, tile_size, min_periods=1):
+        """Corrélation écrite tuile par tuile dans un fichier projeté en mémoire."""
+        if method == "kendall":
+            raise ValueError("Le stockage sur disque supporte 'pearson' et 'spearman'")
+        if method == "spearman":
+            if np.isnan(values).any():
+                raise ValueError("Spearman sur disque requiert des données sans valeurs manquantes")
+            values = rank_columns(values)
+        self.n_obs = len(values) if not np.isnan(values).any() else None
+        self.result = stored_correlation(
+            values,
+            output_path,
+            dtype=dtype,
+            layout=layout,
+            tile_size=self._tile_size(values.shape[1], tile_size),
+            map_func=self.parallel_processor.parallel_map,
+            wave_size=max(1, self.parallel_processor.n_jobs) * 2,
+            columns=columns,
+            min_periods=min_periods,
+        )
+        return self.result
+    
+    def process_chunks(self, chunks):
+        """
+        Corrélation de Pearson d'un flux de chunks de lignes.
+        
+        Les chunks sont accumulés en parallèle, par vagues de n_jobs, puis
+        fusionnés dans l'ordre : la mémoire est O(p²) quel que soit le
+        nombre de lignes.
         
-        # Division des colonnes en chunks
-        chunks = []
-        for i in range(0, n_cols, chunk_size):
-            chunk_cols = data.columns[i:min(i + chunk_size, n_cols)]
-            chunks.append(data[chunk_cols])
+        Args:
+            chunks: Itérable de DataFrames (ou matrices) de mêmes colonnes
+            
+        Returns:
+            Matrice de corrélation
+        """
+        self.accumulator = StreamingCorrelation()
+        for wave in in_waves(chunks, max(1, self.parallel_processor.n_jobs)):
+            for partial in self.parallel_processor.parallel_map(_fit_chunk, wave):
+                self.accumulator.merge(partial)
+        return self.finalize()
+    
+    def partial_fit(self, chunk):
+        """
+        Ajoute un chunk de lignes à l'accumulateur de Pearson.
         
-        # Calcul parallèle des corrélations
-        chunk_results = self.parallel_processor.parallel_map(
-            self._compute_correlation_chunk,
-            chunks
+        Args:
+            chunk: DataFrame (ou matrice) ; les lignes incomplètes sont ignorées
+            
+        Returns:
+            Accumulateur mis à jour
+        """
+        if self.accumulator is None:
+            self.accumulator = StreamingCorrelation()
+        return self.accumulator.partial_fit(chunk)
+    
+    def merge(self, other):
+        """
+        Fusionne l'accumulateur d'un autre CorrelationModule (ou un StreamingCorrelation).
+        
+        Args:
+            other: Module ou accumulateur ayant traité d'autres partitions
+        """
+        accumulator = other.accumulator if isinstance(other, CorrelationModule) else other
+        if self.accumulator is None:
+            self.accumulator = StreamingCorrelation()
+        self.accumulator.merge(accumulator)
+    
+    def finalize(self):
+        """
+        Calcule la matrice de corrélation à partir de l'accumulateur.
+        
+        Returns:
+            Matrice de corrélation
+        """
+        if self.accumulator is None:
+            raise ValueError("Aucune donnée accumulée : appelez d'abord partial_fit()")
+        self.method = "pearson"
+        self.n_obs = self.accumulator.n
+        self.result = self.accumulator.finalize()
+        if not isinstance(self.result, pd.DataFrame):
+            self.result = pd.DataFrame(self.result)
+        return self.result
+    
+    def process_lagged(self, data, max_lag, tile_size=None, **kwargs):
+        """
+        Corrélations croisées décalées (lags -max_lag..max_lag) de toutes les paires.
+        
+        Les spectres rfft des colonnes sont calculés une fois, puis les
+        produits croisés de tous les décalages d'une paire sont obtenus par
+        une seule irfft, par tuiles de paires réparties entre les workers.
+        Le coût est O(p² n log n) au lieu de O(L p² n) par décalages
+        successifs.
+        
+        Args:
+            data: Données d'entrée (pandas DataFrame sans valeurs manquantes,
+                lignes ordonnées dans le temps)
+            max_lag: Décalage maximal
+            tile_size: Largeur des tuiles de colonnes (bornée par la mémoire
+                par défaut)
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            Dictionnaire : 'lags', 'profile' (tableau (p, p, 2L + 1) où
+            profile[i, j, k] est la corrélation de x_i[t] et x_j[t + lags[k]]),
+            'peak_lag' et 'peak_correlation' (DataFrames)
+        """
+        self.validate_data(data)
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Les données doivent être un pandas DataFrame")
+        lags, profile = lagged_correlation(
+            data.to_numpy(dtype=np.float64),
+            max_lag,
+            tile_size=tile_size,
+            map_func=self.parallel_processor.parallel_map,
+            wave_size=max(1, self.parallel_processor.n_jobs) * 2,
         )
+        peak_lag, peak_correlation = peak_lags(lags, profile)
+        columns = data.columns
+        self.lagged = {
+            'lags': lags,
+            'profile': profile,
+            'peak_lag': pd.DataFrame(peak_lag, index=columns, columns=columns),
+            'peak_correlation': pd.DataFrame(peak_correlation, index=columns, columns=columns),
+            'columns': columns,
+        }
+        return self.lagged
+    
+    def get_lag_profile(self, var1, var2):
+        """
+        Profil de corrélation décalée d'une paire.
+        
+        Args:
+            var1: Variable de référence x
+            var2: Variable décalée y
+            
+        Returns:
+            Series indexée par le décalage k : corrélation de x[t] et y[t + k]
+        """
+        if self.lagged is None:
+            raise ValueError("Exécutez d'abord process_lagged()")
+        columns = self.lagged['columns']
+        profile = self.lagged['profile'][columns.get_loc(var1), columns.get_loc(var2)]
+        return pd.Series(profile, index=pd.Index(self.lagged['lags'], name='Lag'), name=(var1, var2))
+    
+    def process_shrinkage(self, data, method="ledoit_wolf", kind="correlation", factored=False,
+                          **kwargs):
+        """
+        Corrélation (ou covariance) rétrécie de Ledoit-Wolf ou OAS.
         
-        # Assemblage des résultats
-        self.result = pd.concat(chunk_results, axis=1)
+        Adaptée au cas p >> n, où la matrice empirique est singulière.
+        L'intensité est calculée sur la matrice de Gram (n, n) lorsque
+        n < p ; avec factored=True, la matrice (p, p) n'est jamais formée.
+        
+        Args:
+            data: Données d'entrée (pandas DataFrame sans valeurs manquantes)
+            method: 'ledoit_wolf' ou 'oas'
+            kind: 'correlation' ou 'covariance'
+            factored: Si True, renvoie la forme rang faible plus diagonale
+                (LowRankPlusDiagonal : matvec, solve, diag) sans modifier
+                self.result
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            DataFrame (p, p), ou LowRankPlusDiagonal avec factored=True
+        """
+        self.validate_data(data)
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Les données doivent être un pandas DataFrame")
+        if kind not in ("correlation", "covariance"):
+            raise ValueError(f"Type {kind} non supporté")
+        matrix, self.shrinkage_intensity = shrunk_covariance(
+            data.to_numpy(dtype=np.float64),
+            method=method,
+            standardized=kind == "correlation",
+            factored=factored,
+        )
+        if factored:
+            return matrix
+        self.method = method
+        self.n_obs = len(data)
+        self.result = pd.DataFrame(matrix, index=data.columns, columns=data.columns, copy=False)
         return self.result
     
     def get_correlation_matrix(self):
         """Retourne la matrice de corrélation."""
         return self.result
     
+    def get_significance(self, alpha=0.05):
+        """
+        Significativité de toutes les paires, calculée matriciellement.
+        
+        Statistiques de test, p-values, intervalles de confiance de Fisher
+        et q-values de Benjamini-Hochberg sont obtenus à partir de la
+        matrice de corrélation et de l'effectif (effectif par paire si les
+        données comportaient des valeurs manquantes).
+        
+        Args:
+            alpha: Risque de l'intervalle de confiance (1 - alpha)
+            
+        Returns:
+            Dictionnaire de DataFrames : 'statistic', 'p_value', 'ci_lower',
+            'ci_upper', 'q_value', 'n'
+        """
+        if self.result is None:
+            raise ValueError("Exécutez d'abord process()")
+        if isinstance(self.result, CorrelationStore):
+            raise ValueError("Significativité non disponible pour une matrice stockée sur disque")
+        results = correlation_significance(self.result.values, self.n_obs, self.method, alpha)
+        columns = self.result.columns
+        return {
+            name: pd.DataFrame(matrix, index=columns, columns=columns)
+            for name, matrix in results.items()
+        }
+    
     def get_correlation_pairs(self, threshold=0.5):
         """
         Retourne les paires de variables avec une corrélation supérieure au seuil.
@@ -143,23 +432,69 @@ class CorrelationModule(StatisticalModule):
         """
         if self.result is None:
             raise ValueError("Exécutez d'abord process()")
+        if isinstance(self.result, CorrelationStore):
+            return self.result.get_correlation_pairs(threshold)
         
-        # Utilisation de numpy pour le calcul parallèle des paires
+        # Parcours par blocs de lignes du triangle supérieur, sans index O(p²)
         corr_matrix = self.result.values
         n = len(self.result.columns)
-        
-        # Création des indices pour les paires
-        i, j = np.triu_indices(n, k=1)
+        rows, cols = [], []
+        for start in range(0, n, DEFAULT_TILE_SIZE):
+            block = np.abs(corr_matrix[start:start + DEFAULT_TILE_SIZE]) >= threshold
+            r, c = np.nonzero(block)
+            upper = c > r + start
+            rows.append(r[upper] + start)
+            cols.append(c[upper])
+        i = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+        j = np.concatenate(cols) if cols else np.empty(0, dtype=np.intp)
         corr_values = corr_matrix[i, j]
+        order = np.argsort(-np.abs(corr_values), kind='stable')
         
-        # Filtrage des paires selon le seuil
-        mask = np.abs(corr_values) >= threshold
-        pairs = []
+        columns = self.result.columns
+        return list(zip(columns[i[order]], columns[j[order]], corr_values[order]))
+    
+    def find_correlated_pairs(self, data, threshold=None, top_k=None, method="pearson",
+                              tile_size=None, **kwargs):
+        """
+        Recherche les paires corrélées sans construire la matrice complète.
         
-        for idx in np.where(mask)[0]:
-            var1 = self.result.columns[i[idx]]
-            var2 = self.result.columns[j[idx]]
-            corr = corr_values[idx]
-            pairs.append((var1, var2, corr))
+        Les tuiles sont calculées par les workers, qui ne renvoient que les
+        coefficients retenus : la mémoire est bornée par la taille des
+        tuiles et le nombre de paires trouvées.
         
-        return sorted(pairs, key=lambda x: abs(x[2]), reverse=True) 
\ No newline at end of file
+        Args:
+            data: Données d'entrée (pandas DataFrame sans valeurs manquantes)
+            threshold: Seuil sur |r| (0.9 par défaut sans top_k ; avec top_k,
+                filtre optionnel des voisins)
+            top_k: Si fourni, les top_k variables les plus corrélées à chacune
+            method: 'pearson' ou 'spearman'
+            tile_size: Largeur des tuiles de colonnes
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            DataFrame des paires (Variable 1, Variable 2, Corrélation), ou des
+            voisins (Variable, Voisin, Corrélation, Rang) avec top_k
+        """
+        self.validate_data(data)
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Les données doivent être un pandas DataFrame")
+        if method not in ("pearson", "spearman"):
+            raise ValueError("La recherche par tuiles supporte 'pearson' et 'spearman'")
+        values = data.to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            raise ValueError("La recherche par tuiles requiert des données sans valeurs manquantes")
+        if method == "spearman":
+            values = rank_columns(values)
+        
+        options = dict(
+            tile_size=self._tile_size(values.shape[1], tile_size),
+            map_func=self.parallel_processor.parallel_map,
+            wave_size=max(1, self.parallel_processor.n_jobs) * 2,
+            columns=data.columns,
+        )
+        if top_k is None:
+            return correlated_pairs(values, 0.9 if threshold is None else threshold, **options)
+        neighbours = top_correlations(values, top_k, **options)
+        if threshold is not None:
+            neighbours = neighbours[neighbours['Corrélation'].abs() >= threshold]
+        return neighbours.reset_index(drop=True) 
\ No newline at end of file
@@ -0,0 +1,166 @@
+'''
+=====================================================================
+File : engine.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Moteur de corrélation par tuiles pour CorrelationModule.
+
+La matrice est standardisée une seule fois (colonnes centrées et
+normées), puis chaque tuile (i, j) du triangle supérieur est obtenue par
+un produit matriciel Z_i.T @ Z_j délégué à BLAS. Les tuiles sont
+réparties entre les workers et écrites, ainsi que leur transposée, dans
+une matrice de sortie préallouée.
+
+tags : module, stats, correlation
+=====================================================================
+'''
+
+from functools import partial
+from itertools import islice
+
+import numpy as np
+
+DEFAULT_TILE_SIZE = 512
+
+
+def standardize(values):
+    """
+    Centre et norme les colonnes : Z.T @ Z est alors la matrice de corrélation.
+
+    Args:
+        values: Matrice (n, p)
+
+    Returns:
+        Matrice standardisée (n, p) en float64 ; les colonnes constantes
+        valent NaN
+    """
+    z = np.array(values, dtype=np.float64, order='F')
+    z -= z.mean(axis=0)
+    norms = np.sqrt(np.einsum('ij,ij->j', z, z))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z /= np.where(norms > 0, norms, np.nan)
+    return z
+
+
+def pairwise_counts(values):
+    """
+    Effectifs par paire de colonnes (lignes où les deux valeurs sont présentes).
+
+    Args:
+        values: Matrice (n, p), NaN pour les valeurs manquantes
+
+    Returns:
+        Matrice (p, p) des effectifs, obtenue par le produit M.T @ M du masque
+    """
+    mask = (~np.isnan(np.asarray(values, dtype=np.float64))).astype(np.float64)
+    return mask.T @ mask
+
+
+def tile_bounds(p, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Découpe p colonnes en tuiles contiguës.
+
+    Args:
+        p: Nombre de colonnes
+        tile_size: Largeur des tuiles
+
+    Returns:
+        Liste de couples (début, fin)
+    """
+    tile_size = max(1, int(tile_size))
+    return [(start, min(start + tile_size, p)) for start in range(0, p, tile_size)]
+
+
+def tile_pairs(bounds):
+    """
+    Tuiles du triangle supérieur (diagonale comprise).
+
+    Args:
+        bounds: Bornes produites par tile_bounds
+
+    Returns:
+        Liste de tâches (i0, i1, j0, j1)
+    """
+    return [
+        bounds[a] + bounds[b]
+        for a in range(len(bounds)) for b in range(a, len(bounds))
+    ]
+
+
+def correlation_tile(z, task):
+    """
+    Calcule une tuile de corrélation Z_i.T @ Z_j.
+
+    Args:
+        z: Matrice standardisée
+        task: Tâche (i0, i1, j0, j1)
+
+    Returns:
+        Tuple (tâche, bloc)
+    """
+    i0, i1, j0, j1 = task
+    return task, z[:, i0:i1].T @ z[:, j0:j1]
+
+
+def in_waves(tasks, size):
+    """Regroupe des tâches en vagues de taille bornée."""
+    tasks = iter(tasks)
+    while True:
+        wave = list(islice(tasks, size))
+        if not wave:
+            return
+        yield wave
+
+
+def assemble(out, task, block):
+    """Écrit une tuile et sa transposée dans la matrice de sortie."""
+    i0, i1, j0, j1 = task
+    out[i0:i1, j0:j1] = block
+    if i0 != j0:
+        out[j0:j1, i0:i1] = block.T
+
+
+def finish(out):
+    """Borne les coefficients dans [-1, 1] et fixe la diagonale à 1."""
+    np.clip(out, -1.0, 1.0, out=out)
+    diagonal = np.einsum('ii->i', out)
+    diagonal[np.isfinite(diagonal)] = 1.0
+    return out
+
+
+def tiled_correlation(values, tile_size=DEFAULT_TILE_SIZE, map_func=map, wave_size=8,
+                      out=None, standardized=False):
+    """
+    Matrice de corrélation de Pearson par tuiles.
+
+    Args:
+        values: Matrice (n, p) sans valeurs manquantes
+        tile_size: Largeur des tuiles
+        map_func: Fonction de répartition des tuiles (map, ou
+            ParallelProcessor.parallel_map)
+        wave_size: Nombre de tuiles soumises à la fois (borne la mémoire)
+        out: Matrice de sortie (p, p) préallouée
+        standardized: Si True, values est déjà standardisée
+
+    Returns:
+        Matrice de corrélation (p, p)
+    """
+    z = values if standardized else standardize(values)
+    p = z.shape[1]
+    if out is None:
+        out = np.empty((p, p))
+    tasks = tile_pairs(tile_bounds(p, tile_size))
+    compute = partial(correlation_tile, z)
+    for wave in in_waves(tasks, wave_size):
+        for task, block in map_func(compute, wave):
+            assemble(out, task, block)
+    return finish(out)
+
@@ -0,0 +1,192 @@
+'''
+=====================================================================
+File : lagged.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Corrélations croisées décalées (lags -L..L) de toutes les paires de
+colonnes, par transformée de Fourier.
+
+Les spectres (rfft) de toutes les colonnes sont calculés une fois ; les
+produits croisés de chaque décalage s'obtiennent par irfft du produit
+conj(F_i) * F_j, par tuiles de paires réparties entre les workers. Les
+sommes et sommes des carrés des segments qui se recouvrent viennent de
+sommes cumulées : chaque coefficient est la corrélation de Pearson
+exacte de x[t] et y[t + k] sur le recouvrement.
+
+tags : module, stats, correlation, temporelle
+=====================================================================
+'''
+
+from functools import partial
+
+import numpy as np
+from scipy import fft
+
+from .engine import in_waves, tile_bounds, tile_pairs
+
+# Mémoire cible d'une tuile de spectres croisés (octets)
+TILE_BUDGET = 64 * 2 ** 20
+
+
+def lag_tile_size(n_rows, max_lag, budget=TILE_BUDGET):
+    """
+    Largeur des tuiles de colonnes bornant la mémoire des spectres croisés.
+
+    Args:
+        n_rows: Nombre d'observations
+        max_lag: Décalage maximal
+        budget: Mémoire cible d'une tuile (octets)
+
+    Returns:
+        Largeur des tuiles
+    """
+    n_fft = fft.next_fast_len(n_rows + max_lag, real=True)
+    # Produit complexe (n_fft / 2 + 1) et sa transformée inverse réelle
+    per_pair = 16 * (n_fft // 2 + 1) + 8 * n_fft
+    return max(1, int(np.sqrt(budget / per_pair)))
+
+
+def _segment_sums(values, max_lag):
+    """
+    Sommes des segments qui se recouvrent pour chaque décalage.
+
+    Pour le décalage k, x est lu sur x[0:n-k] (k >= 0) ou x[-k:n] (k < 0),
+    et y sur y[k:n] ou y[0:n+k].
+
+    Returns:
+        Tuple (sommes de x, sommes de x², sommes de y, sommes de y²),
+        matrices (p, 2L + 1)
+    """
+    n = values.shape[0]
+    lags = np.arange(-max_lag, max_lag + 1)
+    length = n - np.abs(lags)
+    positive = lags >= 0
+
+    def head_tail(column_values):
+        cumulative = np.zeros((n + 1, column_values.shape[1]))
+        np.cumsum(column_values, axis=0, out=cumulative[1:])
+        head = cumulative[length]
+        tail = cumulative[n] - cumulative[n - length]
+        return head.T, tail.T
+
+    head, tail = head_tail(values)
+    head_sq, tail_sq = head_tail(values * values)
+    x_sum = np.where(positive, head, tail)
+    x_sq = np.where(positive, head_sq, tail_sq)
+    y_sum = np.where(positive, tail, head)
+    y_sq = np.where(positive, tail_sq, head_sq)
+    return x_sum, x_sq, y_sum, y_sq
+
+
+def lagged_tile(spectra, sums, n_rows, max_lag, n_fft, task):
+    """
+    Profils de corrélation décalée d'une tuile de paires.
+
+    Args:
+        spectra: Spectres rfft des colonnes (n_fft / 2 + 1, p)
+        sums: Sommes des segments (voir _segment_sums)
+        n_rows: Nombre d'observations
+        max_lag: Décalage maximal
+        n_fft: Longueur de la transformée utilisée pour spectra (peut être
+            impaire : elle ne se déduit pas du nombre de fréquences)
+        task: Tâche (i0, i1, j0, j1)
+
+    Returns:
+        Tuple (tâche, bloc (2L + 1, i1 - i0, j1 - j0))
+    """
+    i0, i1, j0, j1 = task
+    lags = np.arange(-max_lag, max_lag + 1)
+    cross = np.conj(spectra[:, i0:i1, None]) * spectra[:, None, j0:j1]
+    products = fft.irfft(cross, n=n_fft, axis=0)[lags % n_fft]
+
+    x_sum, x_sq, y_sum, y_sq = sums
+    sx = x_sum[i0:i1].T[:, :, None]
+    sxx = x_sq[i0:i1].T[:, :, None]
+    sy = y_sum[j0:j1].T[:, None, :]
+    syy = y_sq[j0:j1].T[:, None, :]
+    length = (n_rows - np.abs(lags)).astype(np.float64)[:, None, None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = products - sx * sy / length
+        var_x = sxx - sx * sx / length
+        var_y = syy - sy * sy / length
+        valid = (var_x > 0) & (var_y > 0)
+        block = np.where(valid, cov / np.sqrt(var_x * var_y), np.nan)
+    return task, np.clip(block, -1.0, 1.0)
+
+
+def lagged_correlation(values, max_lag, tile_size=None, map_func=map, wave_size=8):
+    """
+    Profils de corrélation croisée de toutes les paires pour les lags -L..L.
+
+    profile[i, j, k] est la corrélation de x_i[t] et x_j[t + lag_k] ; on a
+    donc profile[j, i] = profile[i, j, ::-1].
+
+    Args:
+        values: Matrice (n, p) sans valeurs manquantes, lignes ordonnées
+        max_lag: Décalage maximal L
+        tile_size: Largeur des tuiles de colonnes (bornée par la mémoire
+            par défaut)
+        map_func: Fonction de répartition des tuiles (map, ou
+            ParallelProcessor.parallel_map)
+        wave_size: Nombre de tuiles soumises à la fois
+
+    Returns:
+        Tuple (lags (2L + 1,), profils (p, p, 2L + 1))
+    """
+    x = np.array(values, dtype=np.float64)
+    if x.ndim == 1:
+        x = x.reshape(-1, 1)
+    n, p = x.shape
+    max_lag = int(max_lag)
+    if max_lag < 0 or max_lag > n - 2:
+        raise ValueError("max_lag doit être compris entre 0 et n - 2")
+    if np.isnan(x).any():
+        raise ValueError("Les corrélations décalées requièrent des données sans valeurs manquantes")
+    x -= x.mean(axis=0)
+
+    n_fft = fft.next_fast_len(n + max_lag, real=True)
+    spectra = fft.rfft(x, n=n_fft, axis=0)
+    sums = _segment_sums(x, max_lag)
+    if tile_size is None:
+        tile_size = lag_tile_size(n, max_lag)
+
+    lags = np.arange(-max_lag, max_lag + 1)
+    profile = np.empty((p, p, len(lags)))
+    compute = partial(lagged_tile, spectra, sums, n, max_lag, n_fft)
+    for wave in in_waves(tile_pairs(tile_bounds(p, tile_size)), wave_size):
+        for (i0, i1, j0, j1), block in map_func(compute, wave):
+            profile[i0:i1, j0:j1] = block.transpose(1, 2, 0)
+            if i0 != j0:
+                profile[j0:j1, i0:i1] = block.transpose(2, 1, 0)[:, :, ::-1]
+    return lags, profile
+
+
+def peak_lags(lags, profile):
+    """
+    Décalage et corrélation de plus forte valeur absolue pour chaque paire.
+
+    À valeur absolue égale, le plus petit |lag| est retenu.
+
+    Args:
+        lags: Décalages (2L + 1,)
+        profile: Profils (p, p, 2L + 1)
+
+    Returns:
+        Tuple (lags des pics (p, p), corrélations des pics (p, p)) ; NaN
+        pour les paires sans corrélation définie
+    """
+    order = np.argsort(np.abs(lags), kind='stable')
+    strength = np.abs(profile[:, :, order])
+    strength[np.isnan(strength)] = -np.inf
+    best = order[np.argmax(strength, axis=2)]
+    peak = np.take_along_axis(profile, best[:, :, None], axis=2)[:, :, 0]
+    peak_lag = np.where(np.isnan(peak), np.nan, lags[best])
+    return peak_lag, peak
@@ -0,0 +1,114 @@
+'''
+=====================================================================
+File : masked.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Corrélation de Pearson sur observations complètes par paire, sans
+boucle sur les paires.
+
+Avec X (valeurs manquantes remplacées par 0) et M (masque de présence),
+les effectifs, sommes, sommes des carrés et produits croisés de chaque
+paire s'obtiennent par produits matriciels : M.T @ M, X.T @ M,
+(X*X).T @ M et X.T @ X. Les tuiles sont réparties entre les workers
+comme dans le moteur dense.
+
+tags : module, stats, correlation, valeurs manquantes
+=====================================================================
+'''
+
+from functools import partial
+
+import numpy as np
+
+from .engine import DEFAULT_TILE_SIZE, assemble, finish, in_waves, tile_bounds, tile_pairs
+
+
+def prepare(values):
+    """
+    Valeurs centrées (0 pour les manquantes) et masque de présence.
+
+    Le centrage sur la moyenne des valeurs présentes limite les pertes de
+    précision des formules par sommes.
+
+    Args:
+        values: Matrice (n, p), NaN pour les valeurs manquantes
+
+    Returns:
+        Tuple (x, masque) de matrices float64 (n, p)
+    """
+    x = np.array(values, dtype=np.float64, order='F')
+    present = ~np.isnan(x)
+    counts = present.sum(axis=0)
+    x[~present] = 0.0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, x.sum(axis=0) / counts, 0.0)
+    x -= means
+    x[~present] = 0.0
+    return x, np.asfortranarray(present, dtype=np.float64)
+
+
+def masked_tile(x, mask, min_periods, task):
+    """
+    Tuile de corrélation sur observations complètes par paire.
+
+    Args:
+        x: Valeurs préparées (0 pour les manquantes)
+        mask: Masque de présence
+        min_periods: Effectif minimal d'une paire
+        task: Tâche (i0, i1, j0, j1)
+
+    Returns:
+        Tuple (tâche, corrélations, effectifs)
+    """
+    i0, i1, j0, j1 = task
+    x_i, x_j = x[:, i0:i1], x[:, j0:j1]
+    m_i, m_j = mask[:, i0:i1], mask[:, j0:j1]
+    n = m_i.T @ m_j
+    sum_i = x_i.T @ m_j
+    sum_j = m_i.T @ x_j
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_i = (x_i * x_i).T @ m_j - sum_i * sum_i / n
+        var_j = m_i.T @ (x_j * x_j) - sum_j * sum_j / n
+        cov = x_i.T @ x_j - sum_i * sum_j / n
+        valid = (n >= max(min_periods, 2)) & (var_i > 0) & (var_j > 0)
+        block = np.where(valid, cov / np.sqrt(var_i * var_j), np.nan)
+    return task, block, n
+
+
+def masked_correlation(values, tile_size=DEFAULT_TILE_SIZE, map_func=map, wave_size=8,
+                       min_periods=1):
+    """
+    Matrice de corrélation de Pearson sur observations complètes par paire.
+
+    Équivaut à DataFrame.corr(min_periods=...) mais par produits matriciels
+    répartis en tuiles.
+
+    Args:
+        values: Matrice (n, p), NaN pour les valeurs manquantes
+        tile_size: Largeur des tuiles
+        map_func: Fonction de répartition des tuiles (map, ou
+            ParallelProcessor.parallel_map)
+        wave_size: Nombre de tuiles soumises à la fois
+        min_periods: Effectif minimal d'une paire (NaN en dessous)
+
+    Returns:
+        Tuple (corrélations (p, p), effectifs par paire (p, p))
+    """
+    x, mask = prepare(values)
+    p = x.shape[1]
+    corr = np.empty((p, p))
+    counts = np.empty((p, p))
+    compute = partial(masked_tile, x, mask, min_periods)
+    for wave in in_waves(tile_pairs(tile_bounds(p, tile_size)), wave_size):
+        for task, block, n in map_func(compute, wave):
+            assemble(corr, task, block)
+            assemble(counts, task, n)
+    return finish(corr), counts
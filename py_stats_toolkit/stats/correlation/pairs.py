@@ -0,0 +1,176 @@
+'''
+=====================================================================
+File : pairs.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Recherche de paires corrélées sans matrice de corrélation complète.
+
+Les tuiles Z_i.T @ Z_j sont calculées une à une par les workers, qui ne
+renvoient que les coefficients retenus : au-dessus d'un seuil (format
+COO) ou les k plus forts par variable. La mémoire est bornée par la
+taille d'une tuile et le nombre de paires retenues.
+
+tags : module, stats, correlation
+=====================================================================
+'''
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from .engine import DEFAULT_TILE_SIZE, in_waves, standardize, tile_bounds, tile_pairs
+
+
+def threshold_tile(z, threshold, task):
+    """
+    Coefficients d'une tuile dont la valeur absolue atteint le seuil.
+
+    Args:
+        z: Matrice standardisée
+        threshold: Seuil sur |r|
+        task: Tâche (i0, i1, j0, j1)
+
+    Returns:
+        Tuple (lignes, colonnes, coefficients) en indices globaux, i < j
+    """
+    i0, i1, j0, j1 = task
+    block = z[:, i0:i1].T @ z[:, j0:j1]
+    rows, cols = np.nonzero(np.abs(block) >= threshold)
+    values = block[rows, cols]
+    rows, cols = rows + i0, cols + j0
+    keep = rows < cols
+    return rows[keep], cols[keep], np.clip(values[keep], -1.0, 1.0)
+
+
+def _row_top_k(block, k, offset, exclude_diagonal):
+    """k plus forts |r| de chaque ligne d'un bloc (indices de colonnes globaux)."""
+    strength = np.abs(block)
+    strength[np.isnan(strength)] = -np.inf
+    if exclude_diagonal:
+        np.fill_diagonal(strength, -np.inf)
+    k = min(k, block.shape[1])
+    index = np.argpartition(-strength, k - 1, axis=1)[:, :k]
+    values = np.take_along_axis(block, index, axis=1)
+    # Diagonale et colonnes constantes ne sont jamais des voisins
+    values[np.isneginf(np.take_along_axis(strength, index, axis=1))] = np.nan
+    return index + offset, values
+
+
+def top_k_tile(z, k, task):
+    """
+    Candidats top-k d'une tuile, pour les variables des lignes et des colonnes.
+
+    Args:
+        z: Matrice standardisée
+        k: Nombre de voisins par variable
+        task: Tâche (i0, i1, j0, j1)
+
+    Returns:
+        Liste de tuples (variables, voisins (m, k'), coefficients (m, k'))
+    """
+    i0, i1, j0, j1 = task
+    block = z[:, i0:i1].T @ z[:, j0:j1]
+    diagonal = i0 == j0
+    neighbours, values = _row_top_k(block, k, j0, diagonal)
+    candidates = [(np.arange(i0, i1), neighbours, values)]
+    if not diagonal:
+        neighbours, values = _row_top_k(block.T, k, i0, False)
+        candidates.append((np.arange(j0, j1), neighbours, values))
+    return candidates
+
+
+def _merge_top_k(best_index, best_value, rows, neighbours, values):
+    """Fusionne des candidats dans les k meilleurs voisins courants."""
+    k = best_index.shape[1]
+    index = np.concatenate([best_index[rows], neighbours], axis=1)
+    value = np.concatenate([best_value[rows], values], axis=1)
+    strength = np.where(np.isnan(value), -np.inf, np.abs(value))
+    keep = np.argpartition(-strength, k - 1, axis=1)[:, :k]
+    best_index[rows] = np.take_along_axis(index, keep, axis=1)
+    best_value[rows] = np.take_along_axis(value, keep, axis=1)
+
+
+def correlated_pairs(values, threshold=0.9, tile_size=DEFAULT_TILE_SIZE, map_func=map,
+                     wave_size=8, columns=None):
+    """
+    Paires (i < j) telles que |r_ij| >= seuil, par tuiles.
+
+    Args:
+        values: Matrice (n, p) sans valeurs manquantes
+        threshold: Seuil sur la valeur absolue de la corrélation
+        tile_size: Largeur des tuiles
+        map_func: Fonction de répartition des tuiles
+        wave_size: Nombre de tuiles soumises à la fois
+        columns: Noms des variables
+
+    Returns:
+        DataFrame (Variable 1, Variable 2, Corrélation) trié par |r| décroissant
+    """
+    z = standardize(values)
+    columns = pd.RangeIndex(z.shape[1]) if columns is None else pd.Index(columns)
+    compute = partial(threshold_tile, z, threshold)
+    rows, cols, coefficients = [], [], []
+    for wave in in_waves(tile_pairs(tile_bounds(z.shape[1], tile_size)), wave_size):
+        for r, c, v in map_func(compute, wave):
+            rows.append(r)
+            cols.append(c)
+            coefficients.append(v)
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+    cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.intp)
+    coefficients = np.concatenate(coefficients) if coefficients else np.empty(0)
+    order = np.argsort(-np.abs(coefficients), kind='stable')
+    return pd.DataFrame({
+        'Variable 1': columns[rows[order]],
+        'Variable 2': columns[cols[order]],
+        'Corrélation': coefficients[order],
+    })
+
+
+def top_correlations(values, k=10, tile_size=DEFAULT_TILE_SIZE, map_func=map,
+                     wave_size=8, columns=None):
+    """
+    Les k variables les plus corrélées (en valeur absolue) à chaque variable.
+
+    Args:
+        values: Matrice (n, p) sans valeurs manquantes
+        k: Nombre de voisins par variable
+        tile_size: Largeur des tuiles
+        map_func: Fonction de répartition des tuiles
+        wave_size: Nombre de tuiles soumises à la fois
+        columns: Noms des variables
+
+    Returns:
+        DataFrame (Variable, Voisin, Corrélation, Rang), Rang 1 pour le plus corrélé
+    """
+    z = standardize(values)
+    p = z.shape[1]
+    columns = pd.RangeIndex(p) if columns is None else pd.Index(columns)
+    k = max(1, min(int(k), p - 1))
+    best_index = np.zeros((p, k), dtype=np.intp)
+    best_value = np.full((p, k), np.nan)
+    compute = partial(top_k_tile, z, k)
+    for wave in in_waves(tile_pairs(tile_bounds(p, tile_size)), wave_size):
+        for candidates in map_func(compute, wave):
+            for rows, neighbours, coefficients in candidates:
+                _merge_top_k(best_index, best_value, rows, neighbours, coefficients)
+    strength = np.where(np.isnan(best_value), -np.inf, np.abs(best_value))
+    order = np.argsort(-strength, axis=1, kind='stable')
+    best_index = np.take_along_axis(best_index, order, axis=1)
+    best_value = np.take_along_axis(best_value, order, axis=1)
+    found = ~np.isnan(best_value)
+    variables = np.repeat(np.arange(p), k).reshape(p, k)
+    return pd.DataFrame({
+        'Variable': columns[variables[found]],
+        'Voisin': columns[best_index[found]],
+        'Corrélation': np.clip(best_value[found], -1.0, 1.0),
+        'Rang': np.tile(np.arange(1, k + 1), p).reshape(p, k)[found],
+    })
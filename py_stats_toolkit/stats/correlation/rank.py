@@ -0,0 +1,216 @@
+'''
+=====================================================================
+File : rank.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Corrélations de rang pour CorrelationModule.
+
+Spearman : chaque colonne est transformée en rangs une seule fois
+(rangs moyens pour les ex-aequo), puis le moteur de Pearson par tuiles
+est réutilisé. Kendall (tau-b) : algorithme de Knight en O(n log n) par
+paire sur des rangs denses calculés une fois, sans calcul de p-value ;
+les valeurs manquantes sont écartées paire par paire et les paires sont
+réparties entre les workers.
+
+tags : module, stats, correlation, rang
+=====================================================================
+'''
+
+from functools import partial
+
+import numpy as np
+from scipy import stats
+
+from .engine import in_waves, tiled_correlation
+
+# Taille des blocs dont les paires discordantes sont comptées directement
+DISCORDANCE_BLOCK = 32
+
+
+def rank_columns(values, method='average'):
+    """
+    Rangs de chaque colonne, calculés en une passe vectorisée.
+
+    Args:
+        values: Matrice (n, p)
+        method: Traitement des ex-aequo (voir scipy.stats.rankdata)
+
+    Returns:
+        Matrice des rangs (n, p)
+    """
+    return stats.rankdata(np.asarray(values, dtype=np.float64), method=method, axis=0)
+
+
+def spearman_correlation(values, **engine_options):
+    """
+    Matrice de corrélation de Spearman (Pearson sur les rangs).
+
+    Args:
+        values: Matrice (n, p) sans valeurs manquantes
+        **engine_options: Options de tiled_correlation (tile_size, map_func...)
+
+    Returns:
+        Matrice de corrélation (p, p)
+    """
+    return tiled_correlation(rank_columns(values), **engine_options)
+
+
+def _tied_pairs(sorted_values, *others):
+    """Nombre de paires ex-aequo sur toutes les colonnes données (valeurs triées)."""
+    n = len(sorted_values)
+    change = np.empty(n, dtype=bool)
+    change[0] = True
+    change[1:] = sorted_values[1:] != sorted_values[:-1]
+    for values in others:
+        change[1:] |= values[1:] != values[:-1]
+    sizes = np.diff(np.append(np.flatnonzero(change), n))
+    return int((sizes * (sizes - 1) // 2).sum())
+
+
+def _discordant_pairs(values):
+    """
+    Nombre de paires (i < j) telles que values[i] > values[j], par tri fusion.
+
+    Les paires internes aux blocs de DISCORDANCE_BLOCK valeurs sont
+    comptées directement, puis les blocs triés sont fusionnés deux à deux
+    (tri stable de chaque niveau) : pour chaque valeur du bloc de droite,
+    sa position après fusion donne le nombre de valeurs du bloc de gauche
+    qui lui sont inférieures ou égales. O(n log n) au total.
+
+    Args:
+        values: Entiers (rangs), dans l'ordre des paires
+
+    Returns:
+        Nombre de paires discordantes
+    """
+    y = np.array(values, dtype=np.int64)
+    n = len(y)
+    size = DISCORDANCE_BLOCK
+    total = 0
+    n_full = n // size * size
+    if n_full:
+        blocks = y[:n_full].reshape(-1, size)
+        upper = np.triu(np.ones((size, size), dtype=bool), 1)
+        total += int(((blocks[:, :, None] > blocks[:, None, :]) & upper).sum())
+        blocks.sort(axis=1)
+    tail = y[n_full:]
+    if len(tail) > 1:
+        total += int(np.triu(tail[:, None] > tail[None, :], 1).sum())
+        tail.sort()
+    span = int(y.max(initial=0)) + 1
+    position = np.arange(n)
+    width = size
+    while width < n:
+        start = position // (2 * width) * (2 * width)
+        order = np.argsort(start * span + y, kind='stable')
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = position
+        offset = position - start
+        right = offset >= width
+        n_left = np.minimum(width, n - start[right])
+        # Valeurs de gauche placées avant chaque valeur de droite (<= elle)
+        before = rank[right] - start[right] - (offset[right] - width)
+        total += int((n_left - before).sum())
+        y = y[order]
+        width *= 2
+    return total
+
+
+def kendall_tau_b(x, y):
+    """
+    Tau-b de Kendall de deux vecteurs de rangs entiers (algorithme de Knight).
+
+    Les paires discordantes sont comptées par tri fusion en O(n log n) ;
+    aucune p-value n'est calculée.
+
+    Args:
+        x, y: Rangs entiers (intp), sans valeurs manquantes
+
+    Returns:
+        Tau-b (NaN si l'un des vecteurs est constant ou trop court)
+    """
+    n = len(x)
+    if n < 2:
+        return np.nan
+    # Tri lexicographique (x, y) par une seule clé entière
+    order = np.argsort(x * (int(y.max()) + 1) + y)
+    xs, ys = x[order], y[order]
+    total = n * (n - 1) // 2
+    x_ties = _tied_pairs(xs)
+    joint_ties = _tied_pairs(xs, ys)
+    y_ties = _tied_pairs(np.sort(y))
+    if x_ties == total or y_ties == total:
+        return np.nan
+    discordant = _discordant_pairs(ys)
+    score = total - x_ties - y_ties + joint_ties - 2 * discordant
+    return score / (np.sqrt(float(total - x_ties)) * np.sqrt(float(total - y_ties)))
+
+
+def kendall_pair(ranks, pair, min_periods=1):
+    """
+    Tau-b de Kendall d'une paire de colonnes sur leurs observations complètes.
+
+    Args:
+        ranks: Rangs denses des colonnes (float, NaN pour les manquants)
+        pair: Couple d'indices (i, j)
+        min_periods: Effectif minimal de la paire
+
+    Returns:
+        Tuple (paire, tau)
+    """
+    i, j = pair
+    x, y = ranks[:, i], ranks[:, j]
+    present = ~(np.isnan(x) | np.isnan(y))
+    if not present.all():
+        x, y = x[present], y[present]
+    if len(x) < max(min_periods, 2):
+        return pair, np.nan
+    return pair, kendall_tau_b(x.astype(np.intp), y.astype(np.intp))
+
+
+def kendall_correlation(values, map_func=map, wave_size=8, min_periods=1):
+    """
+    Matrice de corrélation de Kendall (tau-b).
+
+    Avec des valeurs manquantes, chaque paire est calculée sur ses
+    observations complètes (comme pandas), toujours en O(n log n).
+
+    Args:
+        values: Matrice (n, p), valeurs manquantes autorisées
+        map_func: Fonction de répartition des paires (map, ou
+            ParallelProcessor.parallel_map)
+        wave_size: Nombre de paires soumises à la fois
+        min_periods: Effectif minimal d'une paire
+
+    Returns:
+        Matrice de corrélation (p, p)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    # Rangs denses hors valeurs manquantes : l'ordre est conservé sur
+    # tout sous-ensemble d'observations
+    missing = np.isnan(values)
+    ranks = stats.rankdata(np.where(missing, np.inf, values), method='dense', axis=0).astype(np.float64)
+    ranks[missing] = np.nan
+    p = ranks.shape[1]
+    out = np.full((p, p), np.nan)
+    # Diagonale à 1, ou NaN pour une colonne d'effectif < min_periods (comme pandas)
+    np.fill_diagonal(out, np.where((~np.isnan(values)).sum(axis=0) >= max(min_periods, 1), 1.0, np.nan))
+    # Colonnes constantes : tau indéfini (diagonale à 1, comme pandas)
+    constant = np.nanmax(ranks, axis=0, initial=0) <= 1
+    pairs = [
+        (i, j) for i in range(p) for j in range(i + 1, p)
+        if not (constant[i] or constant[j])
+    ]
+    compute = partial(kendall_pair, ranks, min_periods=min_periods)
+    for wave in in_waves(pairs, wave_size):
+        for (i, j), tau in map_func(compute, wave):
+            out[i, j] = out[j, i] = tau
+    return out
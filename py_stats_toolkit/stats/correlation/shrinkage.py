@@ -0,0 +1,189 @@
+'''
+=====================================================================
+File : shrinkage.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Estimateurs à rétrécissement (Ledoit-Wolf, OAS) de la covariance et de
+la corrélation, adaptés au cas p >> n.
+
+L'intensité ne dépend que de la trace et de la norme de Frobenius de la
+covariance empirique ; lorsque n < p, cette norme est calculée sur la
+matrice de Gram X @ X.T (n, n) en O(n² p) au lieu de O(n p²). La matrice
+rétrécie peut être rendue sous forme factorisée rang faible plus
+diagonale : facteur X.T (p, n) si n < p, sans jamais former la matrice
+(p, p) ; sinon facteur (p, p) issu de la décomposition propre de X.T @ X,
+sans jamais former de matrice (n, n).
+
+tags : module, stats, correlation, covariance, shrinkage
+=====================================================================
+'''
+
+import numpy as np
+from scipy import linalg
+
+METHODS = ('ledoit_wolf', 'oas')
+
+
+class LowRankPlusDiagonal:
+    """
+    Matrice symétrique D + U @ U.T (D diagonale), sans forme (p, p).
+
+    Attributes:
+        factor: Facteur U (p, k)
+        diagonal: Diagonale D (p,)
+    """
+
+    def __init__(self, factor, diagonal):
+        self.factor = np.asarray(factor, dtype=np.float64)
+        self.diagonal = np.asarray(diagonal, dtype=np.float64)
+
+    @property
+    def shape(self):
+        p = len(self.diagonal)
+        return (p, p)
+
+    def matvec(self, vector):
+        """
+        Produit matrice-vecteur (ou matrice-matrice) en O(p k).
+
+        Args:
+            vector: Vecteur (p,) ou matrice (p, m)
+
+        Returns:
+            Produit de même forme
+        """
+        vector = np.asarray(vector, dtype=np.float64)
+        scale = self.diagonal if vector.ndim == 1 else self.diagonal[:, None]
+        return scale * vector + self.factor @ (self.factor.T @ vector)
+
+    def __matmul__(self, other):
+        return self.matvec(other)
+
+    def diag(self):
+        """Diagonale de la matrice."""
+        return self.diagonal + np.einsum('ij,ij->i', self.factor, self.factor)
+
+    def solve(self, rhs):
+        """
+        Résout (D + U U.T) x = rhs par la formule de Woodbury, en O(p k²).
+
+        Args:
+            rhs: Second membre (p,) ou (p, m)
+
+        Returns:
+            Solution de même forme
+        """
+        if np.any(self.diagonal <= 0):
+            raise ValueError("La diagonale doit être strictement positive")
+        rhs = np.asarray(rhs, dtype=np.float64)
+        inverse = 1.0 / (self.diagonal if rhs.ndim == 1 else self.diagonal[:, None])
+        scaled = self.factor / self.diagonal[:, None]
+        capacitance = np.eye(self.factor.shape[1]) + self.factor.T @ scaled
+        correction = scaled @ linalg.solve(capacitance, self.factor.T @ (inverse * rhs), assume_a='pos')
+        return inverse * rhs - correction
+
+    def to_dense(self):
+        """Matrice (p, p) complète."""
+        dense = self.factor @ self.factor.T
+        dense.flat[::len(self.diagonal) + 1] += self.diagonal
+        return dense
+
+
+def _prepare(values, standardized):
+    """Colonnes centrées, et réduites (écart-type à ddof=0) si standardized."""
+    x = np.array(values, dtype=np.float64)
+    if x.ndim != 2:
+        raise ValueError("Les données doivent être une matrice (n, p)")
+    if np.isnan(x).any():
+        raise ValueError("Le rétrécissement requiert des données sans valeurs manquantes")
+    x -= x.mean(axis=0)
+    if standardized:
+        scale = np.sqrt(np.einsum('ij,ij->j', x, x) / len(x))
+        if np.any(scale == 0):
+            raise ValueError("Corrélation indéfinie pour les colonnes constantes")
+        x /= scale
+    return x
+
+
+def shrinkage_intensity(x, frobenius, method='ledoit_wolf'):
+    """
+    Intensité de rétrécissement vers mu * I.
+
+    Args:
+        x: Données centrées (n, p)
+        frobenius: ||X.T @ X||_F², égale à ||X @ X.T||_F²
+        method: 'ledoit_wolf' ou 'oas'
+
+    Returns:
+        Tuple (intensité dans [0, 1], cible mu = trace(S) / p)
+    """
+    n, p = x.shape
+    row_norms = np.einsum('ij,ij->i', x, x)
+    trace = row_norms.sum() / n
+    mu = trace / p
+    # Somme des carrés des coefficients de S = X.T @ X / n
+    squares = frobenius / n ** 2
+    if method == 'oas':
+        alpha = squares / p ** 2
+        denominator = (n + 1) * (alpha - mu ** 2 / p)
+        return (1.0 if denominator == 0 else min((alpha + mu ** 2) / denominator, 1.0)), mu
+    if method != 'ledoit_wolf':
+        raise ValueError(f"Méthode {method} non supportée")
+    # sum((X²).T @ X²) = somme des normes de lignes au carré : O(n p)
+    beta = (np.dot(row_norms, row_norms) / n - squares) / (p * n)
+    delta = (squares - 2.0 * mu * trace + p * mu ** 2) / p
+    beta = min(beta, delta)
+    return (0.0 if beta == 0 else beta / delta), mu
+
+
+def shrunk_covariance(values, method='ledoit_wolf', standardized=False, factored=False):
+    """
+    Covariance (ou corrélation) rétrécie (1 - s) S + s mu I.
+
+    Args:
+        values: Matrice (n, p) sans valeurs manquantes
+        method: 'ledoit_wolf' ou 'oas'
+        standardized: Si True, estime la matrice de corrélation (colonnes
+            réduites, mu = 1)
+        factored: Si True, renvoie un LowRankPlusDiagonal de rang
+            min(n, p) au lieu de la matrice (p, p)
+
+    Returns:
+        Tuple (matrice (p, p) ou LowRankPlusDiagonal, intensité)
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode {method} non supportée")
+    x = _prepare(values, standardized)
+    n, p = x.shape
+    # Gram (n, n) seulement si n < p ; sinon produit croisé (p, p)
+    cross = None
+    if n < p:
+        gram = x @ x.T
+        frobenius = np.einsum('ij,ij->', gram, gram)
+    else:
+        cross = x.T @ x
+        frobenius = np.einsum('ij,ij->', cross, cross)
+    intensity, mu = shrinkage_intensity(x, frobenius, method)
+    if factored:
+        scale = np.sqrt((1.0 - intensity) / n)
+        if cross is None:
+            factor = x.T * scale
+        else:
+            # X.T @ X = V diag(w) V.T : facteur V sqrt(w), de rang au plus p
+            eigenvalues, vectors = linalg.eigh(cross)
+            keep = eigenvalues > eigenvalues[-1] * p * np.finfo(np.float64).eps
+            factor = vectors[:, keep] * (np.sqrt(eigenvalues[keep]) * scale)
+        return LowRankPlusDiagonal(factor, np.full(p, intensity * mu)), intensity
+    if cross is None:
+        cross = x.T @ x
+    cross *= (1.0 - intensity) / n
+    cross.flat[::p + 1] += intensity * mu
+    return cross, intensity
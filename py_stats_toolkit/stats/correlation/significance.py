@@ -0,0 +1,116 @@
+'''
+=====================================================================
+File : significance.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Significativité d'une matrice de corrélation, calculée matriciellement :
+statistiques de test, p-values, intervalles de confiance (transformée de
+Fisher) et q-values de Benjamini-Hochberg.
+
+L'effectif peut être un scalaire ou une matrice (effectif par paire
+lorsque les données comportent des valeurs manquantes).
+
+tags : module, stats, correlation, significativite
+=====================================================================
+'''
+
+import numpy as np
+from scipy import stats
+
+# Facteurs de variance de la transformée de Fisher (Fieller et al., 1957)
+FISHER_VARIANCE = {'pearson': 1.0, 'spearman': 1.06, 'kendall': 0.437}
+FISHER_OFFSET = {'pearson': 3, 'spearman': 3, 'kendall': 4}
+
+
+def benjamini_hochberg(p_values):
+    """
+    q-values de Benjamini-Hochberg (les NaN sont ignorés).
+
+    Args:
+        p_values: Tableau de p-values
+
+    Returns:
+        Tableau de q-values de même forme
+    """
+    p_values = np.asarray(p_values, dtype=np.float64)
+    q_values = np.full(p_values.shape, np.nan)
+    valid = np.flatnonzero(~np.isnan(p_values))
+    m = len(valid)
+    if m == 0:
+        return q_values
+    order = valid[np.argsort(p_values.flat[valid], kind='stable')]
+    ranked = p_values.flat[order] * m / np.arange(1, m + 1)
+    # Minimum cumulé depuis la plus grande p-value
+    q_values.flat[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q_values
+
+
+def correlation_significance(corr, n, method='pearson', alpha=0.05):
+    """
+    Tests de nullité des coefficients d'une matrice de corrélation.
+
+    Pearson et Spearman : t = r * sqrt((n - 2) / (1 - r²)), loi de Student à
+    n - 2 degrés de liberté. Kendall : approximation normale de tau.
+    Les q-values sont calculées sur le triangle supérieur (chaque paire
+    compte une fois) puis symétrisées.
+
+    Args:
+        corr: Matrice de corrélation (p, p)
+        n: Effectif (scalaire) ou matrice des effectifs par paire
+        method: 'pearson', 'spearman' ou 'kendall'
+        alpha: Risque de l'intervalle de confiance (1 - alpha)
+
+    Returns:
+        Dictionnaire de matrices : 'statistic', 'p_value', 'ci_lower',
+        'ci_upper', 'q_value', 'n'
+    """
+    if method not in FISHER_VARIANCE:
+        raise ValueError(f"Méthode {method} non supportée")
+    r = np.asarray(corr, dtype=np.float64)
+    p = r.shape[0]
+    n = np.broadcast_to(np.asarray(n, dtype=np.float64), r.shape)
+    off_diagonal = ~np.eye(p, dtype=bool)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'kendall':
+            statistic = 3.0 * r * np.sqrt(n * (n - 1.0)) / np.sqrt(2.0 * (2.0 * n + 5.0))
+            p_value = 2.0 * stats.norm.sf(np.abs(statistic))
+        else:
+            df = n - 2.0
+            statistic = r * np.sqrt(df / (1.0 - r * r))
+            p_value = 2.0 * stats.t.sf(np.abs(statistic), df)
+            # |r| = 1 : statistique infinie, p-value nulle
+            p_value = np.where(np.abs(r) >= 1.0, 0.0, p_value)
+        p_value = np.where(n > 2, p_value, np.nan)
+
+        z = np.arctanh(np.clip(r, -1.0, 1.0))
+        se = np.sqrt(FISHER_VARIANCE[method] / (n - FISHER_OFFSET[method]))
+        critical = stats.norm.ppf(1.0 - alpha / 2.0)
+        valid = n > FISHER_OFFSET[method]
+        ci_lower = np.where(valid, np.tanh(z - critical * se), np.nan)
+        ci_upper = np.where(valid, np.tanh(z + critical * se), np.nan)
+
+    statistic = np.where(off_diagonal, statistic, np.nan)
+    p_value = np.where(off_diagonal, p_value, np.nan)
+
+    upper = np.triu(off_diagonal)
+    q_upper = np.full(r.shape, np.nan)
+    q_upper[upper] = benjamini_hochberg(p_value[upper])
+    q_value = np.where(upper, q_upper, q_upper.T)
+
+    return {
+        'statistic': statistic,
+        'p_value': p_value,
+        'ci_lower': ci_lower,
+        'ci_upper': ci_upper,
+        'q_value': q_value,
+        'n': np.array(n),
+    }
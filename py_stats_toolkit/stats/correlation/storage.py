@@ -0,0 +1,330 @@
+'''
+=====================================================================
+File : storage.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Matrices de corrélation sur disque pour les très grands nombres de
+variables.
+
+Les tuiles du triangle supérieur sont écrites au fil du calcul dans un
+fichier .npy projeté en mémoire (float32 ou float64), sous forme carrée
+dont seul le triangle supérieur est rempli ('upper') ou sous forme
+compacte des p(p + 1) / 2 coefficients ('packed'). La matrice n'est
+jamais entièrement chargée : CorrelationStore lit à la demande les
+blocs de lignes et de colonnes demandés. Les noms des variables sont
+écrits à côté, dans un fichier <chemin>.columns.npy.
+
+tags : module, stats, correlation, stockage
+=====================================================================
+'''
+
+import os
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from .engine import (
+    DEFAULT_TILE_SIZE, correlation_tile, in_waves, standardize, tile_bounds, tile_pairs,
+)
+from .masked import masked_tile, prepare
+
+LAYOUTS = ('upper', 'packed')
+
+# À partir de ce nombre de variables, stockage compact par défaut
+PACKED_MIN_COLUMNS = 4096
+
+
+def resolve_layout(layout, p):
+    """
+    Stockage retenu : 'packed' par défaut pour p >= PACKED_MIN_COLUMNS.
+
+    Le stockage 'upper' est un fichier carré p x p dont seul le triangle
+    supérieur est écrit : il coûte deux fois la taille utile (le fichier
+    reste creux sur la plupart des systèmes de fichiers, mais sa taille
+    logique est p²) en échange d'un accès direct par ligne et colonne.
+    """
+    if layout is None:
+        return 'packed' if p >= PACKED_MIN_COLUMNS else 'upper'
+    return layout
+
+
+def _columns_path(path):
+    """Chemin du fichier des noms de variables associé à une matrice."""
+    return f"{path}.columns.npy"
+
+
+def _save_columns(path, columns):
+    """
+    Écrit les noms des variables dans un tableau typé (sans pickle).
+
+    Les noms ni numériques, ni dates, ni chaînes (tuples...) ne sont pas
+    écrits : ils doivent alors être redonnés à CorrelationStore.open.
+    """
+    target = _columns_path(path)
+    if os.path.exists(target):
+        os.remove(target)
+    if columns is None:
+        return
+    if pd.api.types.infer_dtype(columns, skipna=False) in ('string', 'empty'):
+        names = np.array(columns.tolist(), dtype=str)
+    else:
+        names = columns.to_numpy()
+        if names.dtype.kind not in 'biufmM':
+            return
+    np.save(target, names, allow_pickle=False)
+
+
+def _load_columns(path):
+    """Noms des variables écrits par _save_columns (None sans fichier)."""
+    target = _columns_path(path)
+    if not os.path.exists(target):
+        return None
+    names = np.load(target, allow_pickle=False)
+    return pd.Index(names.astype(object) if names.dtype.kind == 'U' else names)
+
+
+def _as_index(key, p):
+    """Indices entiers d'une sélection (entier, slice, liste ou masque)."""
+    if isinstance(key, (int, np.integer)):
+        return np.array([range(p)[key]])
+    return np.arange(p)[key]
+
+
+class CorrelationStore:
+    """
+    Matrice de corrélation symétrique stockée dans un fichier .npy projeté en mémoire.
+
+    Attributes:
+        path: Chemin du fichier
+        layout: 'upper' (carré, triangle supérieur) ou 'packed' (compact)
+        p: Nombre de variables
+        columns: Noms des variables
+    """
+
+    def __init__(self, path, data, columns=None):
+        self.path = str(path)
+        self.data = data
+        self.layout = 'packed' if data.ndim == 1 else 'upper'
+        if self.layout == 'packed':
+            self.p = int((np.sqrt(8 * len(data) + 1) - 1) // 2)
+            if self.p * (self.p + 1) // 2 != len(data):
+                raise ValueError("Taille de stockage compact invalide")
+        else:
+            if data.shape[0] != data.shape[1]:
+                raise ValueError("La matrice stockée doit être carrée")
+            self.p = data.shape[0]
+        self.columns = pd.RangeIndex(self.p) if columns is None else pd.Index(columns)
+        if len(self.columns) != self.p:
+            raise ValueError("Le nombre de noms de colonnes ne correspond pas à la matrice")
+        self._flat = data.reshape(-1)
+
+    @classmethod
+    def create(cls, path, p, dtype=np.float32, layout='upper', columns=None):
+        """
+        Crée un fichier de stockage vide.
+
+        Args:
+            path: Chemin du fichier .npy
+            p: Nombre de variables
+            dtype: np.float32 ou np.float64
+            layout: 'upper' ou 'packed'
+            columns: Noms des variables
+
+        Returns:
+            CorrelationStore ouvert en écriture
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Stockage {layout} non supporté")
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("Le stockage supporte float32 et float64")
+        shape = (p * (p + 1) // 2,) if layout == 'packed' else (p, p)
+        data = np.lib.format.open_memmap(str(path), mode='w+', dtype=dtype, shape=shape)
+        store = cls(path, data, columns)
+        _save_columns(path, None if columns is None else store.columns)
+        return store
+
+    @classmethod
+    def open(cls, path, columns=None, mode='r'):
+        """
+        Ouvre un fichier de stockage existant.
+
+        Args:
+            path: Chemin du fichier .npy
+            columns: Noms des variables (par défaut ceux écrits par create)
+            mode: Mode de projection ('r' ou 'r+')
+
+        Returns:
+            CorrelationStore
+        """
+        if columns is None:
+            columns = _load_columns(path)
+        return cls(path, np.load(str(path), mmap_mode=mode), columns)
+
+    @property
+    def shape(self):
+        return (self.p, self.p)
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def _offsets(self, rows):
+        """Position du coefficient (r, r) de chaque ligne en stockage compact."""
+        return rows * self.p - rows * (rows - 1) // 2
+
+    def _flat_index(self, rows, cols):
+        """Position dans le stockage des coefficients (rows, cols), par symétrie."""
+        low = np.minimum(rows, cols)
+        high = np.maximum(rows, cols)
+        if self.layout == 'packed':
+            return self._offsets(low) + (high - low)
+        return low * self.p + high
+
+    def write_tile(self, task, block):
+        """
+        Écrit une tuile du triangle supérieur (i0 <= j0).
+
+        Args:
+            task: Tâche (i0, i1, j0, j1)
+            block: Coefficients de la tuile
+        """
+        i0, i1, j0, j1 = task
+        block = np.clip(block, -1.0, 1.0)
+        if i0 == j0:
+            diagonal = np.einsum('ii->i', block)
+            diagonal[np.isfinite(diagonal)] = 1.0
+        if self.layout == 'upper':
+            self.data[i0:i1, j0:j1] = block
+            return
+        offsets = self._offsets(np.arange(i0, i1))
+        for row in range(i0, i1):
+            start = max(j0, row)
+            if start >= j1:
+                continue
+            offset = offsets[row - i0] + start - row
+            self.data[offset:offset + j1 - start] = block[row - i0, start - j0:]
+
+    def flush(self):
+        """Écrit sur disque les pages modifiées."""
+        if hasattr(self.data, 'flush'):
+            self.data.flush()
+
+    def __getitem__(self, key):
+        """
+        Bloc de la matrice complète (reconstruit par symétrie).
+
+        Args:
+            key: Sélection de lignes, ou couple (lignes, colonnes) ; entiers,
+                slices, listes d'indices ou masques
+
+        Returns:
+            Tableau numpy
+        """
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        row_index = _as_index(rows, self.p)
+        col_index = _as_index(cols, self.p)
+        block = self._flat[self._flat_index(row_index[:, None], col_index[None, :])]
+        if isinstance(rows, (int, np.integer)):
+            block = block[0]
+            if isinstance(cols, (int, np.integer)):
+                return block[0]
+        elif isinstance(cols, (int, np.integer)):
+            block = block[:, 0]
+        return block
+
+    def __len__(self):
+        return self.p
+
+    def to_frame(self, rows=slice(None), cols=slice(None)):
+        """
+        Bloc de la matrice sous forme de DataFrame nommé.
+
+        Args:
+            rows: Sélection de lignes
+            cols: Sélection de colonnes
+
+        Returns:
+            DataFrame
+        """
+        row_index = _as_index(rows, self.p)
+        col_index = _as_index(cols, self.p)
+        return pd.DataFrame(
+            self[row_index, col_index],
+            index=self.columns[row_index],
+            columns=self.columns[col_index],
+        )
+
+    def get_correlation_pairs(self, threshold=0.5, block_size=DEFAULT_TILE_SIZE):
+        """
+        Paires (i < j) dont |r| atteint le seuil, lues par blocs de lignes.
+
+        Args:
+            threshold: Seuil de corrélation
+            block_size: Nombre de lignes lues à la fois
+
+        Returns:
+            Liste de tuples (var1, var2, corr) triée par |r| décroissant
+        """
+        rows, cols, values = [], [], []
+        for start, stop in tile_bounds(self.p, block_size):
+            block = self[start:stop, start:].astype(np.float64)
+            r, c = np.nonzero(np.abs(block) >= threshold)
+            r, c = r + start, c + start
+            upper = c > r
+            rows.append(r[upper])
+            cols.append(c[upper])
+            values.append(block[r[upper] - start, c[upper] - start])
+        i = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+        j = np.concatenate(cols) if cols else np.empty(0, dtype=np.intp)
+        corr_values = np.concatenate(values) if values else np.empty(0)
+        order = np.argsort(-np.abs(corr_values), kind='stable')
+        return list(zip(self.columns[i[order]], self.columns[j[order]], corr_values[order]))
+
+
+def stored_correlation(values, path, dtype=np.float32, layout=None, tile_size=DEFAULT_TILE_SIZE,
+                       map_func=map, wave_size=8, columns=None, min_periods=1):
+    """
+    Matrice de corrélation de Pearson écrite tuile par tuile sur disque.
+
+    Les données avec valeurs manquantes sont traitées par observations
+    complètes par paire (voir masked.py).
+
+    Args:
+        values: Matrice (n, p)
+        path: Chemin du fichier .npy
+        dtype: np.float32 ou np.float64
+        layout: 'upper' ou 'packed' ; par défaut 'packed' à partir de
+            PACKED_MIN_COLUMNS variables (voir resolve_layout)
+        tile_size: Largeur des tuiles
+        map_func: Fonction de répartition des tuiles
+        wave_size: Nombre de tuiles soumises à la fois (borne la mémoire)
+        columns: Noms des variables
+        min_periods: Effectif minimal d'une paire avec valeurs manquantes
+            (NaN en dessous)
+
+    Returns:
+        CorrelationStore
+    """
+    values = np.asarray(values, dtype=np.float64)
+    p = values.shape[1]
+    if np.isnan(values).any():
+        x, mask = prepare(values)
+        compute = partial(masked_tile, x, mask, min_periods)
+    else:
+        compute = partial(correlation_tile, standardize(values))
+    store = CorrelationStore.create(path, p, dtype, resolve_layout(layout, p), columns)
+    for wave in in_waves(tile_pairs(tile_bounds(p, tile_size)), wave_size):
+        for result in map_func(compute, wave):
+            store.write_tile(result[0], result[1])
+    store.flush()
+    return store
@@ -0,0 +1,138 @@
+'''
+=====================================================================
+File : streaming.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Accumulateur de corrélation de Pearson alimenté ligne à ligne (par
+chunks), pour des données plus grandes que la mémoire.
+
+Chaque chunk est centré sur sa propre moyenne (co-moments à deux
+passes, produit BLAS), puis fusionné par la formule de Chan : la
+mémoire est O(p²), indépendante du nombre de lignes, et deux
+accumulateurs calculés dans des processus distincts se fusionnent.
+
+tags : module, stats, correlation, streaming
+=====================================================================
+'''
+
+import numpy as np
+import pandas as pd
+
+from .engine import finish
+
+
+class StreamingCorrelation:
+    """
+    Moyennes et co-moments de p colonnes, fusionnables (Chan et al.).
+
+    Attributes:
+        n: Nombre de lignes accumulées
+        mean: Moyennes des colonnes
+        comoment: Somme des produits croisés centrés (p, p)
+        columns: Noms des colonnes (si les chunks sont des DataFrames)
+    """
+
+    def __init__(self, columns=None):
+        self.columns = None if columns is None else pd.Index(columns)
+        self.n = 0
+        self.mean = None
+        self.comoment = None
+
+    def _check_columns(self, chunk):
+        """Valeurs float64 du chunk ; vérifie la cohérence des colonnes."""
+        if isinstance(chunk, pd.DataFrame):
+            if self.columns is None:
+                self.columns = chunk.columns
+            elif not chunk.columns.equals(self.columns):
+                raise ValueError("Les chunks doivent avoir les mêmes colonnes")
+            return chunk.to_numpy(dtype=np.float64)
+        values = np.asarray(chunk, dtype=np.float64)
+        return values.reshape(-1, 1) if values.ndim == 1 else values
+
+    def _combine(self, n, mean, comoment):
+        """Fusionne des moments (n, moyenne, co-moment) dans l'accumulateur."""
+        if n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.comoment = n, mean.copy(), comoment.copy()
+            return self
+        total = self.n + n
+        delta = mean - self.mean
+        self.comoment += comoment
+        self.comoment += np.outer(delta, delta) * (self.n * n / total)
+        self.mean += delta * (n / total)
+        self.n = total
+        return self
+
+    def partial_fit(self, chunk):
+        """
+        Ajoute un chunk de lignes (les lignes incomplètes sont ignorées).
+
+        Args:
+            chunk: DataFrame ou matrice (lignes, colonnes)
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        values = self._check_columns(chunk)
+        values = values[~np.isnan(values).any(axis=1)]
+        if not len(values):
+            return self
+        mean = values.mean(axis=0)
+        centered = values - mean
+        return self._combine(len(values), mean, centered.T @ centered)
+
+    def merge(self, other):
+        """
+        Fusionne un autre accumulateur (autre partition, autre processus).
+
+        Args:
+            other: StreamingCorrelation
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        if self.columns is None:
+            self.columns = other.columns
+        elif other.columns is not None and not other.columns.equals(self.columns):
+            raise ValueError("Les accumulateurs doivent avoir les mêmes colonnes")
+        return self._combine(other.n, other.mean, other.comoment)
+
+    def covariance(self, ddof=1):
+        """
+        Matrice de covariance.
+
+        Args:
+            ddof: Degrés de liberté retranchés
+
+        Returns:
+            Matrice (p, p)
+        """
+        if self.n <= ddof:
+            raise ValueError("Pas assez de lignes accumulées")
+        return self.comoment / (self.n - ddof)
+
+    def finalize(self):
+        """
+        Matrice de corrélation de Pearson.
+
+        Returns:
+            DataFrame (si les colonnes sont nommées) ou matrice (p, p)
+        """
+        if self.n < 2:
+            raise ValueError("Pas assez de lignes accumulées")
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scale = np.where(scale > 0, 1.0 / scale, np.nan)
+        corr = finish(self.comoment * scale[:, None] * scale[None, :])
+        if self.columns is None:
+            return corr
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
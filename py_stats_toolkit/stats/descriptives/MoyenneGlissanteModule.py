@@ -66,62 +66,445 @@ class MoyenneGlissanteModule(BaseCapsule):
         """
         pass 
 
+from datetime import timedelta
 import numpy as np
 import pandas as pd
 from ..core.AbstractClassBase import StatisticalModule
-from ...utils.parallel import ParallelProcessor, BatchProcessor
+from ...utils.parallel import ParallelProcessor, BatchProcessor, get_optimal_chunk_size
+from .rolling import (
+    RollingTimeMean, as_duration, as_nanoseconds, max_points_per_window, resolve_block_size,
+    RollingMean, RollingMeanBank, RollingVariance, RollingExtremum, RollingQuantile,
+    chunk_tasks
+)
+from .ewm import ExponentialMovingState, resolve_alpha
+
+
+def _is_duration(window_size):
+    """Indique si la fenêtre est une durée ('5min', Timedelta) plutôt qu'un effectif."""
+    return isinstance(window_size, (str, timedelta, np.timedelta64))
+
+
+def _slice(timestamps, start, stop):
+    """Tranche d'horodatages (None pour une fenêtre en nombre de points)."""
+    return None if timestamps is None else timestamps[start:stop]
+
+
+def _update(state, values, timestamps=None):
+    """Met à jour un état glissant, horodaté ou non."""
+    if timestamps is None:
+        return state.update(values)
+    return state.update(values, timestamps)
+
+
+def _resolve_timestamps(data, timestamps=None):
+    """
+    Horodatages en nanosecondes d'une série.
+    
+    Args:
+        data: Données d'entrée
+        timestamps: Horodatages explicites, ou objet (TimeSeriesModule)
+            exposant un attribut timestamps déjà analysé
+    
+    Returns:
+        Tableau int64 de nanosecondes
+    """
+    if timestamps is not None and hasattr(timestamps, 'timestamps'):
+        timestamps = timestamps.timestamps
+    if timestamps is None and isinstance(data, pd.Series) and isinstance(data.index, pd.DatetimeIndex):
+        timestamps = data.index
+    if timestamps is None:
+        raise ValueError("Une fenêtre temporelle requiert des horodatages (DatetimeIndex ou timestamps)")
+    return as_nanoseconds(timestamps)
+
 
 class MoyenneGlissanteModule(StatisticalModule):
-    """Module pour le calcul de la moyenne glissante."""
+    """Module pour le calcul de la moyenne glissante et des statistiques glissantes."""
+    
+    STATISTICS = ("mean", "var", "std", "min", "max", "median", "quantile")
     
     def __init__(self, n_jobs: int = -1, batch_size: int = 1000):
         super().__init__()
         self.window_size = None
+        self.windows = None
+        self.min_periods = None
+        self.statistic = "mean"
+        self.quantile = 0.5
+        self.ddof = 1
+        self.state = None
+        # Vrai après process() : partial_process() refuse alors de démarrer
+        # un flux qui ignorerait l'historique déjà traité
+        self._processed = False
+        self.time_block_size = None
         self.parallel_processor = ParallelProcessor(n_jobs=n_jobs)
         self.batch_processor = BatchProcessor(batch_size=batch_size)
     
-    def _process_chunk(self, chunk):
-        """Traite un chunk de données."""
-        return pd.Series(chunk).rolling(window=self.window_size).mean()
+    def _new_state(self, block_size=None, n_columns=1):
+        """Crée un état glissant neuf pour la configuration courante."""
+        if _is_duration(self.window_size):
+            return RollingTimeMean(
+                self.window_size, self.min_periods, n_columns=n_columns,
+                block_size=block_size or self.time_block_size
+            )
+        if self.windows is not None:
+            return RollingMeanBank(
+                self.windows, self.min_periods, n_columns=n_columns, block_size=block_size
+            )
+        if self.statistic in ("var", "std"):
+            return RollingVariance(
+                self.window_size, self.min_periods, ddof=self.ddof,
+                n_columns=n_columns, block_size=block_size
+            )
+        if self.statistic in ("min", "max"):
+            return RollingExtremum(
+                self.window_size, self.min_periods, kind=self.statistic, n_columns=n_columns
+            )
+        if self.statistic in ("median", "quantile"):
+            quantile = 0.5 if self.statistic == "median" else self.quantile
+            return RollingQuantile(
+                self.window_size, quantile, self.min_periods, n_columns=n_columns
+            )
+        return RollingMean(
+            self.window_size, self.min_periods, n_columns=n_columns, block_size=block_size
+        )
+    
+    def _process_chunk(self, task):
+        """
+        Traite un chunk avec son halo amont.
+        
+        Le halo est rejoué dans un état neuf pour reconstruire exactement
+        l'état du passage unique au début du chunk.
+        """
+        values, n_halo, block_size, times = task
+        n_columns = 1 if values.ndim == 1 else values.shape[1]
+        return _update(self._new_state(block_size, n_columns), values, times)[n_halo:]
+    
+    def _run(self, data_array, window, state=None, timestamps=None):
+        """
+        Applique l'état glissant courant à toute la série.
+        
+        Passage unique pour les petites séries, lots successifs avec report
+        d'état si n_jobs == 1, chunks parallèles avec halo sinon ; les trois
+        chemins donnent le même résultat. Un état fourni explicitement (à
+        mémoire infinie, comme l'EWMA) est toujours traité par lots successifs.
+        Pour une fenêtre temporelle, window est l'effectif maximal d'une
+        fenêtre et timestamps les horodatages en nanosecondes.
+        """
+        n = len(data_array)
+        n_columns = 1 if data_array.ndim == 1 else data_array.shape[1]
+        batch_size = self.batch_processor.batch_size
+        
+        if n <= batch_size:
+            # Passage unique pour les petites séries
+            if state is None:
+                state = self._new_state(n_columns=n_columns)
+            return _update(state, data_array, timestamps)
+        
+        if state is not None or self.parallel_processor.n_jobs == 1:
+            # Traitement par lots avec report d'état : mémoire bornée par le lot
+            if state is None:
+                state = self._new_state(n_columns=n_columns)
+            result = None
+            for start in range(0, n, batch_size):
+                stop = min(start + batch_size, n)
+                part = _update(state, data_array[start:stop], _slice(timestamps, start, stop))
+                if result is None:
+                    result = np.empty((n,) + part.shape[1:])
+                result[start:stop] = part
+            return result
+        
+        # Traitement parallèle de chunks alignés sur la grille, avec halo
+        block_size = self._new_state(n_columns=n_columns).block_size
+        chunk_size = max(batch_size, get_optimal_chunk_size(n, self.parallel_processor.n_jobs))
+        tasks = [
+            (data_array[halo_start:stop], start - halo_start, block_size,
+             _slice(timestamps, halo_start, stop))
+            for halo_start, start, stop in chunk_tasks(n, chunk_size, window, block_size)
+        ]
+        return np.concatenate(self.parallel_processor.parallel_map(self._process_chunk, tasks))
     
-    def process(self, data, window_size=5, **kwargs):
+    def process(self, data, window_size=5, min_periods=None, statistic="mean",
+                quantile=0.5, ddof=1, timestamps=None, **kwargs):
         """
-        Calcule la moyenne glissante sur les données en parallèle.
+        Calcule la moyenne glissante (ou une autre statistique glissante) en parallèle.
+        
+        Le résultat est identique quel que soit le découpage : l'état de
+        la fenêtre est reporté d'un lot à l'autre au lieu d'être réinitialisé.
+        
+        Une durée ('5min', Timedelta) comme window_size donne une fenêtre
+        temporelle ]t - durée, t] sur des horodatages éventuellement
+        irréguliers, comme rolling('5min') de pandas (moyenne uniquement).
         
         Args:
             data: Données d'entrée (numpy array ou pandas Series)
-            window_size: Taille de la fenêtre glissante
+            window_size: Taille de la fenêtre glissante, ou durée
+            min_periods: Nombre minimal de valeurs valides par fenêtre
+                (par défaut la taille de la fenêtre)
+            statistic: Statistique ('mean', 'var', 'std', 'min', 'max', 'median', 'quantile')
+            quantile: Quantile(s) entre 0 et 1 pour statistic='quantile'
+            ddof: Degrés de liberté retranchés pour 'var' et 'std'
+            timestamps: Horodatages pour une fenêtre temporelle (par défaut
+                l'index de la Series ; un TimeSeriesModule fournit les siens)
             **kwargs: Arguments additionnels
             
         Returns:
-            Moyenne glissante calculée
+            Statistique glissante calculée (DataFrame si plusieurs quantiles)
         """
         self.validate_data(data)
+        if statistic not in self.STATISTICS:
+            raise ValueError(f"Statistique {statistic} non supportée")
+        self.state = None
+        self._processed = True
+        if _is_duration(window_size):
+            return self._process_time(data, window_size, min_periods, statistic, timestamps)
         self.window_size = window_size
+        self.windows = None
+        self.min_periods = min_periods
+        self.statistic = statistic
+        self.quantile = quantile
+        self.ddof = ddof
         
         if isinstance(data, pd.Series):
             data_array = data.values
         else:
-            data_array = data
+            data_array = np.asarray(data)
+        
+        result = self._run(data_array, window_size)
+        if statistic == "std":
+            result = np.sqrt(result)
+        
+        index = data.index if isinstance(data, pd.Series) else None
+        if result.ndim == 2:
+            self.result = pd.DataFrame(result, index=index, columns=np.atleast_1d(quantile))
+        else:
+            self.result = pd.Series(result, index=index)
+        
+        return self.result
+    
+    def _process_time(self, data, duration, min_periods, statistic, timestamps):
+        """Moyenne glissante sur une fenêtre temporelle (voir process)."""
+        if statistic != "mean":
+            raise ValueError("Les fenêtres temporelles ne supportent que statistic='mean'")
+        times = _resolve_timestamps(data, timestamps)
+        data_array = data.values if isinstance(data, pd.Series) else np.asarray(data)
+        if len(times) != len(data_array):
+            raise ValueError("Les horodatages et les données doivent avoir la même longueur")
+        if np.any(np.diff(times) < 0):
+            raise ValueError("Les horodatages doivent être croissants")
+        
+        self.window_size = duration
+        self.windows = None
+        self.min_periods = min_periods
+        self.statistic = statistic
+        # Les chunks parallèles sont découpés sur l'effectif maximal d'une
+        # fenêtre, qui borne aussi la taille de bloc
+        max_count = max_points_per_window(times, as_duration(duration))
+        self.time_block_size = resolve_block_size(max_count)
+        result = self._run(data_array, max_count, timestamps=times)
+        
+        index = data.index if isinstance(data, pd.Series) else pd.to_datetime(times, unit='ns')
+        self.result = pd.Series(result, index=index)
+        return self.result
+    
+    def process_bank(self, data, windows=(5, 20, 50, 200), min_periods=None, **kwargs):
+        """
+        Calcule les moyennes glissantes de plusieurs fenêtres sur plusieurs colonnes.
+        
+        Toutes les paires (colonne, fenêtre) sont obtenues à partir d'une
+        seule passe de sommes préfixes, vectorisée sur les colonnes.
+        
+        Args:
+            data: Données d'entrée (pandas DataFrame ou numpy array 2-D)
+            windows: Tailles de fenêtre
+            min_periods: Nombre minimal de valeurs valides par fenêtre
+                (par défaut la taille de chaque fenêtre)
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            DataFrame à colonnes MultiIndex (variable, fenêtre)
+        """
+        self.validate_data(data)
+        self.state = None
+        self._processed = True
+        windows = [int(w) for w in windows]
+        self.windows = windows
+        self.window_size = max(windows)
+        self.min_periods = min_periods
         
-        # Utilisation du traitement par lots pour les grandes séries
-        if len(data_array) > self.batch_processor.batch_size:
-            result = self.batch_processor.process_batches(self._process_chunk, data_array)
+        if isinstance(data, pd.DataFrame):
+            data_array = data.to_numpy(dtype=np.float64)
+            columns, index = data.columns, data.index
         else:
-            # Traitement parallèle pour les séries plus petites
-            result = self.parallel_processor.parallel_apply(
-                self._process_chunk,
-                data_array.reshape(-1, 1),
-                axis=0
-            ).flatten()
+            data_array = np.asarray(data, dtype=np.float64)
+            if data_array.ndim == 1:
+                data_array = data_array.reshape(-1, 1)
+            columns, index = pd.RangeIndex(data_array.shape[1]), None
+        
+        result = self._run(data_array, self.window_size)
+        
+        self.result = pd.DataFrame(
+            result.reshape(len(data_array), -1),
+            index=index,
+            columns=pd.MultiIndex.from_product([columns, windows], names=['Variable', 'Fenêtre'])
+        )
+        return self.result
+    
+    def process_ewm(self, data, alpha=None, span=None, halflife=None, com=None,
+                    statistic="mean", bias=False, min_periods=0, **kwargs):
+        """
+        Calcule la moyenne (ou variance) mobile exponentielle.
+        
+        L'état de décroissance est reporté d'un lot à l'autre, et conservé
+        en fin de calcul : update() prolonge ensuite le flux sans
+        recalculer l'historique, et get_state() permet de l'exporter.
+        
+        Les résultats sont ceux de pandas ewm(..., adjust=False,
+        ignore_na=True), et non des réglages par défaut de pandas
+        (adjust=True, ignore_na=False).
+        
+        Args:
+            data: Données d'entrée (numpy array ou pandas Series)
+            alpha: Facteur de lissage (ou bien span, halflife, com)
+            span: Portée, alpha = 2 / (span + 1)
+            halflife: Demi-vie, alpha = 1 - exp(-ln(2) / halflife)
+            com: Centre de masse, alpha = 1 / (1 + com)
+            statistic: Statistique ('mean', 'var', 'std')
+            bias: Si False, variance corrigée du biais (comme pandas, bias=False)
+            min_periods: Nombre minimal d'observations avant le premier résultat
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            Statistique exponentielle calculée
+        """
+        self.validate_data(data)
+        alpha = resolve_alpha(alpha, span, halflife, com)
         
         if isinstance(data, pd.Series):
-            self.result = pd.Series(result, index=data.index)
+            data_array = data.values
         else:
-            self.result = pd.Series(result)
+            data_array = np.asarray(data)
+        
+        self.state = ExponentialMovingState(alpha, statistic, bias, min_periods)
+        self._processed = False
+        result = self._run(data_array, None, state=self.state)
         
+        index = data.index if isinstance(data, pd.Series) else None
+        self.result = pd.Series(result, index=index)
         return self.result
     
+    def partial_process(self, data, window_size=None, min_periods=None, timestamps=None, **kwargs):
+        """
+        Ajoute de nouveaux points au flux et retourne leur moyenne glissante.
+        
+        Seules les dernières valeurs utiles sont conservées entre deux
+        appels : ajouter k points coûte O(k), quelle que soit la longueur
+        de l'historique déjà traité. Un flux exponentiel ouvert par
+        process_ewm() ou set_state() est prolongé de la même façon.
+        
+        Le résultat de process() ou process_bank() ne peut pas être
+        prolongé : sans l'état de fin de série, les window - 1 premiers
+        points du flux seraient NaN. Après process(), appelez
+        reset_state() pour démarrer un nouveau flux sans historique, ou
+        repassez la série par partial_process().
+        
+        Args:
+            data: Nouveaux points (numpy array ou pandas Series)
+            window_size: Taille de la fenêtre ou durée (requise au premier appel)
+            min_periods: Nombre minimal de valeurs valides par fenêtre
+            timestamps: Horodatages des nouveaux points pour une fenêtre
+                temporelle (par défaut l'index de la Series)
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            Moyenne glissante des nouveaux points
+        
+        Raises:
+            ValueError: Si process() a été appelé depuis le dernier flux
+        """
+        if self.state is None:
+            if self._processed:
+                raise ValueError(
+                    "partial_process() ne prolonge pas le résultat de process() : "
+                    "appelez reset_state() pour démarrer un nouveau flux"
+                )
+            if window_size is None:
+                window_size = self.window_size
+            if window_size is None:
+                raise ValueError("window_size est requis pour démarrer le flux")
+            self.window_size = window_size
+            self.windows = None
+            self.statistic = "mean"
+            self.min_periods = min_periods
+            self.state = self._new_state()
+        elif window_size is not None and not self._same_window(window_size):
+            raise ValueError("Impossible de changer la taille de fenêtre d'un flux en cours")
+        
+        if isinstance(self.state, RollingTimeMean):
+            times = _resolve_timestamps(data, timestamps)
+            values = data.values if isinstance(data, pd.Series) else np.asarray(data)
+            result = self.state.update(values, times)
+            index = data.index if isinstance(data, pd.Series) else pd.to_datetime(times, unit='ns')
+            return pd.Series(result, index=index)
+        
+        start = self.state.position
+        if isinstance(data, pd.Series):
+            return pd.Series(self.state.update(data.values), index=data.index)
+        result = self.state.update(np.asarray(data))
+        return pd.Series(result, index=pd.RangeIndex(start, start + len(result)))
+    
+    def _same_window(self, window_size):
+        """Indique si window_size correspond à la fenêtre du flux en cours."""
+        if isinstance(self.state, RollingTimeMean):
+            return _is_duration(window_size) and as_duration(window_size) == self.state.duration
+        return window_size == getattr(self.state, 'window', None)
+    
+    def update(self, new_values):
+        """
+        Ajoute de nouveaux points au flux en cours (voir partial_process).
+        
+        Args:
+            new_values: Nouveaux points
+            
+        Returns:
+            Moyenne glissante des nouveaux points
+        """
+        return self.partial_process(new_values)
+    
+    def get_state(self):
+        """
+        Exporte l'état du flux pour une reprise ultérieure.
+        
+        Returns:
+            Dictionnaire d'état sérialisable
+        """
+        if self.state is None:
+            raise ValueError("Aucun flux en cours : appelez d'abord partial_process()")
+        return self.state.get_state()
+    
+    def set_state(self, state):
+        """
+        Reprend un flux à partir d'un état exporté par get_state().
+        
+        Args:
+            state: Dictionnaire d'état
+        """
+        self._processed = False
+        if state.get('kind') == 'ewm':
+            self.state = ExponentialMovingState.from_state(state)
+            return
+        if state.get('kind') == 'time':
+            self.state = RollingTimeMean.from_state(state)
+            self.window_size = pd.Timedelta(self.state.duration)
+            self.min_periods = self.state.min_periods
+            return
+        self.state = RollingMean.from_state(state)
+        self.window_size = self.state.window
+        self.min_periods = self.state.min_periods
+    
+    def reset_state(self):
+        """Abandonne le flux en cours (ou le résultat de process())."""
+        self.state = None
+        self._processed = False
+    
     def get_window_size(self):
         """Retourne la taille de la fenêtre utilisée."""
-        return self.window_size 
\ No newline at end of file
+        return self.window_size
@@ -0,0 +1,215 @@
+'''
+=====================================================================
+File : ewm.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Moyenne et variance mobiles exponentielles à état reprenable.
+
+Les récurrences y_t = (1 - alpha) y_{t-1} + alpha x_t sont évaluées par
+scipy.signal.lfilter (boucle compilée) en passant l'état final d'un bloc
+comme état initial du suivant : un traitement par lots ou en flux donne
+exactement le même résultat qu'un passage unique.
+
+tags : module, stats, ewm
+=====================================================================
+'''
+
+import numpy as np
+from scipy.signal import lfilter
+
+EWM_STATISTICS = ('mean', 'var', 'std')
+
+
+def resolve_alpha(alpha=None, span=None, halflife=None, com=None):
+    """
+    Convertit un paramètre de lissage en facteur alpha (conventions pandas).
+
+    Args:
+        alpha: Facteur de lissage (0 < alpha <= 1)
+        span: Portée, alpha = 2 / (span + 1)
+        halflife: Demi-vie, alpha = 1 - exp(-ln(2) / halflife)
+        com: Centre de masse, alpha = 1 / (1 + com)
+
+    Returns:
+        Facteur alpha
+    """
+    given = [p is not None for p in (alpha, span, halflife, com)]
+    if sum(given) != 1:
+        raise ValueError("Indiquez exactement un paramètre parmi alpha, span, halflife, com")
+    if span is not None:
+        alpha = 2.0 / (span + 1.0)
+    elif halflife is not None:
+        alpha = 1.0 - np.exp(-np.log(2.0) / halflife)
+    elif com is not None:
+        alpha = 1.0 / (1.0 + com)
+    alpha = float(alpha)
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError("alpha doit être compris dans ]0, 1]")
+    return alpha
+
+
+def _recurrence(decay, inputs, previous):
+    """Évalue y_t = decay * y_{t-1} + inputs_t à partir de y_{-1} = previous."""
+    return lfilter([1.0], [1.0, -decay], inputs, zi=[decay * previous])[0]
+
+
+class ExponentialMovingState:
+    """
+    Moyenne (et variance) mobile exponentielle à état reprenable.
+
+    Équivaut à pandas ewm(alpha=..., adjust=False, ignore_na=True) : la
+    récurrence démarre sur la première valeur, les valeurs manquantes sont
+    ignorées (sans décroissance) et le dernier résultat est reporté. Les
+    réglages par défaut de pandas (adjust=True, ignore_na=False) pondèrent
+    autrement les premiers points et les trous, et donnent d'autres
+    valeurs.
+
+    Attributes:
+        alpha: Facteur de lissage
+        statistic: Statistique retournée ('mean', 'var', 'std')
+        bias: Si False, variance corrigée du biais comme pandas (bias=False)
+        min_periods: Nombre minimal d'observations avant le premier résultat
+    """
+
+    # Récurrence à mémoire infinie : pas de découpage parallèle par halo
+    block_size = None
+
+    def __init__(self, alpha, statistic='mean', bias=False, min_periods=0, n_columns=1):
+        if statistic not in EWM_STATISTICS:
+            raise ValueError(f"Statistique {statistic} non supportée")
+        self.alpha = resolve_alpha(alpha)
+        self.statistic = statistic
+        self.bias = bool(bias)
+        self.min_periods = int(min_periods)
+        self.n_columns = int(n_columns)
+        self.position = 0
+        self._mean = np.full(self.n_columns, np.nan)
+        self._var_sum = np.zeros(self.n_columns)
+        self._weight2 = np.ones(self.n_columns)
+        self._count = np.zeros(self.n_columns, dtype=np.int64)
+
+    def get_state(self):
+        """
+        Exporte l'état pour une reprise ultérieure du flux.
+
+        Returns:
+            Dictionnaire de scalaires et de tableaux numpy
+        """
+        return {
+            'kind': 'ewm',
+            'alpha': self.alpha,
+            'statistic': self.statistic,
+            'bias': self.bias,
+            'min_periods': self.min_periods,
+            'n_columns': self.n_columns,
+            'position': self.position,
+            'mean': self._mean.copy(),
+            'var_sum': self._var_sum.copy(),
+            'weight2': self._weight2.copy(),
+            'count': self._count.copy(),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Reconstruit un état exporté par get_state().
+
+        Args:
+            state: Dictionnaire d'état
+
+        Returns:
+            Instance prête à reprendre le flux
+        """
+        ewm = cls(
+            state['alpha'], state['statistic'], state['bias'],
+            state['min_periods'], n_columns=state['n_columns'],
+        )
+        ewm.position = int(state['position'])
+        ewm._mean = np.array(state['mean'], dtype=np.float64)
+        ewm._var_sum = np.array(state['var_sum'], dtype=np.float64)
+        ewm._weight2 = np.array(state['weight2'], dtype=np.float64)
+        ewm._count = np.array(state['count'], dtype=np.int64)
+        return ewm
+
+    def _update_column(self, column, values):
+        """Met à jour une colonne ; retourne moyennes, sommes de variance et poids² aux points valides."""
+        alpha = self.alpha
+        decay = 1.0 - alpha
+        valid = values[~np.isnan(values)]
+        n = len(valid)
+        mean, var_sum, weight2 = (
+            self._mean[column], self._var_sum[column], self._weight2[column]
+        )
+        means = np.empty(n)
+        var_sums = np.empty(n)
+        weights2 = np.empty(n)
+        start = 0
+        if self._count[column] == 0 and n:
+            # Première observation : la moyenne vaut la valeur, variance nulle
+            mean, var_sum, weight2 = valid[0], 0.0, 1.0
+            means[0], var_sums[0], weights2[0] = mean, var_sum, weight2
+            start = 1
+        if start < n:
+            rest = valid[start:]
+            means[start:] = _recurrence(decay, alpha * rest, mean)
+            previous = np.concatenate([[mean], means[start:n - 1]])
+            deviations = rest - previous
+            var_sums[start:] = _recurrence(decay, decay * alpha * deviations * deviations, var_sum)
+            weights2[start:] = _recurrence(decay * decay, np.full(len(rest), alpha * alpha), weight2)
+        if n:
+            self._mean[column] = means[-1]
+            self._var_sum[column] = var_sums[-1]
+            self._weight2[column] = weights2[-1]
+        return means, var_sums, weights2
+
+    def update(self, values):
+        """
+        Ajoute des valeurs et retourne la statistique exponentielle de chacune.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Statistique pour chaque nouveau point (même dimension que l'entrée)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = values.reshape(-1, 1) if values.ndim == 1 else values
+        out = np.empty(x.shape)
+        for column in range(self.n_columns):
+            col = x[:, column]
+            before = self._statistic(
+                self._mean[column], self._var_sum[column], self._weight2[column]
+            )
+            means, var_sums, weights2 = self._update_column(column, col)
+            valid = ~np.isnan(col)
+            # Report du dernier résultat sur les valeurs manquantes
+            idx = np.cumsum(valid) - 1
+            result = np.full(len(col), before)
+            seen = idx >= 0
+            result[seen] = self._statistic(means, var_sums, weights2)[idx[seen]]
+            counts = self._count[column] + np.cumsum(valid)
+            result[counts < max(self.min_periods, 1)] = np.nan
+            self._count[column] = counts[-1] if len(counts) else self._count[column]
+            out[:, column] = result
+        self.position += len(x)
+        return out.ravel() if values.ndim == 1 else out
+
+    def _statistic(self, means, var_sums, weights2):
+        """Statistique demandée à partir des moments exponentiels."""
+        if self.statistic == 'mean':
+            return means
+        if self.bias:
+            variances = var_sums
+        else:
+            # Correction de biais de pandas (poids normalisés, somme des poids = 1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                variances = np.where(weights2 < 1.0, var_sums / (1.0 - weights2), np.nan)
+        return np.sqrt(variances) if self.statistic == 'std' else variances
@@ -0,0 +1,1004 @@
+'''
+=====================================================================
+File : rolling.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Moteur de fenêtres glissantes par sommes préfixes pour les modules
+descriptifs.
+
+Les préfixes sont remis à zéro sur une grille de blocs indexée par la
+position absolue dans la série : une somme de fenêtre ne dépend que des
+positions qu'elle couvre, si bien que le traitement par lots, le
+traitement parallèle et le passage unique donnent des résultats
+identiques bit à bit. L'historique nécessaire entre deux chunks est
+conservé dans un tampon circulaire de la taille de la fenêtre.
+
+Les fenêtres temporelles ('5min') sur horodatages irréguliers réutilisent
+le même moteur : leurs bornes sont obtenues par searchsorted.
+
+tags : module, stats, rolling
+=====================================================================
+'''
+
+from bisect import bisect_left, insort
+from collections import deque
+import numpy as np
+import pandas as pd
+from scipy import ndimage
+
+# Taille minimale des blocs de la grille de remise à zéro des préfixes
+DEFAULT_BLOCK_SIZE = 4096
+
+# Blocs plus courts pour la variance : des préfixes plus petits limitent
+# l'erreur d'arrondi sur les fenêtres de faible dispersion
+VARIANCE_BLOCK_SIZE = 256
+
+
+def _as_2d(values):
+    """Convertit les valeurs en tableau float64 de forme (n, colonnes)."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        return values.reshape(-1, 1)
+    if values.ndim != 2:
+        raise ValueError("Les données doivent être à une ou deux dimensions")
+    return values
+
+
+def as_nanoseconds(timestamps):
+    """
+    Convertit des horodatages en entiers int64 (nanosecondes depuis l'epoch).
+
+    Accepte un DatetimeIndex, une Series, un tableau datetime64 ou des
+    entiers déjà exprimés en nanosecondes ; les tableaux datetime64[ns]
+    sont réinterprétés sans copie.
+
+    Args:
+        timestamps: Horodatages
+
+    Returns:
+        Tableau int64
+    """
+    if isinstance(timestamps, (pd.Series, pd.Index)):
+        timestamps = timestamps.values
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind in 'iu':
+        return timestamps.astype(np.int64, copy=False)
+    if timestamps.dtype.kind != 'M':
+        timestamps = np.asarray(pd.to_datetime(timestamps), dtype='datetime64[ns]')
+    return timestamps.astype('datetime64[ns]', copy=False).view(np.int64)
+
+
+def as_duration(duration):
+    """
+    Convertit une durée ('5min', Timedelta, timedelta64...) en nanosecondes.
+
+    Args:
+        duration: Durée de la fenêtre
+
+    Returns:
+        Durée en nanosecondes (int)
+    """
+    value = int(pd.Timedelta(duration).value)
+    if value <= 0:
+        raise ValueError("La durée de fenêtre doit être positive")
+    return value
+
+
+def max_points_per_window(timestamps, duration):
+    """
+    Nombre maximal de points dans une fenêtre temporelle ]t - durée, t].
+
+    Args:
+        timestamps: Horodatages triés (nanosecondes)
+        duration: Durée de la fenêtre (nanosecondes)
+
+    Returns:
+        Effectif maximal d'une fenêtre
+    """
+    if len(timestamps) == 0:
+        return 1
+    starts = np.searchsorted(timestamps, timestamps - duration, side='right')
+    return int((np.arange(len(timestamps)) - starts).max() + 1)
+
+
+def resolve_block_size(window, block_size=None):
+    """
+    Retourne une taille de bloc compatible avec la fenêtre.
+
+    Une fenêtre plus courte qu'un bloc chevauche au plus deux blocs, ce
+    qui garantit l'invariance au découpage quel que soit l'état initial.
+
+    Args:
+        window: Plus grande fenêtre (en nombre de points)
+        block_size: Taille de bloc souhaitée (optionnelle)
+
+    Returns:
+        Taille de bloc retenue
+    """
+    if block_size is None:
+        block_size = DEFAULT_BLOCK_SIZE
+    return max(int(block_size), int(window))
+
+
+def chunk_tasks(n, chunk_size, window, block_size):
+    """
+    Découpe une série en chunks alignés sur la grille, avec leur halo amont.
+
+    Chaque tâche (halo_start, start, stop) peut être traitée
+    indépendamment : en rejouant les points [halo_start, start) dans un
+    état neuf, on reconstruit exactement l'état du passage unique.
+
+    Args:
+        n: Longueur de la série
+        chunk_size: Taille souhaitée des chunks
+        window: Plus grande fenêtre utilisée
+        block_size: Taille des blocs de la grille
+
+    Returns:
+        Liste de tuples (halo_start, start, stop)
+    """
+    chunk_size = max(block_size, -(-int(chunk_size) // block_size) * block_size)
+    tasks = []
+    for start in range(0, n, chunk_size):
+        halo_start = max(0, ((start - window) // block_size) * block_size)
+        tasks.append((halo_start, start, min(start + chunk_size, n)))
+    return tasks
+
+
+class BlockPrefixSum:
+    """
+    Sommes préfixes par blocs avec état reportable entre chunks.
+
+    Les valeurs manquantes (NaN) contribuent zéro à la somme et sont
+    exclues des effectifs.
+
+    Attributes:
+        block_size: Taille des blocs de la grille
+        n_columns: Nombre de colonnes traitées simultanément
+        position: Position absolue du prochain point
+    """
+
+    def __init__(self, n_columns=1, block_size=DEFAULT_BLOCK_SIZE, history=1):
+        self.block_size = int(block_size)
+        self.n_columns = int(n_columns)
+        self.position = 0
+        # Préfixe local du bloc courant, somme des blocs terminés, effectif global
+        self._carry_sum = np.zeros(self.n_columns)
+        self._block_offset = np.zeros(self.n_columns)
+        self._carry_count = np.zeros(self.n_columns, dtype=np.int64)
+        # Tampon circulaire ; l'emplacement de la position -1 reste nul
+        size = max(int(history), 1)
+        self._ring_sum = np.zeros((size, self.n_columns))
+        self._ring_offset = np.zeros((size, self.n_columns))
+        self._ring_count = np.zeros((size, self.n_columns), dtype=np.int64)
+        self._pending = None
+
+    @property
+    def history(self):
+        """Nombre de positions passées conservées dans le tampon."""
+        return len(self._ring_sum)
+
+    def _local_prefix(self, x, start):
+        """Préfixes locaux à chaque bloc, en reprenant le report courant."""
+        B = self.block_size
+        k = len(x)
+        out = np.empty_like(x)
+        head = 0
+        offset = start % B
+        if offset:
+            head = min(B - offset, k)
+            seg = np.concatenate([self._carry_sum[None, :], x[:head]])
+            out[:head] = np.add.accumulate(seg, axis=0)[1:]
+        n_full = (k - head) // B
+        if n_full:
+            stop = head + n_full * B
+            blocks = x[head:stop].reshape(n_full, B, self.n_columns)
+            out[head:stop] = np.add.accumulate(blocks, axis=1).reshape(-1, self.n_columns)
+            head = stop
+        if head < k:
+            out[head:] = np.add.accumulate(x[head:], axis=0)
+        return out
+
+    def _commit(self):
+        """Recopie le dernier chunk dans le tampon circulaire."""
+        if self._pending is None:
+            return
+        start, sums, offsets, first_block, counts = self._pending
+        size = self.history
+        keep = min(len(sums), size)
+        positions = np.arange(start + len(sums) - keep, start + len(sums))
+        slots = positions % size
+        self._ring_sum[slots] = sums[-keep:]
+        self._ring_offset[slots] = offsets[positions // self.block_size - first_block]
+        self._ring_count[slots] = counts[-keep:]
+        self._pending = None
+
+    def reserve(self, history):
+        """
+        Agrandit le tampon pour conserver au moins `history` positions.
+
+        Args:
+            history: Nombre de positions passées à conserver
+        """
+        self._commit()
+        size = self.history
+        if history <= size:
+            return
+        positions = np.arange(self.position - size, self.position)
+        old_slots = positions % size
+        new_slots = positions % history
+        for name in ('_ring_sum', '_ring_offset', '_ring_count'):
+            old = getattr(self, name)
+            new = np.zeros((history, self.n_columns), dtype=old.dtype)
+            new[new_slots] = old[old_slots]
+            setattr(self, name, new)
+
+    def extend(self, values):
+        """
+        Ajoute un chunk de valeurs à la suite de la série.
+
+        Args:
+            values: Tableau de forme (k, n_columns)
+        """
+        self._commit()
+        values = _as_2d(values)
+        if values.shape[1] != self.n_columns:
+            raise ValueError(
+                f"Nombre de colonnes incohérent: {values.shape[1]} au lieu de {self.n_columns}"
+            )
+        k = len(values)
+        if k == 0:
+            return
+        B = self.block_size
+        start = self.position
+        valid = ~np.isnan(values)
+        x = np.where(valid, values, 0.0)
+
+        sums = self._local_prefix(x, start)
+        counts = self._carry_count + np.cumsum(valid, axis=0)
+
+        # Décalage de chaque bloc = somme cumulée des blocs terminés
+        first_block = start // B
+        stop = start + k
+        tails = np.arange((first_block + 1) * B - 1, stop, B)
+        offsets = np.add.accumulate(
+            np.concatenate([self._block_offset[None, :], sums[tails - start]]), axis=0
+        )
+
+        self._pending = (start, sums, offsets, first_block, counts)
+        self.position = stop
+        self._carry_sum = sums[-1].copy()
+        self._block_offset = offsets[-1].copy()
+        self._carry_count = counts[-1].copy()
+
+    def lookup(self, positions):
+        """
+        Préfixe local, décalage de bloc et effectif aux positions demandées.
+
+        Args:
+            positions: Positions absolues (>= -1), dans l'historique ou le dernier chunk
+
+        Returns:
+            Tuple (préfixes, décalages, effectifs) de forme (len(positions), n_columns)
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        size = self.history
+        if self._pending is None:
+            start = self.position
+        else:
+            start, sums, offsets, first_block, counts = self._pending
+        if len(positions) and positions.min() < max(start - size, -1):
+            raise ValueError("Position hors de l'historique conservé")
+
+        slots = positions % size
+        out_sum = self._ring_sum[slots]
+        out_offset = self._ring_offset[slots]
+        out_count = self._ring_count[slots]
+        if self._pending is not None:
+            recent = positions >= start
+            if recent.any():
+                idx = positions[recent]
+                out_sum[recent] = sums[idx - start]
+                out_offset[recent] = offsets[idx // self.block_size - first_block]
+                out_count[recent] = counts[idx - start]
+        return out_sum, out_offset, out_count
+
+    def get_state(self):
+        """
+        Exporte l'état courant sous forme de dictionnaire sérialisable.
+
+        Returns:
+            Dictionnaire de scalaires et de tableaux numpy
+        """
+        self._commit()
+        return {
+            'block_size': self.block_size,
+            'n_columns': self.n_columns,
+            'position': self.position,
+            'carry_sum': self._carry_sum.copy(),
+            'block_offset': self._block_offset.copy(),
+            'carry_count': self._carry_count.copy(),
+            'ring_sum': self._ring_sum.copy(),
+            'ring_offset': self._ring_offset.copy(),
+            'ring_count': self._ring_count.copy(),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Reconstruit un moteur à partir d'un état exporté par get_state().
+
+        Args:
+            state: Dictionnaire d'état
+
+        Returns:
+            Instance de BlockPrefixSum prête à reprendre le flux
+        """
+        engine = cls(
+            n_columns=int(state['n_columns']),
+            block_size=int(state['block_size']),
+            history=len(state['ring_sum']),
+        )
+        engine.position = int(state['position'])
+        engine._carry_sum = np.array(state['carry_sum'], dtype=np.float64)
+        engine._block_offset = np.array(state['block_offset'], dtype=np.float64)
+        engine._carry_count = np.array(state['carry_count'], dtype=np.int64)
+        engine._ring_sum = np.array(state['ring_sum'], dtype=np.float64)
+        engine._ring_offset = np.array(state['ring_offset'], dtype=np.float64)
+        engine._ring_count = np.array(state['ring_count'], dtype=np.int64)
+        return engine
+
+    def window_sums(self, ends, starts, end_lookup=None):
+        """
+        Sommes et effectifs des fenêtres [starts, ends] (bornes incluses).
+
+        Args:
+            ends: Positions absolues de fin de fenêtre
+            starts: Positions absolues de début de fenêtre (>= 0)
+            end_lookup: Résultat de lookup(ends), à réutiliser entre plusieurs fenêtres
+
+        Returns:
+            Tuple (sommes, effectifs) de forme (len(ends), n_columns)
+        """
+        ends = np.asarray(ends, dtype=np.int64)
+        prev = np.asarray(starts, dtype=np.int64) - 1
+        B = self.block_size
+        if end_lookup is None:
+            end_lookup = self.lookup(ends)
+        end_sum, end_offset, end_count = end_lookup
+        prev_sum, _, prev_count = self.lookup(prev)
+
+        sums = end_sum - prev_sum
+        # Fenêtres à cheval sur plusieurs blocs : fin du bloc de départ,
+        # blocs intermédiaires complets, puis début du bloc d'arrivée
+        cross = np.nonzero(prev // B != ends // B)[0]
+        if len(cross):
+            tails = (prev[cross] // B + 1) * B - 1
+            tail_sum, _, _ = self.lookup(tails)
+            _, next_offset, _ = self.lookup(tails + 1)
+            sums[cross] = (
+                (tail_sum - prev_sum[cross]) + (end_offset[cross] - next_offset)
+            ) + end_sum[cross]
+        return sums, end_count - prev_count
+
+
+class RollingMeanBank:
+    """
+    Banque de moyennes glissantes : plusieurs fenêtres sur plusieurs colonnes.
+
+    Toutes les paires (colonne, fenêtre) partagent une seule passe de
+    sommes préfixes, vectorisée sur les colonnes.
+
+    Attributes:
+        windows: Tailles de fenêtre, dans l'ordre demandé
+        min_periods: Nombre minimal de valeurs valides (None = taille de la fenêtre)
+    """
+
+    def __init__(self, windows, min_periods=None, n_columns=1, block_size=None):
+        self.windows = tuple(int(w) for w in windows)
+        if not self.windows or min(self.windows) < 1:
+            raise ValueError("Les tailles de fenêtre doivent être positives")
+        self.min_periods = None if min_periods is None else int(min_periods)
+        max_window = max(self.windows)
+        self.engine = BlockPrefixSum(
+            n_columns=n_columns,
+            block_size=resolve_block_size(max_window, block_size),
+            history=max_window,
+        )
+
+    @property
+    def position(self):
+        """Nombre de points déjà traités."""
+        return self.engine.position
+
+    @property
+    def block_size(self):
+        """Taille des blocs de la grille."""
+        return self.engine.block_size
+
+    def get_state(self):
+        """
+        Exporte l'état de la banque (sérialisable par pickle ou np.savez).
+
+        Returns:
+            Dictionnaire d'état
+        """
+        state = self.engine.get_state()
+        state.update(windows=list(self.windows), min_periods=self.min_periods)
+        return state
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Reprend une banque de moyennes glissantes à partir d'un état exporté.
+
+        Args:
+            state: Dictionnaire retourné par get_state()
+
+        Returns:
+            Instance reprenant le flux
+        """
+        rolling = cls.__new__(cls)
+        RollingMeanBank.__init__(
+            rolling,
+            state['windows'],
+            state['min_periods'],
+            n_columns=int(state['n_columns']),
+            block_size=int(state['block_size']),
+        )
+        rolling.engine = BlockPrefixSum.from_state(state)
+        return rolling
+
+    def _means(self, values):
+        """Moyennes de forme (k, n_columns, n_windows) pour les nouveaux points."""
+        start = self.engine.position
+        self.engine.extend(values)
+        ends = np.arange(start, self.engine.position)
+        end_lookup = self.engine.lookup(ends)
+        means = np.empty((len(ends), self.engine.n_columns, len(self.windows)))
+        for j, window in enumerate(self.windows):
+            sums, counts = self.engine.window_sums(
+                ends, np.maximum(ends - window + 1, 0), end_lookup
+            )
+            min_periods = window if self.min_periods is None else self.min_periods
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means[:, :, j] = sums / counts
+            means[:, :, j][counts < max(min_periods, 1)] = np.nan
+        return means
+
+    def update(self, values):
+        """
+        Ajoute des valeurs et retourne les moyennes glissantes de chaque fenêtre.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Tableau (k, n_windows) pour une entrée 1-D, (k, n_columns, n_windows) sinon
+        """
+        values = np.asarray(values, dtype=np.float64)
+        means = self._means(values)
+        return means[:, 0, :] if values.ndim == 1 else means
+
+
+class RollingMean(RollingMeanBank):
+    """
+    Moyenne glissante à état reportable entre chunks.
+
+    Attributes:
+        window: Taille de la fenêtre
+        min_periods: Nombre minimal de valeurs valides par fenêtre
+    """
+
+    def __init__(self, window, min_periods=None, n_columns=1, block_size=None):
+        if int(window) < 1:
+            raise ValueError("La taille de fenêtre doit être positive")
+        self.window = int(window)
+        super().__init__(
+            [self.window],
+            self.window if min_periods is None else min_periods,
+            n_columns=n_columns,
+            block_size=block_size,
+        )
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Reprend une moyenne glissante à partir d'un état exporté.
+
+        Args:
+            state: Dictionnaire retourné par get_state()
+
+        Returns:
+            Instance de RollingMean
+        """
+        rolling = super().from_state(state)
+        rolling.window = rolling.windows[0]
+        return rolling
+
+    def update(self, values):
+        """
+        Ajoute des valeurs et retourne la moyenne glissante de chacune.
+
+        Le coût est proportionnel au nombre de nouvelles valeurs, pas à
+        la longueur de l'historique.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Moyennes glissantes des nouveaux points (même dimension que l'entrée)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        means = self._means(values)[:, :, 0]
+        return means.ravel() if values.ndim == 1 else means
+
+
+class RollingTimeMean:
+    """
+    Moyenne glissante sur une durée, pour des horodatages irréguliers.
+
+    La fenêtre du point t couvre ]t - durée, t] (convention pandas). Ses
+    bornes sont obtenues par searchsorted sur les horodatages, et sa somme
+    par le moteur de sommes préfixes par blocs : le coût est O(n) quelle
+    que soit la durée. Seuls les points encore couverts par la fenêtre du
+    dernier point sont conservés entre deux appels.
+
+    Attributes:
+        duration: Durée de la fenêtre (nanosecondes)
+        min_periods: Nombre minimal de valeurs valides par fenêtre
+    """
+
+    def __init__(self, duration, min_periods=None, n_columns=1, block_size=None):
+        self.duration = as_duration(duration)
+        self.min_periods = 1 if min_periods is None else int(min_periods)
+        self.engine = BlockPrefixSum(
+            n_columns=n_columns,
+            block_size=resolve_block_size(1, block_size),
+            history=1,
+        )
+        # Horodatages des positions [_times_start, position)
+        self._times = np.empty(0, dtype=np.int64)
+        self._times_start = 0
+
+    @property
+    def position(self):
+        """Nombre de points déjà traités."""
+        return self.engine.position
+
+    @property
+    def block_size(self):
+        """Taille des blocs de la grille."""
+        return self.engine.block_size
+
+    def get_state(self):
+        """
+        Exporte l'état du flux (sérialisable par pickle ou np.savez).
+
+        Returns:
+            Dictionnaire d'état
+        """
+        state = self.engine.get_state()
+        state.update(
+            kind='time',
+            duration=self.duration,
+            min_periods=self.min_periods,
+            times=self._times.copy(),
+            times_start=self._times_start,
+        )
+        return state
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Reprend une moyenne glissante temporelle à partir d'un état exporté.
+
+        Args:
+            state: Dictionnaire retourné par get_state()
+
+        Returns:
+            Instance de RollingTimeMean
+        """
+        rolling = cls(
+            pd.Timedelta(int(state['duration'])),
+            state['min_periods'],
+            n_columns=int(state['n_columns']),
+            block_size=int(state['block_size']),
+        )
+        rolling.engine = BlockPrefixSum.from_state(state)
+        rolling._times = np.array(state['times'], dtype=np.int64)
+        rolling._times_start = int(state['times_start'])
+        return rolling
+
+    def update(self, values, timestamps):
+        """
+        Ajoute des valeurs horodatées et retourne leur moyenne glissante.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+            timestamps: Horodatages croissants des nouvelles valeurs
+
+        Returns:
+            Moyennes glissantes des nouveaux points (même dimension que l'entrée)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        times = as_nanoseconds(timestamps)
+        if len(times) != len(values):
+            raise ValueError("Les horodatages et les valeurs doivent avoir la même longueur")
+        known = np.concatenate([self._times, times])
+        if np.any(np.diff(known) < 0):
+            raise ValueError("Les horodatages doivent être croissants")
+
+        start = self.engine.position
+        stop = start + len(values)
+        window_starts = self._times_start + np.searchsorted(
+            known, times - self.duration, side='right'
+        )
+        if len(times):
+            # L'historique doit couvrir la fenêtre du premier et du dernier point
+            self.engine.reserve(max(start - window_starts[0] + 1, stop - window_starts[-1] + 1))
+        self.engine.extend(values)
+        ends = np.arange(start, stop)
+        sums, counts = self.engine.window_sums(ends, window_starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        means[counts < max(self.min_periods, 1)] = np.nan
+
+        if len(times):
+            keep = window_starts[-1] - self._times_start
+            self._times = known[keep:]
+            self._times_start = int(window_starts[-1])
+        return means.ravel() if values.ndim == 1 else means
+
+
+def _moments(s1, s2, counts):
+    """Moyenne et somme des carrés des écarts d'un segment à partir de ses sommes."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(counts > 0, s1 / counts, 0.0)
+        m2 = np.where(counts > 0, s2 - s1 * mean, 0.0)
+    return mean, np.maximum(m2, 0.0)
+
+
+class RollingVariance:
+    """
+    Variance glissante stable, à état reportable entre chunks.
+
+    Les valeurs sont centrées sur une référence propre à chaque bloc de
+    la grille (la première valeur valide du bloc). Une fenêtre couvre au
+    plus deux blocs : les moments de chaque segment sont fusionnés par la
+    mise à jour de Welford/Chan, ce qui évite la cancellation de la
+    formule naïve E[x²] - E[x]² sur des séries à forte moyenne.
+
+    Attributes:
+        window: Taille de la fenêtre
+        min_periods: Nombre minimal de valeurs valides par fenêtre
+        ddof: Degrés de liberté retranchés au dénominateur
+    """
+
+    def __init__(self, window, min_periods=None, ddof=1, n_columns=1, block_size=None):
+        if int(window) < 1:
+            raise ValueError("La taille de fenêtre doit être positive")
+        self.window = int(window)
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        self.ddof = int(ddof)
+        self.n_columns = int(n_columns)
+        # Le moteur traite côte à côte les écarts centrés et leurs carrés
+        if block_size is None:
+            block_size = VARIANCE_BLOCK_SIZE
+        self.engine = BlockPrefixSum(
+            n_columns=2 * self.n_columns,
+            block_size=resolve_block_size(self.window, block_size),
+            history=self.window,
+        )
+        # Références du bloc courant et du bloc précédent
+        self._ref_current = np.full(self.n_columns, np.nan)
+        self._ref_previous = np.full(self.n_columns, np.nan)
+
+    @property
+    def position(self):
+        """Nombre de points déjà traités."""
+        return self.engine.position
+
+    @property
+    def block_size(self):
+        """Taille des blocs de la grille."""
+        return self.engine.block_size
+
+    def _block_references(self, values, start):
+        """Références des blocs [premier bloc - 1, ..., dernier bloc] du chunk."""
+        B = self.engine.block_size
+        k = len(values)
+        first_block = start // B
+        bounds = np.arange((first_block + 1) * B, start + k, B) - start
+        seg_starts = np.concatenate([[0], bounds])
+
+        valid = ~np.isnan(values)
+        idx = np.where(valid, np.arange(k)[:, None], k)
+        first_valid = np.minimum.reduceat(idx, seg_starts, axis=0)
+        found = first_valid < k
+        cols = np.broadcast_to(np.arange(self.n_columns), first_valid.shape)
+        refs = np.where(found, values[np.minimum(first_valid, k - 1), cols], np.nan)
+
+        if start % B:
+            # Le premier bloc est commencé : sa référence est déjà fixée si possible
+            refs[0] = np.where(np.isnan(self._ref_current), refs[0], self._ref_current)
+            before = self._ref_previous
+        else:
+            before = self._ref_current
+        return np.vstack([before[None, :], refs]), first_block
+
+    def update(self, values):
+        """
+        Ajoute des valeurs et retourne la variance glissante de chacune.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Variances glissantes des nouveaux points (même dimension que l'entrée)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = _as_2d(values)
+        k = len(x)
+        if k == 0:
+            return values.copy()
+        p = self.n_columns
+        B = self.engine.block_size
+        start = self.engine.position
+        refs, first_block = self._block_references(x, start)
+
+        ends = np.arange(start, start + k)
+        deviations = x - refs[ends // B - first_block + 1]
+        self.engine.extend(np.hstack([deviations, deviations * deviations]))
+
+        prev = np.maximum(ends - self.window + 1, 0) - 1
+        end_sum, _, end_count = self.engine.lookup(ends)
+        prev_sum, _, prev_count = self.engine.lookup(prev)
+        end_count, prev_count = end_count[:, :p], prev_count[:, :p]
+        counts = end_count - prev_count
+
+        # Segment A : fin du bloc de départ ; segment B : début du bloc d'arrivée
+        cross = prev // B != ends // B
+        tails = np.where(cross, (prev // B + 1) * B - 1, prev)
+        tail_sum, _, tail_count = self.engine.lookup(tails)
+        tail_count = tail_count[:, :p]
+        sum_a = tail_sum - prev_sum
+        sum_b = np.where(cross[:, None], end_sum, end_sum - tail_sum)
+        count_a = tail_count - prev_count
+        count_b = end_count - tail_count
+
+        mean_a, m2_a = _moments(sum_a[:, :p], sum_a[:, p:], count_a)
+        mean_b, m2_b = _moments(sum_b[:, :p], sum_b[:, p:], count_b)
+        ref_a = refs[np.maximum(prev, 0) // B - first_block + 1]
+        ref_b = refs[ends // B - first_block + 1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = (ref_b + mean_b) - (ref_a + mean_a)
+            m2 = m2_a + m2_b + np.where(
+                (count_a > 0) & (count_b > 0), delta * delta * count_a * count_b / counts, 0.0
+            )
+            variances = m2 / (counts - self.ddof)
+        variances[(counts < max(self.min_periods, 1)) | (counts <= self.ddof)] = np.nan
+
+        last = len(refs) - 1
+        self._ref_current = refs[last].copy()
+        self._ref_previous = refs[last - 1].copy()
+        return variances.ravel() if values.ndim == 1 else variances
+
+
+class RollingExtremum:
+    """
+    Minimum ou maximum glissant en O(n), à état reportable entre chunks.
+
+    Utilise l'algorithme de van Herk/Gil-Werman : minima préfixes et
+    suffixes par blocs de la taille de la fenêtre, combinés deux à deux.
+    C'est l'équivalent vectorisé de la file monotone (coût constant par
+    point, quelle que soit la fenêtre).
+
+    Attributes:
+        window: Taille de la fenêtre
+        min_periods: Nombre minimal de valeurs valides par fenêtre
+        kind: 'min' ou 'max'
+    """
+
+    def __init__(self, window, min_periods=None, kind='min', n_columns=1):
+        if int(window) < 1:
+            raise ValueError("La taille de fenêtre doit être positive")
+        if kind not in ('min', 'max'):
+            raise ValueError(f"Extremum {kind} non supporté")
+        self.window = int(window)
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        self.kind = kind
+        self.n_columns = int(n_columns)
+        self.position = 0
+        self._tail = np.empty((0, self.n_columns))
+
+    @property
+    def block_size(self):
+        """Alignement des chunks : seul un halo de window - 1 points est nécessaire."""
+        return self.window
+
+    def update(self, values):
+        """
+        Ajoute des valeurs et retourne l'extremum glissant de chacune.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Extrema glissants des nouveaux points (même dimension que l'entrée)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = _as_2d(values)
+        k = len(x)
+        w = self.window
+        func, fill = (np.minimum, np.inf) if self.kind == 'min' else (np.maximum, -np.inf)
+
+        y = np.vstack([self._tail, x])
+        m = len(y)
+        n_halo = len(self._tail)
+        valid = ~np.isnan(y)
+        y = np.where(valid, y, fill)
+
+        n_blocks = -(-m // w)
+        padded = np.full((n_blocks * w, self.n_columns), fill)
+        padded[:m] = y
+        padded = padded.reshape(n_blocks, w, self.n_columns)
+        prefix = func.accumulate(padded, axis=1).reshape(-1, self.n_columns)[:m]
+        suffix = func.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1, self.n_columns)[:m]
+
+        ends = np.arange(n_halo, m)
+        # Les points du halo ont été conservés de sorte que le bloc 0 commence
+        # au début d'une fenêtre complète ou au début de la série
+        result = prefix[ends].copy()
+        full = ends >= w - 1
+        result[full] = func(suffix[ends[full] - w + 1], prefix[ends[full]])
+
+        cumulative = np.concatenate([np.zeros((1, self.n_columns), dtype=np.int64),
+                                     np.cumsum(valid, axis=0)])
+        counts = cumulative[ends + 1] - cumulative[np.maximum(ends + 1 - w, 0)]
+        result[counts < max(self.min_periods, 1)] = np.nan
+
+        self.position += k
+        self._tail = np.where(valid, y, np.nan)[max(m - (w - 1), 0):]
+        return result.ravel() if values.ndim == 1 else result
+
+
+class RollingQuantile:
+    """
+    Quantiles glissants (médiane incluse), à état reportable entre chunks.
+
+    Les fenêtres complètes sans valeur manquante passent par le filtre de
+    rang 1-D de scipy.ndimage (implémenté en C, O(log w) par point) ; les
+    autres sont calculées en faisant glisser une liste triée maintenue par
+    bisection. Tous les quantiles demandés sont lus dans la même passe et
+    interpolés linéairement, comme pandas.
+
+    Attributes:
+        window: Taille de la fenêtre
+        quantiles: Quantiles demandés (entre 0 et 1)
+        min_periods: Nombre minimal de valeurs valides par fenêtre
+    """
+
+    def __init__(self, window, quantiles=0.5, min_periods=None, n_columns=1):
+        if int(window) < 1:
+            raise ValueError("La taille de fenêtre doit être positive")
+        self.window = int(window)
+        self.scalar = np.ndim(quantiles) == 0
+        self.quantiles = np.atleast_1d(np.asarray(quantiles, dtype=np.float64))
+        if ((self.quantiles < 0) | (self.quantiles > 1)).any():
+            raise ValueError("Les quantiles doivent être compris entre 0 et 1")
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        self.n_columns = int(n_columns)
+        self.position = 0
+        self._tail = np.empty((0, self.n_columns))
+
+    @property
+    def block_size(self):
+        """Alignement des chunks : seul un halo de window - 1 points est nécessaire."""
+        return self.window
+
+    def _slide_sorted(self, y, first, stop, out):
+        """Quantiles des fenêtres se terminant en [first, stop) par liste triée."""
+        w = self.window
+        values = y.tolist()
+        window = deque(values[max(first - w + 1, 0):first])
+        ordered = sorted(v for v in window if v == v)
+        min_count = max(self.min_periods, 1)
+        quantiles = self.quantiles.tolist()
+        for e in range(first, stop):
+            if len(window) == w:
+                old = window.popleft()
+                if old == old:
+                    del ordered[bisect_left(ordered, old)]
+            value = values[e]
+            window.append(value)
+            if value == value:
+                insort(ordered, value)
+            n = len(ordered)
+            if n < min_count:
+                continue
+            for j, q in enumerate(quantiles):
+                rank = q * (n - 1)
+                lo = int(rank)
+                frac = rank - lo
+                low = ordered[lo]
+                out[e, j] = low if frac == 0 else low + (ordered[lo + 1] - low) * frac
+
+    def _rank_filter(self, y, ends, out):
+        """Quantiles des fenêtres complètes sans valeur manquante se terminant en ends, par filtre de rang."""
+        w = self.window
+        # Les fenêtres lues ne contiennent pas de NaN ; les remplacer évite
+        # de perturber le filtre sur les autres positions
+        y = np.where(np.isnan(y), 0.0, y)
+        # Filtre centré : la fenêtre [e - w + 1, e] est centrée en e - w + 1 + w // 2
+        centers = ends - w + 1 + w // 2
+        ranks = {}
+        for j, q in enumerate(self.quantiles):
+            rank = q * (w - 1)
+            lo = int(rank)
+            frac = rank - lo
+            for r in (lo, lo + 1) if frac else (lo,):
+                if r not in ranks:
+                    ranks[r] = ndimage.rank_filter(y, rank=r, size=w, mode='nearest')[centers]
+            low = ranks[lo]
+            out[ends, j] = low if frac == 0 else low + (ranks[lo + 1] - low) * frac
+
+    def _full_windows(self, col, first, col_out):
+        """Quantiles des fenêtres complètes se terminant en [first, len(col))."""
+        w = self.window
+        m = len(col)
+        ends = np.arange(first, m)
+        missing = np.concatenate([[0], np.cumsum(np.isnan(col))])
+        dirty = missing[ends + 1] - missing[ends + 1 - w] > 0
+        if not dirty.all():
+            self._rank_filter(col, ends[~dirty], col_out)
+        # Liste triée seulement sur les suites de fenêtres contenant un NaN
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], dirty.astype(np.int8), [0]])))
+        for start, stop in edges.reshape(-1, 2):
+            self._slide_sorted(col, ends[start], ends[stop - 1] + 1, col_out)
+
+    def update(self, values):
+        """
+        Ajoute des valeurs et retourne les quantiles glissants de chacune.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Tableau (k,) ou (k, n_quantiles) pour une entrée 1-D ;
+            (k, n_columns) ou (k, n_columns, n_quantiles) sinon
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = _as_2d(values)
+        w = self.window
+        y = np.vstack([self._tail, x])
+        m = len(y)
+        n_halo = len(self._tail)
+        out = np.full((m, self.n_columns, len(self.quantiles)), np.nan)
+        for column in range(self.n_columns):
+            col = y[:, column]
+            col_out = out[:, column, :]
+            # Fenêtres partielles (début de série) : toujours par liste triée
+            first_full = max(n_halo, w - 1)
+            if first_full > n_halo:
+                self._slide_sorted(col, n_halo, min(first_full, m), col_out)
+            if first_full >= m:
+                continue
+            if len(x) >= w:
+                self._full_windows(col, first_full, col_out)
+            else:
+                self._slide_sorted(col, first_full, m, col_out)
+        self.position += len(x)
+        self._tail = y[max(m - (w - 1), 0):]
+        out = out[n_halo:]
+        if self.scalar:
+            out = out[:, :, 0]
+        return out[:, 0] if values.ndim == 1 else out
@@ -66,10 +66,59 @@ class FrequenceModule(BaseCapsule):
         """
         pass 
 
+from functools import partial
+from collections.abc import Iterator
+from itertools import islice
 import numpy as np
 import pandas as pd
 from core.AbstractClassBase import StatisticalModule
 from utils.parallel import ParallelProcessor
+from .counts import (
+    FrequencyCounter, FrequencyTable, code_counts, contingency_table, count_values, factorize
+)
+from .histogram import BinnedHistogram, TDigest
+from .sketches import FrequencySketch
+
+def _is_chunk_iterator(data):
+    """
+    Indique si data est un flux de chunks plutôt qu'une série en mémoire.
+
+    Seuls les itérateurs (générateur, pd.read_csv(..., chunksize=...))
+    sont des flux : les conteneurs itérables (Categorical, ExtensionArray,
+    liste...) sont des séries.
+    """
+    return isinstance(data, Iterator)
+
+
+def _select_column(chunk, column=None):
+    """Extrait la colonne à compter d'un chunk DataFrame."""
+    if isinstance(chunk, pd.DataFrame):
+        if column is not None:
+            return chunk[column]
+        if chunk.shape[1] != 1:
+            raise ValueError("Indiquez la colonne à compter (column=...)")
+        return chunk.iloc[:, 0]
+    return chunk
+
+
+def _encode_column(series, dropna=True):
+    """Code une colonne et compte ses modalités (exécuté dans un worker)."""
+    codes, categories = factorize(series, dropna)
+    return codes, categories, code_counts(codes, len(categories))
+
+
+def _bin_chunk(chunk, start, stop, bins, log, compression):
+    """Histogramme et t-digest d'un chunk (exécuté dans un worker)."""
+    return (
+        BinnedHistogram(start, stop, bins, log).update(chunk),
+        TDigest(compression).update(chunk),
+    )
+
+
+def _sketch_chunk(chunk, k, epsilon, delta, error):
+    """Résumé approximatif d'un chunk (exécuté dans un worker)."""
+    return FrequencySketch(k, epsilon, delta, error).update(chunk)
+
 
 class FrequenceModule(StatisticalModule):
     """Module pour l'analyse de fréquence."""
@@ -77,19 +126,40 @@ class FrequenceModule(StatisticalModule):
     def __init__(self, n_jobs: int = -1):
         super().__init__()
         self.parallel_processor = ParallelProcessor(n_jobs=n_jobs)
+        self.counter = None
+        self.sketch = None
+        self.crosstabs = {}
+        self.histogram = None
+        self.digest = None
     
-    def process(self, data, normalize=False, **kwargs):
+    def process(self, data, normalize=False, column=None, dropna=True, **kwargs):
         """
         Calcule les fréquences des valeurs.
         
+        Un itérateur de chunks (générateur, pd.read_csv(..., chunksize=...))
+        est compté chunk par chunk, sans jamais charger toute la série.
+        
         Args:
-            data: Données d'entrée (numpy array ou pandas Series)
+            data: Données d'entrée (numpy array, pandas Series ou itérateur de chunks)
             normalize: Si True, retourne les fréquences relatives
+            column: Colonne à compter lorsque les chunks sont des DataFrames
+            dropna: Si True, ignore les valeurs manquantes
             **kwargs: Arguments additionnels
             
         Returns:
-            DataFrame avec les fréquences
+            FrequencyTable (effectifs et modalités) ; les fréquences relatives,
+            cumulées, etc. en sont dérivées à la demande, sans relire les données
         """
+        if isinstance(data, pd.DataFrame) and column is None:
+            return self.process_dataframe(data, normalize=normalize, dropna=dropna, **kwargs)
+        if isinstance(data, pd.DataFrame):
+            data = data[column]
+        if _is_chunk_iterator(data):
+            self.counter = FrequencyCounter(dropna=dropna)
+            self.process_chunks(data, column=column)
+            self.result = self.counter.finalize(normalize)
+            return self.result
+        
         self.validate_data(data)
         
         if isinstance(data, pd.Series):
@@ -97,35 +167,281 @@ class FrequenceModule(StatisticalModule):
         else:
             series = pd.Series(data)
         
-        # Calcul des fréquences
-        freq = series.value_counts(normalize=normalize)
-        cum_freq = freq.cumsum()
+        # Un seul comptage ; les vues dérivées sont calculées à la demande
+        self.result = FrequencyTable(count_values(series, dropna), normalize=normalize)
+        
+        return self.result
+    
+    def process_dataframe(self, data, columns=None, pairs=None, sparse=False,
+                          normalize=False, dropna=True, **kwargs):
+        """
+        Fréquences de plusieurs colonnes et tableaux de contingence de paires.
+        
+        Chaque colonne est codée une seule fois en entiers (pd.factorize)
+        puis comptée par np.bincount, les colonnes étant réparties entre
+        les workers. Les paires sont croisées par les codes combinés
+        a * K_b + b, sans repasser par pd.crosstab.
+        
+        Args:
+            data: DataFrame d'entrée
+            columns: Colonnes à compter (par défaut toutes)
+            pairs: Paires (a, b) de colonnes à croiser
+            sparse: Si True, tableaux de contingence creux
+            normalize: Vue par défaut de to_frame() des tables
+            dropna: Si True, ignore les valeurs manquantes
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            Dictionnaire {colonne: FrequencyTable}
+        """
+        self.validate_data(data)
+        pairs = [tuple(pair) for pair in (pairs or [])]
+        columns = list(data.columns if columns is None else columns)
+        for pair in pairs:
+            columns.extend(column for column in pair if column not in columns)
+        
+        encoded = self.parallel_processor.parallel_map(
+            partial(_encode_column, dropna=dropna), [data[column] for column in columns]
+        )
+        encoded = dict(zip(columns, encoded))
+        
+        self.result = {
+            column: FrequencyTable(counts, categories, normalize)
+            for column, (_, categories, counts) in encoded.items()
+        }
+        self.crosstabs = {}
+        for a, b in pairs:
+            codes_a, categories_a, _ = encoded[a]
+            codes_b, categories_b, _ = encoded[b]
+            table = contingency_table(codes_a, categories_a, codes_b, categories_b, sparse)
+            table.index.name, table.columns.name = a, b
+            self.crosstabs[(a, b)] = table
+        return self.result
+    
+    def get_contingence(self, a, b):
+        """
+        Retourne le tableau de contingence d'une paire calculée par process_dataframe().
+        
+        Args:
+            a: Colonne en lignes
+            b: Colonne en colonnes
+            
+        Returns:
+            DataFrame des effectifs croisés
+        """
+        if (a, b) in self.crosstabs:
+            return self.crosstabs[(a, b)]
+        if (b, a) in self.crosstabs:
+            return self.crosstabs[(b, a)].T
+        raise ValueError(f"Paire ({a}, {b}) non calculée : passez-la dans pairs")
+    
+    def process_chunks(self, chunks, column=None):
+        """
+        Compte un flux de chunks en parallèle, par vagues de n_jobs chunks.
+        
+        Chaque chunk produit une table partielle, fusionnée dans l'ordre des
+        chunks : seuls n_jobs chunks et la table des valeurs distinctes
+        sont en mémoire à un instant donné.
+        
+        Args:
+            chunks: Itérable de chunks (Series, arrays ou DataFrames)
+            column: Colonne à compter lorsque les chunks sont des DataFrames
+            
+        Returns:
+            Accumulateur d'effectifs mis à jour
+        """
+        if self.counter is None:
+            self.counter = FrequencyCounter()
+        count = partial(count_values, dropna=self.counter.dropna)
+        for chunk, table in self._map_waves(count, chunks, column):
+            self.counter.add_counts(table, len(chunk))
+        return self.counter
+    
+    def _map_waves(self, func, chunks, column=None):
+        """
+        Applique func aux chunks en parallèle, par vagues de n_jobs chunks.
+        
+        Produit les couples (chunk, résultat) dans l'ordre des chunks.
+        """
+        chunks = (_select_column(chunk, column) for chunk in chunks)
+        n_jobs = max(1, self.parallel_processor.n_jobs)
+        while True:
+            wave = list(islice(chunks, n_jobs))
+            if not wave:
+                break
+            yield from zip(wave, self.parallel_processor.parallel_map(func, wave))
+    
+    def _as_chunks(self, data):
+        """Découpe une série en mémoire en n_jobs chunks ; un itérateur est rendu tel quel."""
+        if _is_chunk_iterator(data):
+            return data
+        self.validate_data(data)
+        series = data if isinstance(data, (pd.Series, pd.DataFrame)) else pd.Series(data)
+        n_parts = max(1, self.parallel_processor.n_jobs)
+        bounds = np.linspace(0, len(series), n_parts + 1).astype(int)
+        return [series.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    
+    def process_approx(self, data, k=100, epsilon=1e-4, delta=1e-3, error=0.01,
+                       column=None, **kwargs):
+        """
+        Fréquences approximatives à mémoire fixe pour les colonnes à forte cardinalité.
+        
+        Un Count-Min Sketch estime les effectifs (erreur <= epsilon * N avec
+        probabilité 1 - delta), un résumé de Misra-Gries retient les k
+        valeurs les plus fréquentes et un HyperLogLog estime le nombre de
+        valeurs distinctes (erreur relative ~ error). Les résumés des
+        chunks sont calculés en parallèle puis fusionnés ; self.sketch peut
+        être sérialisé (to_bytes) et fusionné avec d'autres résumés.
         
-        # Création du DataFrame de résultats
-        self.result = pd.DataFrame({
-            'Fréquence': freq,
-            'Fréquence Cumulée': cum_freq
-        })
+        Args:
+            data: Données d'entrée (Series, array ou itérateur de chunks)
+            k: Nombre de valeurs fréquentes suivies
+            epsilon: Erreur relative du Count-Min Sketch
+            delta: Probabilité de dépassement de l'erreur
+            error: Erreur relative visée pour le nombre de valeurs distinctes
+            column: Colonne à compter lorsque les chunks sont des DataFrames
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            DataFrame des k valeurs les plus fréquentes (effectifs estimés)
+        """
+        build = partial(_sketch_chunk, k=k, epsilon=epsilon, delta=delta, error=error)
+        self.sketch = FrequencySketch(k, epsilon, delta, error)
+        for _, sketch in self._map_waves(build, self._as_chunks(data), column):
+            self.sketch.merge(sketch)
+        self.result = self.sketch.top(k)
+        return self.result
+    
+    def process_bins(self, data, bins=50, range=None, log=False, compression=200,
+                     column=None, **kwargs):
+        """
+        Distribution d'une variable continue en une passe et en mémoire bornée.
         
-        if normalize:
-            self.result.columns = ['Fréquence Relative', 'Fréquence Relative Cumulée']
+        Les valeurs sont réparties dans des classes fixes (linéaires ou
+        logarithmiques) par np.bincount sur les indices de classe, et
+        résumées par un t-digest pour les quantiles (voir get_quantiles).
+        Les résumés des chunks sont calculés en parallèle puis fusionnés.
         
+        Args:
+            data: Données d'entrée (Series, array ou itérateur de chunks)
+            bins: Nombre de classes
+            range: Bornes (min, max) des classes ; requises pour un itérateur
+            log: Si True, classes espacées logarithmiquement
+            compression: Compression du t-digest (précision des quantiles)
+            column: Colonne à résumer lorsque les chunks sont des DataFrames
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            FrequencyTable des classes (IntervalIndex)
+        """
+        if range is None:
+            if _is_chunk_iterator(data):
+                raise ValueError("range est requis pour un itérateur de chunks")
+            values = np.asarray(_select_column(data, column), dtype=np.float64)
+            range = (np.nanmin(values), np.nanmax(values))
+            if range[0] == range[1]:
+                range = (range[0] - 0.5, range[1] + 0.5)
+        
+        build = partial(_bin_chunk, start=range[0], stop=range[1], bins=bins, log=log,
+                        compression=compression)
+        self.histogram = BinnedHistogram(range[0], range[1], bins, log)
+        self.digest = TDigest(compression)
+        for _, (histogram, digest) in self._map_waves(build, self._as_chunks(data), column):
+            self.histogram.merge(histogram)
+            self.digest.merge(digest)
+        self.result = self.histogram.to_table()
+        return self.result
+    
+    def get_quantiles(self, q=(0.25, 0.5, 0.75)):
+        """
+        Retourne les quantiles approximatifs estimés par process_bins().
+        
+        Args:
+            q: Quantile(s) entre 0 et 1
+            
+        Returns:
+            Quantile(s) estimé(s)
+        """
+        if self.digest is None:
+            raise ValueError("Exécutez d'abord process_bins()")
+        return self.digest.quantile(q)
+    
+    def get_cardinalite_estimee(self):
+        """Retourne le nombre estimé de valeurs distinctes (process_approx)."""
+        if self.sketch is None:
+            raise ValueError("Exécutez d'abord process_approx()")
+        return self.sketch.distinct()
+    
+    def partial_process(self, chunk, column=None, dropna=True, **kwargs):
+        """
+        Ajoute un chunk aux effectifs en cours, sans calculer les fréquences.
+        
+        Args:
+            chunk: Chunk de valeurs (Series, array ou DataFrame)
+            column: Colonne à compter si le chunk est un DataFrame
+            dropna: Si True, ignore les valeurs manquantes (premier appel)
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            Accumulateur d'effectifs mis à jour
+        """
+        if self.counter is None:
+            self.counter = FrequencyCounter(dropna=dropna)
+        return self.counter.update(_select_column(chunk, column))
+    
+    def merge(self, other):
+        """
+        Fusionne les effectifs d'un autre FrequenceModule (ou FrequencyCounter).
+        
+        Args:
+            other: Module ou accumulateur ayant compté d'autres chunks
+        """
+        counter = other.counter if isinstance(other, FrequenceModule) else other
+        if self.counter is None:
+            self.counter = FrequencyCounter(dropna=counter.dropna)
+        self.counter.merge(counter)
+    
+    def finalize(self, normalize=False):
+        """
+        Calcule les fréquences à partir des effectifs accumulés.
+        
+        Args:
+            normalize: Si True, to_frame() retourne les fréquences relatives
+            
+        Returns:
+            FrequencyTable
+        """
+        if self.counter is None:
+            raise ValueError("Aucun effectif accumulé : appelez d'abord partial_process()")
+        self.result = self.counter.finalize(normalize)
+        return self.result
+    
+    def _table(self):
+        """Table de fréquences courante."""
+        if not isinstance(self.result, FrequencyTable):
+            raise ValueError("Exécutez d'abord process()")
         return self.result
     
     def get_frequence_absolue(self):
         """Retourne les fréquences absolues."""
-        if self.result is None:
-            raise ValueError("Exécutez d'abord process()")
-        return self.result['Fréquence']
+        return self._table().absolute
     
     def get_frequence_cumulee(self):
         """Retourne les fréquences cumulées."""
-        if self.result is None:
-            raise ValueError("Exécutez d'abord process()")
-        return self.result['Fréquence Cumulée']
+        return self._table().cumulative
     
     def get_frequence_relative(self):
-        """Retourne les fréquences relatives."""
-        if self.result is None:
-            raise ValueError("Exécutez d'abord process()")
-        return self.process(self.data, normalize=True)['Fréquence Relative'] 
\ No newline at end of file
+        """Retourne les fréquences relatives (dérivées des effectifs, sans nouveau comptage)."""
+        return self._table().relative
+    
+    def get_frequence_relative_cumulee(self):
+        """Retourne les fréquences relatives cumulées."""
+        return self._table().cumulative_relative
+    
+    def get_top(self, k=10):
+        """Retourne les k modalités les plus fréquentes."""
+        return self._table().top(k)
+    
+    def get_rang_centile(self):
+        """Retourne le rang centile de chaque modalité (modalités ordonnables)."""
+        return self._table().percentile_rank 
\ No newline at end of file
@@ -0,0 +1,342 @@
+'''
+=====================================================================
+File : counts.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Tables de comptage partielles et fusionnables pour FrequenceModule.
+
+Chaque chunk produit une table (valeur -> effectif) ; les tables se
+fusionnent de façon associative, si bien que les chunks peuvent être
+comptés dans n'importe quel regroupement (threads, processus) avant la
+finalisation. La mémoire est proportionnelle au nombre de valeurs
+distinctes, pas au nombre de lignes.
+
+tags : module, stats, frequence
+=====================================================================
+'''
+
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+
+
+def count_values(values, dropna=True):
+    """
+    Compte les valeurs d'un chunk, dans l'ordre de première apparition.
+
+    Args:
+        values: Valeurs du chunk (Series, array, liste)
+        dropna: Si True, ignore les valeurs manquantes
+
+    Returns:
+        Series d'effectifs int64 indexée par les valeurs
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    return series.value_counts(sort=False, dropna=dropna).astype(np.int64)
+
+
+def merge_counts(tables, dropna=True):
+    """
+    Fusionne des tables d'effectifs (opération associative).
+
+    L'ordre de première apparition est conservé lorsque les tables sont
+    fusionnées dans l'ordre des chunks.
+
+    Args:
+        tables: Tables produites par count_values
+        dropna: Si False, conserve la modalité « valeur manquante »
+
+    Returns:
+        Table d'effectifs fusionnée
+    """
+    tables = [t for t in tables if t is not None and len(t)]
+    if not tables:
+        return pd.Series(dtype=np.int64)
+    if len(tables) == 1:
+        return tables[0]
+    merged = pd.concat(tables)
+    return merged.groupby(level=0, sort=False, dropna=dropna).sum().astype(np.int64)
+
+
+def factorize(values, dropna=True):
+    """
+    Code les valeurs en entiers (ordre de première apparition).
+
+    Args:
+        values: Valeurs (Series, array, liste)
+        dropna: Si True, les valeurs manquantes reçoivent le code -1 ;
+            sinon elles forment une dernière modalité
+
+    Returns:
+        Tuple (codes, modalités)
+    """
+    codes, categories = pd.factorize(values)
+    categories = pd.Index(categories)
+    missing = codes < 0
+    if not dropna and missing.any():
+        codes = np.where(missing, len(categories), codes)
+        categories = categories.append(pd.Index([np.nan]))
+    return codes, categories
+
+
+def code_counts(codes, n_categories):
+    """
+    Effectifs de chaque code par np.bincount (codes négatifs ignorés).
+
+    Args:
+        codes: Codes entiers produits par factorize
+        n_categories: Nombre de modalités
+
+    Returns:
+        Tableau int64 des effectifs
+    """
+    codes = np.asarray(codes)
+    return np.bincount(codes[codes >= 0], minlength=n_categories).astype(np.int64)
+
+
+def frequency_table(values, dropna=True, normalize=False):
+    """
+    Table de fréquences d'une colonne par codes entiers et np.bincount.
+
+    Args:
+        values: Valeurs de la colonne
+        dropna: Si True, ignore les valeurs manquantes
+        normalize: Vue par défaut de to_frame()
+
+    Returns:
+        FrequencyTable
+    """
+    codes, categories = factorize(values, dropna)
+    return FrequencyTable(code_counts(codes, len(categories)), categories, normalize)
+
+
+def contingency_table(codes_a, categories_a, codes_b, categories_b, sparse=False):
+    """
+    Tableau de contingence de deux colonnes codées, via les codes combinés a * K_b + b.
+
+    Args:
+        codes_a: Codes de la première colonne
+        categories_a: Modalités de la première colonne
+        codes_b: Codes de la seconde colonne
+        categories_b: Modalités de la seconde colonne
+        sparse: Si True, DataFrame creux (seules les paires observées sont stockées)
+
+    Returns:
+        DataFrame des effectifs (lignes : modalités de a, colonnes : modalités de b)
+    """
+    codes_a = np.asarray(codes_a, dtype=np.int64)
+    codes_b = np.asarray(codes_b, dtype=np.int64)
+    valid = (codes_a >= 0) & (codes_b >= 0)
+    n_rows, n_cols = len(categories_a), len(categories_b)
+    combined = codes_a[valid] * n_cols + codes_b[valid]
+    if sparse:
+        pairs, counts = np.unique(combined, return_counts=True)
+        matrix = coo_matrix(
+            (counts.astype(np.int64), (pairs // n_cols, pairs % n_cols)), shape=(n_rows, n_cols)
+        ).tocsr()
+        return pd.DataFrame.sparse.from_spmatrix(matrix, index=categories_a, columns=categories_b)
+    counts = np.bincount(combined, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+    return pd.DataFrame(counts.astype(np.int64), index=categories_a, columns=categories_b)
+
+
+class FrequencyTable:
+    """
+    Résultat compact d'un comptage : un tableau d'effectifs et l'index des modalités.
+
+    Les vues dérivées (fréquences relatives, cumulées, top-k, rangs
+    centiles, ordre inverse) sont calculées à la première demande puis
+    mémorisées : consulter plusieurs vues ne relit jamais les données.
+
+    Attributes:
+        counts: Effectifs int64, dans l'ordre des modalités
+        categories: Modalités (pd.Index)
+        total: Effectif total
+        normalize: Vue par défaut de to_frame() (relative si True)
+    """
+
+    COLUMNS = {
+        'Fréquence': 'absolute',
+        'Fréquence Cumulée': 'cumulative',
+        'Fréquence Relative': 'relative',
+        'Fréquence Relative Cumulée': 'cumulative_relative',
+        'Rang Centile': 'percentile_rank',
+    }
+
+    def __init__(self, counts, categories=None, normalize=False):
+        if categories is None:
+            categories = counts.index
+            counts = counts.to_numpy()
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.categories = pd.Index(categories)
+        if len(self.counts) != len(self.categories):
+            raise ValueError("Les effectifs et les modalités doivent avoir la même longueur")
+        self.total = int(self.counts.sum())
+        self.normalize = normalize
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __getitem__(self, column):
+        if column not in self.COLUMNS:
+            raise KeyError(column)
+        return getattr(self, self.COLUMNS[column])
+
+    @cached_property
+    def _order(self):
+        """Permutation par effectif décroissant (stable : ordre d'apparition)."""
+        return np.argsort(-self.counts, kind='stable')
+
+    @cached_property
+    def absolute(self):
+        """Effectifs par ordre décroissant."""
+        return pd.Series(
+            self.counts[self._order], index=self.categories[self._order], name='Fréquence'
+        )
+
+    @cached_property
+    def relative(self):
+        """Fréquences relatives par ordre décroissant."""
+        total = self.total if self.total else np.nan
+        return (self.absolute / total).rename('Fréquence Relative')
+
+    @cached_property
+    def cumulative(self):
+        """Effectifs cumulés par ordre décroissant."""
+        return self.absolute.cumsum().rename('Fréquence Cumulée')
+
+    @cached_property
+    def cumulative_relative(self):
+        """Fréquences relatives cumulées par ordre décroissant."""
+        return self.relative.cumsum().rename('Fréquence Relative Cumulée')
+
+    @cached_property
+    def reverse(self):
+        """Effectifs par ordre croissant (modalités les plus rares d'abord)."""
+        return self.absolute.iloc[::-1]
+
+    @cached_property
+    def percentile_rank(self):
+        """
+        Rang centile de chaque modalité, dans l'ordre des modalités.
+
+        Part (en %) des observations strictement inférieures à la modalité,
+        plus la moitié de la sienne ; les modalités doivent être ordonnables.
+        """
+        try:
+            order = self.categories.argsort()
+        except TypeError as error:
+            raise ValueError("Les modalités ne sont pas ordonnables") from error
+        counts = self.counts[order]
+        below = np.cumsum(counts) - counts
+        total = self.total if self.total else np.nan
+        return pd.Series(
+            100.0 * (below + 0.5 * counts) / total,
+            index=self.categories[order], name='Rang Centile'
+        )
+
+    def top(self, k=10):
+        """
+        Les k modalités les plus fréquentes.
+
+        Args:
+            k: Nombre de modalités
+
+        Returns:
+            Series des effectifs
+        """
+        return self.absolute.iloc[:k]
+
+    def to_frame(self, normalize=None):
+        """
+        Tableau de fréquences au format historique de FrequenceModule.
+
+        Args:
+            normalize: Si True, fréquences relatives (par défaut self.normalize)
+
+        Returns:
+            DataFrame des fréquences et fréquences cumulées
+        """
+        normalize = self.normalize if normalize is None else normalize
+        columns = (
+            ['Fréquence Relative', 'Fréquence Relative Cumulée'] if normalize
+            else ['Fréquence', 'Fréquence Cumulée']
+        )
+        return pd.DataFrame({column: self[column] for column in columns})
+
+
+class FrequencyCounter:
+    """
+    Accumulateur d'effectifs alimenté chunk par chunk.
+
+    Attributes:
+        dropna: Si True, les valeurs manquantes sont ignorées
+        counts: Table d'effectifs courante
+        n_rows: Nombre de lignes déjà vues
+    """
+
+    def __init__(self, dropna=True):
+        self.dropna = dropna
+        self.counts = pd.Series(dtype=np.int64)
+        self.n_rows = 0
+
+    def update(self, values):
+        """
+        Ajoute un chunk de valeurs.
+
+        Args:
+            values: Valeurs du chunk
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        self.n_rows += len(values)
+        return self.add_counts(count_values(values, self.dropna))
+
+    def add_counts(self, table, n_rows=0):
+        """
+        Fusionne une table d'effectifs partielle déjà calculée.
+
+        Args:
+            table: Table produite par count_values
+            n_rows: Nombre de lignes représentées par la table
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        self.counts = merge_counts([self.counts, table], self.dropna)
+        self.n_rows += n_rows
+        return self
+
+    def merge(self, other):
+        """
+        Fusionne un autre accumulateur dans celui-ci.
+
+        Args:
+            other: FrequencyCounter
+
+        Returns:
+            L'accumulateur lui-même
+        """
+        return self.add_counts(other.counts, other.n_rows)
+
+    def finalize(self, normalize=False):
+        """
+        Construit la table de fréquences à partir des effectifs accumulés.
+
+        Args:
+            normalize: Si True, to_frame() retourne les fréquences relatives
+
+        Returns:
+            FrequencyTable
+        """
+        return FrequencyTable(self.counts, normalize=normalize)
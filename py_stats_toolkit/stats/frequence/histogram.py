@@ -0,0 +1,273 @@
+'''
+=====================================================================
+File : histogram.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Résumés de distribution à mémoire bornée pour les données continues :
+histogramme à classes fixes (linéaires ou logarithmiques) et t-digest
+pour les quantiles approximatifs.
+
+Les deux résumés sont calculés en une passe, chunk par chunk, et se
+fusionnent : des chunks traités en parallèle donnent le même
+histogramme qu'un passage unique.
+
+tags : module, stats, frequence, histogramme
+=====================================================================
+'''
+
+import numpy as np
+import pandas as pd
+
+from .counts import FrequencyTable
+
+
+class BinnedHistogram:
+    """
+    Histogramme à classes fixes, compté par np.bincount.
+
+    Les classes sont [e_i, e_{i+1}[, la dernière étant fermée à droite
+    (comme np.histogram). Les valeurs hors bornes sont comptées à part.
+
+    Attributes:
+        edges: Bornes des classes
+        log: Si True, classes espacées logarithmiquement
+        counts: Effectifs par classe
+        underflow: Nombre de valeurs sous la première borne
+        overflow: Nombre de valeurs au-dessus de la dernière borne
+        missing: Nombre de valeurs manquantes
+    """
+
+    def __init__(self, start, stop, bins=50, log=False):
+        if not stop > start:
+            raise ValueError("La borne supérieure doit dépasser la borne inférieure")
+        if log and start <= 0:
+            raise ValueError("Les classes logarithmiques requièrent des bornes positives")
+        self.log = bool(log)
+        self.bins = int(bins)
+        if self.log:
+            self.edges = np.geomspace(start, stop, self.bins + 1)
+            self._origin, self._scale = np.log(start), self.bins / (np.log(stop) - np.log(start))
+        else:
+            self.edges = np.linspace(start, stop, self.bins + 1)
+            self._origin, self._scale = float(start), self.bins / (stop - start)
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.missing = 0
+
+    def bin_index(self, values):
+        """
+        Classe de chaque valeur (-1 en dessous, bins au-dessus).
+
+        Args:
+            values: Valeurs non manquantes
+
+        Returns:
+            Tableau d'indices de classe
+        """
+        values = np.asarray(values, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scaled = np.log(values) if self.log else values
+            index = np.floor((scaled - self._origin) * self._scale)
+        index = np.clip(np.nan_to_num(index, nan=-1.0, neginf=-1.0), -1, self.bins).astype(np.intp)
+        # Correction des arrondis au voisinage des bornes
+        inside = (index >= 0) & (index < self.bins)
+        index[inside & (values < self.edges[np.clip(index, 0, self.bins)])] -= 1
+        inside = (index >= 0) & (index < self.bins - 1)
+        index[inside & (values >= self.edges[np.clip(index + 1, 0, self.bins)])] += 1
+        index[values < self.edges[0]] = -1
+        index[values > self.edges[-1]] = self.bins
+        index[values == self.edges[-1]] = self.bins - 1
+        return index
+
+    def update(self, values):
+        """
+        Ajoute un chunk de valeurs.
+
+        Args:
+            values: Valeurs du chunk
+
+        Returns:
+            L'histogramme lui-même
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        missing = np.isnan(values)
+        self.missing += int(missing.sum())
+        index = self.bin_index(values[~missing])
+        counts = np.bincount(index + 1, minlength=self.bins + 2)
+        self.underflow += int(counts[0])
+        self.counts += counts[1:-1]
+        self.overflow += int(counts[-1])
+        return self
+
+    def merge(self, other):
+        """
+        Fusionne un histogramme de mêmes classes.
+
+        Args:
+            other: BinnedHistogram
+
+        Returns:
+            L'histogramme lui-même
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Les histogrammes doivent avoir les mêmes classes")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.missing += other.missing
+        return self
+
+    @property
+    def intervals(self):
+        """Classes sous forme d'IntervalIndex."""
+        return pd.IntervalIndex.from_breaks(self.edges, closed='left')
+
+    def to_series(self):
+        """Effectifs par classe, dans l'ordre des classes."""
+        return pd.Series(self.counts.copy(), index=self.intervals, name='Fréquence')
+
+    def to_table(self, normalize=False):
+        """
+        Table de fréquences des classes.
+
+        Args:
+            normalize: Vue par défaut de to_frame()
+
+        Returns:
+            FrequencyTable
+        """
+        return FrequencyTable(self.counts.copy(), self.intervals, normalize)
+
+
+def _k_scale(q, compression):
+    """Fonction d'échelle k1 du t-digest : resserre les centroïdes aux extrémités."""
+    return compression / (2.0 * np.pi) * np.arcsin(2.0 * np.clip(q, 0.0, 1.0) - 1.0)
+
+
+class TDigest:
+    """
+    t-digest fusionnable pour les quantiles approximatifs.
+
+    Les valeurs sont mises en tampon puis compressées en centroïdes
+    (moyenne, poids) ; la fonction d'échelle arcsin garde des centroïdes
+    très fins aux extrémités, où les quantiles extrêmes sont estimés.
+    La compression est vectorisée : chaque centroïde est affecté à la
+    partie entière de k(q) à sa borne gauche.
+
+    Attributes:
+        compression: Paramètre delta (nombre de centroïdes ~ compression)
+        means: Moyennes des centroïdes (triées)
+        weights: Poids des centroïdes
+        total: Poids total
+    """
+
+    def __init__(self, compression=200, buffer_size=None):
+        self.compression = float(compression)
+        self.buffer_size = int(buffer_size or 50 * compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer = []
+        self._buffered = 0
+
+    @property
+    def total(self):
+        """Poids total (valeurs ajoutées)."""
+        self._flush()
+        return float(self.weights.sum())
+
+    def update(self, values):
+        """
+        Ajoute un chunk de valeurs (les valeurs manquantes sont ignorées).
+
+        Args:
+            values: Valeurs du chunk
+
+        Returns:
+            Le digest lui-même
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            self._buffer.append(values)
+            self._buffered += len(values)
+            if self._buffered >= self.buffer_size:
+                self._flush()
+        return self
+
+    def _flush(self):
+        """Compresse le tampon dans les centroïdes."""
+        if not self._buffer:
+            return
+        values = np.concatenate(self._buffer)
+        self._buffer, self._buffered = [], 0
+        self._compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(len(values))])
+        )
+
+    def _compress(self, means, weights):
+        """Regroupe des centroïdes triés selon la fonction d'échelle."""
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        left = (np.cumsum(weights) - weights) / total
+        groups = np.floor(_k_scale(left, self.compression) - _k_scale(0.0, self.compression))
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        sums = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / sums
+        self.weights = sums
+
+    def merge(self, other):
+        """
+        Fusionne un autre digest.
+
+        Args:
+            other: TDigest
+
+        Returns:
+            Le digest lui-même
+        """
+        self._flush()
+        other._flush()
+        if len(other.weights):
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._compress(
+                np.concatenate([self.means, other.means]),
+                np.concatenate([self.weights, other.weights])
+            )
+        return self
+
+    def quantile(self, q):
+        """
+        Quantiles approximatifs.
+
+        Args:
+            q: Quantile(s) entre 0 et 1
+
+        Returns:
+            Quantile(s) estimé(s)
+        """
+        self._flush()
+        q = np.asarray(q, dtype=np.float64)
+        if not len(self.weights):
+            return np.full(q.shape, np.nan)[()]
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2.0
+        # Les extrémités sont ancrées sur le minimum et le maximum exacts
+        positions = np.r_[0.0, centers, total]
+        values = np.r_[self.min, self.means, self.max]
+        return np.interp(q * total, positions, values)[()]
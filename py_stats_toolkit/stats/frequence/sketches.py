@@ -0,0 +1,525 @@
+'''
+=====================================================================
+File : sketches.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Résumés approximatifs à mémoire fixe pour les fréquences à forte
+cardinalité : Count-Min Sketch (effectifs), Misra-Gries (valeurs
+fréquentes) et HyperLogLog (nombre de valeurs distinctes).
+
+Les valeurs sont hachées par pd.util.hash_pandas_object (64 bits,
+déterministe d'un processus à l'autre) ; tous les résumés se fusionnent
+et se sérialisent en octets, ce qui permet de combiner des résumés
+calculés séparément (chunks, processus, journées).
+
+tags : module, stats, frequence, sketch
+=====================================================================
+'''
+
+import io
+import math
+
+import numpy as np
+import pandas as pd
+
+from .counts import count_values, merge_counts
+
+_LOW_MASK = np.uint64(0xFFFFFFFF)
+
+# Nombre maximal de valeurs comptées exactement à la fois par Misra-Gries
+MISRA_GRIES_BLOCK = 65536
+
+
+def _number_keys(series):
+    """
+    Motifs uint64 canoniques de nombres : une même valeur a le même motif
+    qu'elle soit lue en int64, uint64 ou float64.
+
+    Un chunk contenant une valeur manquante est lu en float64 : les
+    flottants entiers (dont -0.0) prennent donc le motif de l'entier
+    int64, les autres gardent leur motif float64.
+    """
+    if series.dtype.kind == 'i':
+        return series.to_numpy(dtype=np.int64).view(np.uint64)
+    if series.dtype.kind == 'u':
+        return series.to_numpy(dtype=np.uint64)
+    values = series.to_numpy(dtype=np.float64)
+    integral = (values == np.trunc(values)) & (values >= -2.0 ** 63) & (values < 2.0 ** 63)
+    keys = values.view(np.uint64).copy()
+    keys[integral] = values[integral].astype(np.int64).view(np.uint64)
+    return keys
+
+
+def hash_values(values):
+    """
+    Hache des valeurs en entiers uint64 (valeurs manquantes exclues).
+
+    Les nombres sont hachés sous une forme canonique (voir _number_keys) :
+    les résumés de chunks lus en int64 et en float64 restent fusionnables.
+
+    Args:
+        values: Valeurs (Series, array, liste)
+
+    Returns:
+        Tableau uint64 des hachages
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    series = series.dropna()
+    if series.dtype.kind in 'iuf':
+        return pd.util.hash_array(_number_keys(series))
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _to_bytes(**arrays):
+    """Sérialise des tableaux numpy au format npz."""
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _from_bytes(payload, allow_pickle=False):
+    """Relit des tableaux sérialisés par _to_bytes."""
+    with np.load(io.BytesIO(payload), allow_pickle=allow_pickle) as arrays:
+        return {name: arrays[name] for name in arrays.files}
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch : effectifs estimés par excès, à mémoire fixe.
+
+    Avec une probabilité 1 - delta, l'erreur d'estimation est au plus
+    epsilon * N, N étant le nombre total de valeurs comptées.
+
+    Attributes:
+        width: Nombre de compteurs par ligne (e / epsilon)
+        depth: Nombre de lignes (ln(1 / delta))
+        table: Compteurs (depth, width)
+        total: Nombre total de valeurs comptées
+    """
+
+    def __init__(self, epsilon=1e-4, delta=1e-3, width=None, depth=None):
+        self.width = int(width or math.ceil(math.e / epsilon))
+        self.depth = int(depth or math.ceil(math.log(1.0 / delta)))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    def _columns(self, hashes):
+        """Colonnes de chaque ligne par double hachage (h1 + i * h2)."""
+        h1 = hashes & _LOW_MASK
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        width = np.uint64(self.width)
+        for row in range(self.depth):
+            yield row, ((h1 + np.uint64(row) * h2) % width).astype(np.intp)
+
+    def update_hashes(self, hashes):
+        """
+        Ajoute des valeurs déjà hachées.
+
+        Args:
+            hashes: Hachages uint64 (voir hash_values)
+        """
+        for row, columns in self._columns(hashes):
+            self.table[row] += np.bincount(columns, minlength=self.width)
+        self.total += len(hashes)
+
+    def update(self, values):
+        """
+        Ajoute des valeurs.
+
+        Args:
+            values: Valeurs du chunk
+        """
+        self.update_hashes(hash_values(values))
+
+    def estimate(self, values):
+        """
+        Estime l'effectif de chaque valeur (borne supérieure).
+
+        Args:
+            values: Valeurs dont on veut l'effectif
+
+        Returns:
+            Tableau int64 des effectifs estimés
+        """
+        hashes = hash_values(values)
+        estimate = np.full(len(hashes), np.iinfo(np.int64).max)
+        for row, columns in self._columns(hashes):
+            np.minimum(estimate, self.table[row, columns], out=estimate)
+        return estimate
+
+    def merge(self, other):
+        """
+        Fusionne un autre sketch de mêmes dimensions.
+
+        Args:
+            other: CountMinSketch
+
+        Returns:
+            Le sketch lui-même
+        """
+        if self.table.shape != other.table.shape:
+            raise ValueError("Les sketches doivent avoir les mêmes dimensions")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def to_bytes(self):
+        """Sérialise le sketch en octets."""
+        return _to_bytes(table=self.table, total=np.int64(self.total))
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """
+        Reconstruit un sketch sérialisé par to_bytes().
+
+        Args:
+            payload: Octets
+
+        Returns:
+            Instance de CountMinSketch
+        """
+        arrays = _from_bytes(payload)
+        depth, width = arrays['table'].shape
+        sketch = cls(width=width, depth=depth)
+        sketch.table = arrays['table'].astype(np.int64)
+        sketch.total = int(arrays['total'])
+        return sketch
+
+
+class MisraGries:
+    """
+    Résumé de Misra-Gries des valeurs les plus fréquentes.
+
+    Au plus k compteurs sont conservés ; chaque effectif est sous-estimé
+    d'au plus `error` <= N / (k + 1). Deux résumés se fusionnent en
+    additionnant les compteurs puis en retranchant le (k+1)-ième plus
+    grand (Agarwal et al., 2012).
+
+    Attributes:
+        k: Nombre de compteurs
+        block_size: Nombre maximal de valeurs comptées exactement à la fois
+        counts: Effectifs conservés (Series indexée par les valeurs)
+        error: Borne de sous-estimation des effectifs
+        total: Nombre total de valeurs comptées
+    """
+
+    def __init__(self, k=100, block_size=MISRA_GRIES_BLOCK):
+        self.k = int(k)
+        self.block_size = max(int(block_size), 1)
+        self.counts = pd.Series(dtype=np.int64)
+        self.error = 0
+        self.total = 0
+
+    def _add(self, table, error, total):
+        """Ajoute une table d'effectifs puis réduit à k compteurs."""
+        counts = merge_counts([self.counts, table])
+        self.error += error
+        self.total += total
+        if len(counts) > self.k:
+            threshold = int(counts.nlargest(self.k + 1).iloc[-1])
+            counts = counts - threshold
+            counts = counts[counts > 0]
+            self.error += threshold
+        self.counts = counts
+        return self
+
+    def update(self, values):
+        """
+        Ajoute un chunk, par sous-blocs comptés exactement puis réduits.
+
+        Chaque sous-bloc compte au plus block_size valeurs : la mémoire
+        reste O(k + block_size) quelle que soit la cardinalité du chunk.
+
+        Args:
+            values: Valeurs du chunk
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        for start in range(0, len(series), self.block_size):
+            table = count_values(series.iloc[start:start + self.block_size])
+            self._add(table, 0, int(table.sum()))
+        return self
+
+    def merge(self, other):
+        """
+        Fusionne un autre résumé.
+
+        Args:
+            other: MisraGries
+
+        Returns:
+            Le résumé lui-même
+        """
+        self.k = max(self.k, other.k)
+        return self._add(other.counts, other.error, other.total)
+
+    def top(self, n=None):
+        """
+        Valeurs les plus fréquentes et leur effectif minimal garanti.
+
+        Args:
+            n: Nombre de valeurs (par défaut k)
+
+        Returns:
+            Series triée par effectif décroissant
+        """
+        return self.counts.sort_values(ascending=False, kind='stable').head(n or self.k)
+
+    def to_bytes(self):
+        """
+        Sérialise le résumé en octets, sans pickle.
+
+        Les valeurs sont stockées dans un tableau typé : numérique,
+        booléen, date, ou unicode de largeur fixe pour les chaînes.
+
+        Returns:
+            Octets
+
+        Raises:
+            TypeError: Si les valeurs ne sont ni numériques ni des chaînes
+        """
+        index = self.counts.index
+        if pd.api.types.infer_dtype(index, skipna=False) in ('string', 'empty'):
+            keys = np.array(index.tolist(), dtype=str)
+        else:
+            keys = index.to_numpy()
+            if keys.dtype.kind not in 'biufmM':
+                raise TypeError("Seules les valeurs numériques, dates ou chaînes sont sérialisables")
+        return _to_bytes(
+            keys=keys,
+            counts=self.counts.to_numpy(dtype=np.int64),
+            header=np.array([self.k, self.error, self.total, self.block_size], dtype=np.int64),
+        )
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """
+        Reconstruit un résumé sérialisé par to_bytes().
+
+        Args:
+            payload: Octets
+
+        Returns:
+            Instance de MisraGries
+        """
+        arrays = _from_bytes(payload)
+        k, error, total, block_size = (int(v) for v in arrays['header'])
+        summary = cls(k, block_size)
+        keys = arrays['keys']
+        if keys.dtype.kind == 'U':
+            keys = keys.astype(object)
+        summary.counts = pd.Series(arrays['counts'], index=pd.Index(keys))
+        summary.error, summary.total = error, total
+        return summary
+
+
+class HyperLogLog:
+    """
+    Estimateur HyperLogLog du nombre de valeurs distinctes.
+
+    L'erreur relative type est 1.04 / sqrt(2^precision).
+
+    Attributes:
+        precision: Nombre de bits d'indexation des registres (4 à 18)
+        registers: Registres uint8
+    """
+
+    def __init__(self, error=0.01, precision=None):
+        if precision is None:
+            precision = math.ceil(math.log2((1.04 / error) ** 2))
+        self.precision = int(min(max(precision, 4), 18))
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    def update_hashes(self, hashes):
+        """
+        Ajoute des valeurs déjà hachées.
+
+        Args:
+            hashes: Hachages uint64 (voir hash_values)
+        """
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes << np.uint64(p)
+        # Rang du premier bit à 1 (nombre de zéros de tête + 1), vectorisé
+        zeros = np.zeros(len(hashes), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            empty = (rest >> np.uint64(64 - shift)) == 0
+            zeros[empty] += shift
+            rest = np.where(empty, rest << np.uint64(shift), rest)
+        rank = np.minimum(zeros + 1, 64 - p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def update(self, values):
+        """
+        Ajoute des valeurs.
+
+        Args:
+            values: Valeurs du chunk
+        """
+        self.update_hashes(hash_values(values))
+
+    def estimate(self):
+        """
+        Estime le nombre de valeurs distinctes.
+
+        Returns:
+            Cardinalité estimée
+        """
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1.0 + 1.079 / m))
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        empty = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and empty:
+            # Correction des petites cardinalités (comptage linéaire)
+            return m * math.log(m / empty)
+        return float(raw)
+
+    def merge(self, other):
+        """
+        Fusionne un autre estimateur de même précision.
+
+        Args:
+            other: HyperLogLog
+
+        Returns:
+            L'estimateur lui-même
+        """
+        if self.precision != other.precision:
+            raise ValueError("Les estimateurs doivent avoir la même précision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_bytes(self):
+        """Sérialise l'estimateur en octets."""
+        return _to_bytes(registers=self.registers)
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """
+        Reconstruit un estimateur sérialisé par to_bytes().
+
+        Args:
+            payload: Octets
+
+        Returns:
+            Instance de HyperLogLog
+        """
+        registers = _from_bytes(payload)['registers']
+        hll = cls(precision=int(np.log2(len(registers))))
+        hll.registers = registers.astype(np.uint8)
+        return hll
+
+
+class FrequencySketch:
+    """
+    Fréquences approximatives d'une colonne à forte cardinalité.
+
+    Combine un Count-Min Sketch (effectifs), un résumé de Misra-Gries
+    (candidats fréquents) et un HyperLogLog (valeurs distinctes).
+
+    Attributes:
+        cms: CountMinSketch
+        heavy_hitters: MisraGries
+        hll: HyperLogLog
+    """
+
+    def __init__(self, k=100, epsilon=1e-4, delta=1e-3, error=0.01):
+        self.cms = CountMinSketch(epsilon, delta)
+        self.heavy_hitters = MisraGries(k)
+        self.hll = HyperLogLog(error)
+
+    @property
+    def total(self):
+        """Nombre total de valeurs (non manquantes) comptées."""
+        return self.cms.total
+
+    def update(self, values):
+        """
+        Ajoute un chunk de valeurs.
+
+        Args:
+            values: Valeurs du chunk
+
+        Returns:
+            Le résumé lui-même
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        hashes = hash_values(series)
+        self.cms.update_hashes(hashes)
+        self.hll.update_hashes(hashes)
+        self.heavy_hitters.update(series)
+        return self
+
+    def merge(self, other):
+        """
+        Fusionne un autre résumé de mêmes paramètres.
+
+        Args:
+            other: FrequencySketch
+
+        Returns:
+            Le résumé lui-même
+        """
+        self.cms.merge(other.cms)
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.hll.merge(other.hll)
+        return self
+
+    def distinct(self):
+        """Nombre estimé de valeurs distinctes."""
+        return self.hll.estimate()
+
+    def estimate(self, values):
+        """Effectifs estimés (par excès) des valeurs demandées."""
+        return self.cms.estimate(values)
+
+    def top(self, n=None):
+        """
+        Valeurs les plus fréquentes avec l'encadrement de leur effectif.
+
+        Args:
+            n: Nombre de valeurs
+
+        Returns:
+            DataFrame (effectif estimé, borne inférieure, fréquence relative estimée)
+        """
+        candidates = self.heavy_hitters.top(n)
+        estimated = self.cms.estimate(pd.Series(candidates.index))
+        total = self.total
+        result = pd.DataFrame({
+            'Fréquence Estimée': estimated,
+            'Fréquence Minimale': candidates.to_numpy(),
+            'Fréquence Relative Estimée': estimated / total if total else np.nan,
+        }, index=candidates.index)
+        return result.sort_values('Fréquence Estimée', ascending=False, kind='stable')
+
+    def to_bytes(self):
+        """Sérialise les trois résumés en octets."""
+        parts = [self.cms.to_bytes(), self.heavy_hitters.to_bytes(), self.hll.to_bytes()]
+        return _to_bytes(**{name: np.frombuffer(part, dtype=np.uint8)
+                            for name, part in zip(('cms', 'heavy_hitters', 'hll'), parts)})
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """
+        Reconstruit un résumé sérialisé par to_bytes().
+
+        Args:
+            payload: Octets
+
+        Returns:
+            Instance de FrequencySketch
+        """
+        arrays = _from_bytes(payload)
+        sketch = cls.__new__(cls)
+        sketch.cms = CountMinSketch.from_bytes(arrays['cms'].tobytes())
+        sketch.heavy_hitters = MisraGries.from_bytes(arrays['heavy_hitters'].tobytes())
+        sketch.hll = HyperLogLog.from_bytes(arrays['hll'].tobytes())
+        return sketch
@@ -0,0 +1,161 @@
+'''
+=====================================================================
+File : AnomalyModule.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Détection d'anomalies sur séries temporelles : z-score glissant,
+médiane/MAD glissantes et résidu EWMA, en mode lot (vectorisé, séries
+réparties entre workers) ou en mode flux (un point à la fois), avec des
+anomalies identiques dans les deux modes.
+
+tags : module, stats, temporelle, anomalies
+=====================================================================
+'''
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from ..core.AbstractClassBase import TimeSeriesModule
+from ...utils.parallel import ParallelProcessor
+from .anomaly import METHODS, make_detector
+
+
+def _detect_block(values, method, options):
+    """Scores et anomalies d'un bloc de séries (exécuté dans un worker)."""
+    detector = make_detector(method, n_columns=values.shape[1], **options)
+    scores = detector.update(values)
+    return scores, detector.flags(scores)
+
+
+class AnomalyDetector(TimeSeriesModule):
+    """Module de détection d'anomalies sur séries temporelles."""
+
+    def __init__(self, method="zscore", window=50, threshold=None, min_periods=None,
+                 n_jobs: int = -1, **ewm_options):
+        super().__init__()
+        if method not in METHODS:
+            raise ValueError(f"Méthode {method} non supportée")
+        self.method = method
+        self.options = dict(window=window, threshold=threshold, min_periods=min_periods, **ewm_options)
+        self.detector = None
+        self.scores = None
+        self.flags = None
+        self.parallel_processor = ParallelProcessor(n_jobs=n_jobs)
+
+    def process(self, data, timestamps=None, **kwargs):
+        """
+        Détecte les anomalies d'une ou plusieurs séries (mode lot).
+
+        Chaque point est comparé aux statistiques des points qui le
+        précèdent. Les séries (colonnes) sont réparties par blocs entre les
+        workers ; chaque bloc est traité en un seul appel vectorisé.
+
+        Args:
+            data: Série (numpy array 1-D ou pandas Series) ou matrice
+                (temps x séries, numpy array ou DataFrame)
+            timestamps: Timestamps pour les données
+            **kwargs: Arguments additionnels
+
+        Returns:
+            DataFrame (Valeur, Score, Anomalie) pour une série ; pour
+            plusieurs séries, colonnes MultiIndex (série, Score / Anomalie)
+        """
+        self.validate_data(data)
+        if timestamps is not None:
+            self.set_timestamps(timestamps)
+
+        values = np.asarray(data, dtype=np.float64)
+        if values.ndim not in (1, 2):
+            raise ValueError("Les données doivent être à une ou deux dimensions")
+        matrix = values.reshape(-1, 1) if values.ndim == 1 else values
+
+        n_jobs = max(1, self.parallel_processor.n_jobs)
+        size = max(1, -(-matrix.shape[1] // n_jobs))
+        blocks = [matrix[:, start:start + size] for start in range(0, matrix.shape[1], size)]
+        detect = partial(_detect_block, method=self.method, options=self.options)
+        results = self.parallel_processor.parallel_map(detect, blocks)
+        scores = np.hstack([scores for scores, _ in results])
+        flags = np.hstack([flags for _, flags in results])
+
+        index = self._index(data, len(matrix))
+        if values.ndim == 1:
+            self.scores = pd.Series(scores[:, 0], index=index, name='Score')
+            self.flags = pd.Series(flags[:, 0], index=index, name='Anomalie')
+            self.result = pd.DataFrame({
+                'Valeur': matrix[:, 0], 'Score': self.scores, 'Anomalie': self.flags
+            }, index=index)
+        else:
+            columns = data.columns if isinstance(data, pd.DataFrame) else pd.RangeIndex(matrix.shape[1])
+            self.scores = pd.DataFrame(scores, index=index, columns=columns)
+            self.flags = pd.DataFrame(flags, index=index, columns=columns)
+            self.result = pd.concat({'Score': self.scores, 'Anomalie': self.flags}, axis=1)
+            self.result = self.result.swaplevel(axis=1)[columns]
+        return self.result
+
+    def _index(self, data, n):
+        """Index du résultat : celui des données pandas, sinon les timestamps."""
+        if isinstance(data, (pd.Series, pd.DataFrame)):
+            return data.index
+        if self.timestamps is not None and len(self.timestamps) == n:
+            return pd.Index(self.timestamps)
+        return pd.RangeIndex(n)
+
+    def update(self, values):
+        """
+        Mode flux : ajoute un point (ou un bloc) et retourne scores et anomalies.
+
+        L'état du détecteur est conservé entre les appels ; le coût par
+        point ne dépend pas de la longueur de l'historique : O(1) pour
+        'zscore' et 'ewma', O(log w) comparaisons pour 'mad' sur un bloc de
+        moins de window points (fenêtre triée tenue à jour par bisection,
+        plus le décalage de la liste), O(w log w) par point sur un bloc
+        plus long (fenêtres triées). Les anomalies sont identiques à celles
+        de process() sur la série complète.
+
+        Args:
+            values: Scalaire (un point d'une série), tableau 1-D (points
+                successifs d'une série) ou matrice (temps x séries) ; le
+                nombre de séries est fixé au premier appel
+
+        Returns:
+            Tuple (scores, anomalies) de même forme que values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim > 2:
+            raise ValueError("Les données doivent être à une ou deux dimensions")
+        n_columns = values.shape[1] if values.ndim == 2 else 1
+        if self.detector is None:
+            self.detector = make_detector(self.method, n_columns=n_columns, **self.options)
+        elif n_columns != self.detector.n_columns:
+            raise ValueError(f"Nombre de séries attendu : {self.detector.n_columns}")
+        scores = self.detector.update(np.atleast_1d(values))
+        if values.ndim == 0:
+            scores = scores[0]
+        return scores, self.detector.flags(scores)
+
+    def reset(self):
+        """Réinitialise l'état du mode flux."""
+        self.detector = None
+
+    def get_anomalies(self):
+        """
+        Retourne les points signalés par process().
+
+        Returns:
+            DataFrame des points anormaux (une série), ou DataFrame booléen
+            réduit aux instants comportant au moins une anomalie
+        """
+        if self.flags is None:
+            raise ValueError("Exécutez d'abord process()")
+        if isinstance(self.flags, pd.Series):
+            return self.result[self.flags]
+        return self.flags[self.flags.any(axis=1)]
@@ -66,10 +66,24 @@ class TimeSeriesAnalyzer(BaseCapsule):
         """
         pass 
 
+from functools import partial
+
 import numpy as np
 import pandas as pd
 from ..core.AbstractClassBase import TimeSeriesModule
 from ...utils.parallel import ParallelProcessor, BatchProcessor
+from .panel import COLUMNS, long_to_blocks, panel_summary, split_rows
+from .resample import DEFAULT_AGGREGATIONS, BucketAggregator, resample, to_frame
+from .spectral import (
+    DEFAULT_MIN_SCORE, acf, candidates_frame, detect_seasonality, pacf, welch_periodogram,
+)
+from .streaming import StreamingSummary
+
+
+def _detect_periods(values, max_period=None, min_score=DEFAULT_MIN_SCORE):
+    """Périodes saisonnières d'un bloc de séries (exécuté dans un worker)."""
+    return detect_seasonality(values, max_period, min_score=min_score)[0]
+
 
 class TimeSeriesAnalyzer(TimeSeriesModule):
     """Module pour l'analyse de séries temporelles."""
@@ -78,6 +92,9 @@ class TimeSeriesAnalyzer(TimeSeriesModule):
         super().__init__()
         self.parallel_processor = ParallelProcessor(n_jobs=n_jobs)
         self.batch_processor = BatchProcessor(batch_size=batch_size)
+        self.summary = None
+        self.resampler = None
+        self._resample_columns = None
     
     def process(self, data, timestamps=None, **kwargs):
         """
@@ -128,6 +145,201 @@ class TimeSeriesAnalyzer(TimeSeriesModule):
         self.result = pd.Series(stats)
         return self.result
     
+    def partial_process(self, data, **kwargs):
+        """
+        Ajoute de nouveaux points au résumé en ligne, sans calculer les statistiques.
+        
+        Le coût est proportionnel aux nouveaux points seulement : moyenne et
+        variance de Welford, extrêmes et tendance par moments centrés,
+        médiane par t-digest, fenêtre des derniers points. Les statistiques
+        (médiane, fréquence dominante) ne sont calculées qu'à l'appel de
+        finalize().
+        
+        Args:
+            data: Nouveaux points (scalaire, numpy array ou pandas Series),
+                dans l'ordre du temps
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            Résumé en ligne (StreamingSummary) mis à jour
+        """
+        if self.summary is None:
+            self.summary = StreamingSummary()
+        if np.ndim(data) == 0:
+            return self.summary.update(data)
+        return self.summary.update_many(self._series_values(data))
+    
+    def merge(self, other):
+        """
+        Fusionne le résumé en ligne d'un tronçon suivant (autre analyseur ou StreamingSummary).
+        
+        Args:
+            other: TimeSeriesAnalyzer ou StreamingSummary du tronçon suivant
+        """
+        summary = other.summary if isinstance(other, TimeSeriesAnalyzer) else other
+        if self.summary is None:
+            self.summary = StreamingSummary()
+        self.summary.merge(summary)
+    
+    def finalize(self):
+        """
+        Calcule les statistiques du résumé en ligne accumulé.
+        
+        Returns:
+            Series avec les mêmes champs que process()
+        """
+        if self.summary is None:
+            raise ValueError("Aucun point accumulé : appelez d'abord partial_process()")
+        self.result = self.summary.snapshot()
+        return self.result
+    
+    def _resample_input(self, data, timestamps):
+        """Horodatages, matrice (temps x séries) et noms des séries à rééchantillonner."""
+        if data is None:
+            data = self.data
+        if timestamps is None:
+            if isinstance(data, (pd.Series, pd.DataFrame)) and isinstance(data.index, pd.DatetimeIndex):
+                timestamps = data.index
+            else:
+                timestamps = self.timestamps
+        if timestamps is None:
+            raise ValueError("Des horodatages sont requis pour le rééchantillonnage")
+        values = self._series_values(data)
+        if values.ndim == 1:
+            columns = None
+        elif isinstance(data, pd.DataFrame):
+            columns = data.columns
+        else:
+            columns = pd.RangeIndex(values.shape[1])
+        return timestamps, values, columns
+    
+    def resample(self, data=None, freq='1s', timestamps=None, aggregations=DEFAULT_AGGREGATIONS,
+                 origin=None, empty_buckets=False):
+        """
+        Agrège une ou plusieurs séries par intervalles de temps.
+        
+        Le numéro d'intervalle de chaque point est la division entière de
+        son horodatage (nanosecondes) par freq ; les horodatages étant
+        triés, chaque intervalle est réduit par np.ufunc.reduceat. Les
+        séries sont réparties par blocs entre les workers.
+        
+        Args:
+            data: Série ou matrice (temps x séries) ; self.data si None
+            freq: Durée d'un intervalle ('1s', '5min', Timedelta...)
+            timestamps: Horodatages triés (index de data ou self.timestamps
+                par défaut)
+            aggregations: Parmi 'open', 'high', 'low', 'close', 'mean',
+                'sum', 'count'
+            origin: Origine des intervalles (epoch par défaut)
+            empty_buckets: Produit aussi les intervalles sans point
+            
+        Returns:
+            DataFrame indexé par début d'intervalle ; pour plusieurs séries,
+            colonnes MultiIndex (série, agrégation)
+        """
+        timestamps, values, columns = self._resample_input(data, timestamps)
+        starts, aggregated = resample(
+            timestamps, values, freq, origin, aggregations, empty_buckets,
+            map_func=self.parallel_processor.parallel_map,
+            n_blocks=max(1, self.parallel_processor.n_jobs),
+        )
+        self.result = to_frame(starts, aggregated, columns)
+        return self.result
+    
+    def partial_resample(self, data, timestamps=None, freq='1s', aggregations=DEFAULT_AGGREGATIONS,
+                         origin=None, empty_buckets=False):
+        """
+        Rééchantillonnage en flux par tronçons triés et consécutifs.
+        
+        Retourne les intervalles terminés ; l'état réduit du dernier
+        intervalle, qui peut se poursuivre dans le tronçon suivant, est
+        conservé. freq, aggregations, origin et empty_buckets sont fixés
+        au premier appel.
+        
+        Args:
+            data: Tronçon (série ou matrice temps x séries)
+            timestamps: Horodatages du tronçon (index de data par défaut)
+            freq: Durée d'un intervalle
+            aggregations: Agrégations produites
+            origin: Origine des intervalles
+            empty_buckets: Produit aussi les intervalles sans point
+            
+        Returns:
+            DataFrame des intervalles terminés
+        """
+        timestamps, values, columns = self._resample_input(data, timestamps)
+        if self.resampler is None:
+            self.resampler = BucketAggregator(freq, origin, aggregations, empty_buckets)
+        starts, aggregated = self.resampler.update(
+            timestamps, values,
+            map_func=self.parallel_processor.parallel_map,
+            n_blocks=max(1, self.parallel_processor.n_jobs),
+        )
+        self._resample_columns = columns
+        return to_frame(starts, aggregated, columns)
+    
+    def flush_resample(self):
+        """
+        Termine le rééchantillonnage en flux et retourne le dernier intervalle.
+        
+        Returns:
+            DataFrame du dernier intervalle (éventuellement incomplet)
+        """
+        if self.resampler is None:
+            raise ValueError("Aucun rééchantillonnage en cours")
+        starts, aggregated = self.resampler.flush()
+        self.resampler = None
+        return to_frame(starts, aggregated, self._resample_columns)
+    
+    def process_panel(self, data, id_column=None, value_column=None, time_column=None, **kwargs):
+        """
+        Analyse un panel de séries en un seul appel vectorisé.
+        
+        Mêmes statistiques que process() pour chaque série, calculées le
+        long de l'axe du temps par blocs de séries répartis entre les
+        workers : tendance par moindres carrés en forme fermée, fréquence
+        dominante par rfft.
+        
+        Args:
+            data: Matrice (séries x temps) numpy ou DataFrame (une ligne par
+                série), ou DataFrame long avec id_column
+            id_column: Colonne identifiant la série (format long)
+            value_column: Colonne des valeurs (format long)
+            time_column: Colonne d'ordre temporel (format long, optionnelle)
+            **kwargs: Arguments additionnels
+            
+        Returns:
+            DataFrame indexé par série, une colonne par statistique
+        """
+        self.validate_data(data)
+        if id_column is not None:
+            if value_column is None:
+                raise ValueError("value_column est requis avec id_column")
+            blocks = long_to_blocks(data, id_column, value_column, time_column)
+        elif isinstance(data, pd.DataFrame):
+            blocks = [(data.index, data.to_numpy(dtype=np.float64))]
+        else:
+            values = np.asarray(data, dtype=np.float64)
+            if values.ndim != 2:
+                raise ValueError("Le panel doit être une matrice (séries x temps)")
+            blocks = [(pd.RangeIndex(len(values)), values)]
+        
+        n_jobs = max(1, self.parallel_processor.n_jobs)
+        frames = []
+        for ids, values in blocks:
+            if np.isnan(values).any():
+                raise ValueError("Le mode panel requiert des séries sans valeurs manquantes")
+            chunks = split_rows(values, n_jobs, self.batch_processor.batch_size)
+            summaries = self.parallel_processor.parallel_map(panel_summary, chunks)
+            summary = np.concatenate(summaries) if summaries else np.empty((0, len(COLUMNS)))
+            frames.append(pd.DataFrame(summary, index=ids, columns=COLUMNS))
+        
+        self.result = pd.concat(frames) if len(frames) > 1 else frames[0]
+        if id_column is not None:
+            self.result = self.result.sort_index()
+        self.result.index.name = 'Série'
+        return self.result
+    
     def get_trend(self, data=None):
         """
         Calcule la tendance linéaire.
@@ -149,33 +361,97 @@ class TimeSeriesAnalyzer(TimeSeriesModule):
         x = np.arange(len(series))
         return np.polyfit(x, series.values, 1)
     
-    def get_seasonality(self, data=None, period=None):
+    def _series_values(self, data=None):
+        """Valeurs float64 d'une série (self.data si None) ou d'une matrice de séries."""
+        if data is None:
+            data = self.data
+        if isinstance(data, (pd.Series, pd.DataFrame)):
+            return data.to_numpy(dtype=np.float64)
+        return np.asarray(data, dtype=np.float64)
+    
+    def get_acf(self, data=None, max_lag=None):
         """
-        Détecte la saisonnalité.
+        Autocorrélations pour tous les lags 0..max_lag (rfft avec zéros de complément).
         
         Args:
-            data: Données optionnelles
-            period: Période attendue (optionnelle)
+            data: Données optionnelles (série ou matrice séries x temps)
+            max_lag: Décalage maximal (n - 1 par défaut)
             
         Returns:
-            Période détectée
+            Tableau des autocorrélations
         """
-        if data is None:
-            data = self.data
+        return acf(self._series_values(data), max_lag)
+    
+    def get_pacf(self, data=None, max_lag=40):
+        """
+        Autocorrélations partielles (récursion de Durbin-Levinson).
         
-        if isinstance(data, pd.Series):
-            series = data
-        else:
-            series = pd.Series(data)
+        Args:
+            data: Données optionnelles (série ou matrice séries x temps)
+            max_lag: Décalage maximal
+            
+        Returns:
+            Tableau des autocorrélations partielles
+        """
+        return pacf(self._series_values(data), max_lag)
+    
+    def get_periodogram(self, data=None, segment_length=None, overlap=0.5):
+        """
+        Périodogramme de Welch (segments recouvrants, fenêtre de Hann).
+        
+        Args:
+            data: Données optionnelles (série ou matrice séries x temps)
+            segment_length: Longueur des segments
+            overlap: Fraction de recouvrement
+            
+        Returns:
+            Tuple (fréquences, densités spectrales)
+        """
+        return welch_periodogram(self._series_values(data), segment_length, overlap)
+    
+    def get_seasonality_candidates(self, data=None, max_period=None, n_candidates=5,
+                                   min_score=DEFAULT_MIN_SCORE):
+        """
+        Périodes candidates d'une série, notées par l'autocorrélation.
+        
+        Args:
+            data: Données optionnelles
+            max_period: Période maximale recherchée
+            n_candidates: Nombre de pics du périodogramme examinés
+            min_score: Score ACF minimal d'un candidat (None : aucun seuil)
+            
+        Returns:
+            DataFrame (Période, Score ACF, Puissance) trié par score décroissant
+        """
+        return candidates_frame(self._series_values(data), max_period, n_candidates,
+                                min_score=min_score)
+    
+    def get_seasonality(self, data=None, period=None, max_period=None, min_score=DEFAULT_MIN_SCORE):
+        """
+        Détecte la saisonnalité.
         
-        # Calcul de l'autocorrélation
-        acf = pd.Series(series).autocorr()
+        Les pics du périodogramme moyenné par segments sont affinés au
+        décalage de plus forte autocorrélation, et la période la mieux
+        notée est retenue. Une matrice (séries x temps) est traitée par
+        blocs de séries répartis entre les workers.
         
+        Args:
+            data: Données optionnelles (série ou matrice séries x temps)
+            period: Période attendue (optionnelle)
+            max_period: Période maximale recherchée
+            min_score: Score ACF minimal de la période retenue
+            
+        Returns:
+            Période détectée (tableau de périodes pour une matrice) ; NaN
+            sans saisonnalité détectable
+        """
         if period is not None:
             return period
         
-        # Détection automatique de la période
-        fft = np.fft.fft(series.values)
-        freqs = np.fft.fftfreq(len(series))
-        main_freq_idx = np.argmax(np.abs(fft[1:len(fft)//2])) + 1
-        return 1/freqs[main_freq_idx] if freqs[main_freq_idx] != 0 else np.inf 
\ No newline at end of file
+        values = self._series_values(data)
+        if values.ndim == 1:
+            return detect_seasonality(values, max_period, min_score=min_score)[0]
+        chunks = split_rows(values, max(1, self.parallel_processor.n_jobs), self.batch_processor.batch_size)
+        detect = partial(_detect_periods, max_period=max_period, min_score=min_score)
+        periods = self.parallel_processor.parallel_map(detect, chunks)
+        return np.concatenate(periods) if periods else np.empty(0)
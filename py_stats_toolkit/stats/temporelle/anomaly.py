@@ -0,0 +1,315 @@
+'''
+=====================================================================
+File : anomaly.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Détecteurs d'anomalies à état reprenable pour séries temporelles.
+
+Chaque point est comparé aux statistiques des points qui le précèdent
+(fenêtre glissante ou moyenne exponentielle) : z-score glissant,
+médiane/MAD glissantes (z-score robuste) et résidu d'une moyenne
+exponentielle. Un même détecteur traite un tableau entier (vectorisé) ou
+un point à la fois : les moteurs glissants et exponentiels donnent des
+résultats identiques bit à bit quel que soit le découpage, donc les
+scores et les anomalies signalées le sont aussi.
+
+tags : module, stats, temporelle, anomalies
+=====================================================================
+'''
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+
+import numpy as np
+
+from ..descriptives.ewm import ExponentialMovingState, resolve_alpha
+from ..descriptives.rolling import RollingMean, RollingVariance, _as_2d
+
+METHODS = ('zscore', 'mad', 'ewma')
+
+# Facteur de cohérence de la MAD avec l'écart-type d'une loi normale
+MAD_SCALE = 1.4826
+
+# Nombre maximal de valeurs de fenêtres triées à la fois (médiane/MAD)
+MAD_BLOCK_VALUES = 2 ** 22
+
+
+def _standardized(x, center, scale):
+    """Écart réduit ; écart nul sur une échelle nulle vaut 0, sinon ±inf."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = (x - center) / scale
+    return np.where((scale == 0) & (x == center), 0.0, scores)
+
+
+class _Detector(ABC):
+    """Base des détecteurs : scores des nouveaux points et seuil."""
+
+    def __init__(self, threshold=3.0, n_columns=1):
+        self.threshold = float(threshold)
+        self.n_columns = int(n_columns)
+        self.position = 0
+
+    @abstractmethod
+    def _scores(self, x):
+        """Scores des nouveaux points x (k, n_columns), état mis à jour."""
+
+    def update(self, values):
+        """
+        Ajoute des points et retourne leurs scores.
+
+        Args:
+            values: Nouvelles valeurs (1-D, ou 2-D une colonne par série)
+
+        Returns:
+            Scores des nouveaux points (même dimension que l'entrée) ; NaN
+            tant que l'historique est insuffisant ou pour une valeur manquante
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = _as_2d(values)
+        scores = self._scores(x) if len(x) else np.empty(x.shape)
+        self.position += len(x)
+        return scores.ravel() if values.ndim == 1 else scores
+
+    def flags(self, scores):
+        """Anomalies : |score| strictement supérieur au seuil."""
+        with np.errstate(invalid='ignore'):
+            return np.abs(scores) > self.threshold
+
+
+class RollingZScoreDetector(_Detector):
+    """
+    z-score par rapport à la moyenne et à l'écart-type des window points précédents.
+
+    Attributes:
+        window: Taille de la fenêtre
+        min_periods: Nombre minimal de valeurs valides dans la fenêtre
+        threshold: Seuil sur |z|
+    """
+
+    def __init__(self, window, threshold=3.0, min_periods=None, n_columns=1):
+        super().__init__(threshold, n_columns)
+        self.window = int(window)
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        self._mean = RollingMean(self.window, self.min_periods, n_columns=self.n_columns)
+        self._variance = RollingVariance(self.window, self.min_periods, n_columns=self.n_columns)
+        self._last_mean = np.full(self.n_columns, np.nan)
+        self._last_std = np.full(self.n_columns, np.nan)
+
+    def _scores(self, x):
+        means = self._mean.update(x)
+        stds = np.sqrt(self._variance.update(x))
+        # Statistiques de la fenêtre qui se termine au point précédent
+        previous_mean = np.vstack([self._last_mean, means[:-1]])
+        previous_std = np.vstack([self._last_std, stds[:-1]])
+        self._last_mean, self._last_std = means[-1].copy(), stds[-1].copy()
+        return _standardized(x, previous_mean, previous_std)
+
+
+class RollingMADDetector(_Detector):
+    """
+    z-score robuste (x - médiane) / (1.4826 MAD) sur les window points précédents.
+
+    Médiane et MAD n'ont pas de mise à jour en O(1). Pour un bloc d'au
+    moins window points, chaque fenêtre est triée (O(w log w) par point),
+    par blocs vectorisés. Pour un bloc plus court (mode flux), une copie
+    triée des valeurs valides de la fenêtre est tenue à jour par
+    bisection : insertion et retrait en O(log w) comparaisons (plus le
+    décalage de la liste), médiane en O(1) et MAD en O(log w) comme
+    k-ième plus petit écart, pris dans les deux suites triées des écarts
+    de part et d'autre de la médiane. Le calcul d'un point ne dépend que
+    des valeurs de sa fenêtre, donc le résultat ne dépend pas du
+    découpage.
+
+    Attributes:
+        window: Taille de la fenêtre
+        min_periods: Nombre minimal de valeurs valides dans la fenêtre
+        threshold: Seuil sur |z robuste|
+    """
+
+    def __init__(self, window, threshold=3.5, min_periods=None, n_columns=1):
+        super().__init__(threshold, n_columns)
+        self.window = int(window)
+        self.min_periods = self.window if min_periods is None else int(min_periods)
+        self._tail = np.full((self.window, self.n_columns), np.nan)
+        # Valeurs valides triées de la fenêtre courante, par série (mode flux)
+        self._sorted = None
+
+    @staticmethod
+    def _sorted_median(ordered, counts):
+        """Médiane de fenêtres triées (NaN en fin) de counts valeurs valides."""
+        low = np.take_along_axis(ordered, np.maximum(counts - 1, 0)[..., None] // 2, axis=-1)[..., 0]
+        high = np.take_along_axis(ordered, (counts // 2)[..., None], axis=-1)[..., 0]
+        return (low + high) / 2.0
+
+    @staticmethod
+    def _deviation(ordered, split, median, rank):
+        """
+        rank-ième plus petit écart |v - median| (rank à partir de 0).
+
+        Les écarts à gauche de split (median - v, v < median) et à droite
+        (v - median) forment deux suites croissantes : le rang est trouvé
+        par bisection sur le nombre d'écarts pris à gauche.
+        """
+        n_left, n_right = split, len(ordered) - split
+        count = rank + 1
+        low, high = max(0, count - n_right), min(count, n_left)
+        while low < high:
+            i = (low + high) // 2
+            if ordered[split + count - i - 1] - median > median - ordered[split - 1 - i]:
+                low = i + 1
+            else:
+                high = i
+        j = count - low
+        left = median - ordered[split - low] if low else -np.inf
+        right = ordered[split + j - 1] - median if j else -np.inf
+        return max(left, right)
+
+    def _window_stats(self, ordered):
+        """Médiane et MAD d'une fenêtre triée de valeurs valides."""
+        count = len(ordered)
+        if count == 0:
+            return np.nan, np.nan
+        low, high = (count - 1) // 2, count // 2
+        median = (ordered[low] + ordered[high]) / 2.0
+        split = bisect_left(ordered, median)
+        mad = (self._deviation(ordered, split, median, low)
+               + self._deviation(ordered, split, median, high)) / 2.0
+        return median, mad * MAD_SCALE
+
+    def _push_scores(self, x):
+        """Scores point par point sur les fenêtres triées tenues à jour."""
+        if self._sorted is None:
+            self._sorted = [sorted(v for v in self._tail[:, j].tolist() if v == v)
+                            for j in range(self.n_columns)]
+        y = np.vstack([self._tail, x])
+        self._tail = y[-self.window:].copy()
+        medians = np.full(x.shape, np.nan)
+        mads = np.full(x.shape, np.nan)
+        counts = np.zeros(x.shape, dtype=np.intp)
+        leaving = y[:len(x)].tolist()
+        for i, row in enumerate(x.tolist()):
+            for j, ordered in enumerate(self._sorted):
+                counts[i, j] = len(ordered)
+                medians[i, j], mads[i, j] = self._window_stats(ordered)
+                old = leaving[i][j]
+                if old == old:
+                    del ordered[bisect_left(ordered, old)]
+                if row[j] == row[j]:
+                    insort(ordered, row[j])
+        scores = _standardized(x, medians, mads)
+        scores[counts < max(self.min_periods, 1)] = np.nan
+        return scores
+
+    def _scores(self, x):
+        w = self.window
+        if len(x) < w:
+            return self._push_scores(x)
+        self._sorted = None
+        y = np.vstack([self._tail, x])
+        self._tail = y[-w:].copy()
+        # Fenêtre du point i : les w points qui le précèdent, y[i:i + w]
+        windows = np.lib.stride_tricks.sliding_window_view(y[:-1], w, axis=0)
+        scores = np.full(x.shape, np.nan)
+        step = max(1, MAD_BLOCK_VALUES // (w * self.n_columns))
+        for start in range(0, len(x), step):
+            block = windows[start:start + step]
+            counts = np.count_nonzero(~np.isnan(block), axis=-1)
+            ordered = np.sort(block, axis=-1)
+            median = self._sorted_median(ordered, counts)
+            deviations = np.sort(np.abs(block - median[..., None]), axis=-1)
+            mad = self._sorted_median(deviations, counts) * MAD_SCALE
+            block_scores = _standardized(x[start:start + step], median, mad)
+            block_scores[counts < max(self.min_periods, 1)] = np.nan
+            scores[start:start + step] = block_scores
+        return scores
+
+
+class EWMADetector(_Detector):
+    """
+    Résidu réduit par rapport à la moyenne et à l'écart-type exponentiels du point précédent.
+
+    Attributes:
+        alpha: Facteur de lissage
+        min_periods: Nombre minimal d'observations avant le premier score
+        threshold: Seuil sur |résidu réduit|
+    """
+
+    def __init__(self, alpha=None, threshold=3.0, min_periods=10, n_columns=1, span=None,
+                 halflife=None, com=None):
+        super().__init__(threshold, n_columns)
+        if alpha is None and span is None and halflife is None and com is None:
+            span = 20
+        self.alpha = resolve_alpha(alpha, span, halflife, com)
+        self.min_periods = int(min_periods)
+        self._mean = ExponentialMovingState(self.alpha, 'mean', min_periods=self.min_periods,
+                                            n_columns=self.n_columns)
+        self._std = ExponentialMovingState(self.alpha, 'std', min_periods=self.min_periods,
+                                           n_columns=self.n_columns)
+        self._last_mean = np.full(self.n_columns, np.nan)
+        self._last_std = np.full(self.n_columns, np.nan)
+
+    def _scores(self, x):
+        means = self._mean.update(x)
+        stds = self._std.update(x)
+        previous_mean = np.vstack([self._last_mean, means[:-1]])
+        previous_std = np.vstack([self._last_std, stds[:-1]])
+        self._last_mean, self._last_std = means[-1].copy(), stds[-1].copy()
+        return _standardized(x, previous_mean, previous_std)
+
+
+def make_detector(method='zscore', window=50, threshold=None, min_periods=None, n_columns=1,
+                  **ewm_options):
+    """
+    Construit un détecteur.
+
+    Args:
+        method: 'zscore', 'mad' ou 'ewma'
+        window: Taille de fenêtre (zscore, mad) ; span par défaut de l'EWMA
+        threshold: Seuil (3.0, ou 3.5 pour 'mad', par défaut)
+        min_periods: Historique minimal avant le premier score
+        n_columns: Nombre de séries traitées côte à côte
+        **ewm_options: alpha, span, halflife ou com pour 'ewma'
+
+    Returns:
+        Détecteur (méthode update(values), flags(scores))
+    """
+    if method == 'zscore':
+        return RollingZScoreDetector(window, 3.0 if threshold is None else threshold,
+                                     min_periods, n_columns)
+    if method == 'mad':
+        return RollingMADDetector(window, 3.5 if threshold is None else threshold,
+                                  min_periods, n_columns)
+    if method == 'ewma':
+        if not ewm_options:
+            ewm_options = {'span': window}
+        return EWMADetector(threshold=3.0 if threshold is None else threshold,
+                            min_periods=window if min_periods is None else min_periods,
+                            n_columns=n_columns, **ewm_options)
+    raise ValueError(f"Méthode {method} non supportée")
+
+
+def detect(values, method='zscore', **options):
+    """
+    Scores et anomalies d'un tableau entier (mode lot).
+
+    Args:
+        values: Série (n,) ou matrice (n, séries)
+        method: 'zscore', 'mad' ou 'ewma'
+        **options: Options de make_detector
+
+    Returns:
+        Tuple (scores, anomalies) de même forme que values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_columns = 1 if values.ndim == 1 else values.shape[1]
+    detector = make_detector(method, n_columns=n_columns, **options)
+    scores = detector.update(values)
+    return scores, detector.flags(scores)
@@ -0,0 +1,149 @@
+'''
+=====================================================================
+File : panel.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Analyse vectorisée d'un panel de séries temporelles de même longueur
+(matrice séries x temps).
+
+Les statistiques de TimeSeriesAnalyzer.process sont calculées pour
+toutes les séries à la fois par opérations numpy le long de l'axe du
+temps : tendance par moindres carrés en forme fermée (un produit
+matrice-vecteur) et fréquence dominante par rfft.
+
+tags : module, stats, temporelle, panel
+=====================================================================
+'''
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = [
+    'Moyenne', 'Écart-type', 'Minimum', 'Maximum', 'Médiane',
+    'Pente', 'Intercept', 'Fréquence Principale', 'Période Principale',
+]
+
+
+def linear_trend(values):
+    """
+    Pente et ordonnée à l'origine de la droite des moindres carrés de chaque ligne.
+
+    Args:
+        values: Matrice (séries, temps)
+
+    Returns:
+        Tuple (pentes, intercepts)
+    """
+    n = values.shape[1]
+    centered_time = np.arange(n) - (n - 1) / 2.0
+    # Somme des carrés de t - moyenne(t) : n (n² - 1) / 12
+    slope = (values @ centered_time) / (n * (n * n - 1) / 12.0)
+    intercept = values.mean(axis=1) - slope * (n - 1) / 2.0
+    return slope, intercept
+
+
+def dominant_frequency(values):
+    """
+    Fréquence du plus grand module du spectre (hors composante continue et Nyquist).
+
+    Mêmes fréquences candidates que np.fft.fft restreint à [1, n // 2),
+    calculées par rfft.
+
+    Args:
+        values: Matrice (séries, temps)
+
+    Returns:
+        Tuple (fréquences, périodes) ; NaN si n < 4
+    """
+    k, n = values.shape
+    if n // 2 <= 1:
+        return np.full(k, np.nan), np.full(k, np.nan)
+    spectrum = np.abs(np.fft.rfft(values, axis=1)[:, 1:n // 2])
+    frequency = (np.argmax(spectrum, axis=1) + 1) / n
+    return frequency, 1.0 / frequency
+
+
+def panel_summary(values):
+    """
+    Statistiques de TimeSeriesAnalyzer.process pour chaque ligne.
+
+    Args:
+        values: Matrice (séries, temps) sans valeurs manquantes
+
+    Returns:
+        Matrice (séries, len(COLUMNS))
+    """
+    values = np.asarray(values, dtype=np.float64)
+    k, n = values.shape
+    out = np.full((k, len(COLUMNS)), np.nan)
+    if n == 0:
+        return out
+    out[:, 0] = values.mean(axis=1)
+    if n > 1:
+        out[:, 1] = values.std(axis=1, ddof=1)
+    out[:, 2] = values.min(axis=1)
+    out[:, 3] = values.max(axis=1)
+    out[:, 4] = np.median(values, axis=1)
+    if n > 1:
+        out[:, 5], out[:, 6] = linear_trend(values)
+    if n > 2:
+        out[:, 7], out[:, 8] = dominant_frequency(values)
+    return out
+
+
+def split_rows(values, n_chunks, max_rows=None):
+    """
+    Découpe une matrice en blocs de lignes contigus (vues).
+
+    Args:
+        values: Matrice (séries, temps)
+        n_chunks: Nombre de blocs souhaité
+        max_rows: Nombre maximal de lignes par bloc
+
+    Returns:
+        Liste de blocs
+    """
+    k = len(values)
+    size = max(1, -(-k // max(1, n_chunks)))
+    if max_rows is not None:
+        size = max(1, min(size, int(max_rows)))
+    return [values[start:start + size] for start in range(0, k, size)]
+
+
+def long_to_blocks(data, id_column, value_column, time_column=None):
+    """
+    Regroupe un DataFrame long en matrices denses par longueur de série.
+
+    Args:
+        data: DataFrame long (une ligne par observation)
+        id_column: Colonne identifiant la série
+        value_column: Colonne des valeurs
+        time_column: Colonne d'ordre temporel (ordre des lignes sinon)
+
+    Returns:
+        Liste de couples (identifiants, matrice (séries, longueur))
+    """
+    if time_column is not None:
+        data = data.sort_values([id_column, time_column], kind='stable')
+    codes, ids = pd.factorize(data[id_column], sort=True)
+    values = data[value_column].to_numpy(dtype=np.float64)
+    # Observations sans identifiant ignorées
+    values, codes = values[codes >= 0], codes[codes >= 0]
+    order = np.argsort(codes, kind='stable')
+    lengths = np.bincount(codes, minlength=len(ids))
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    ordered = values[order]
+    blocks = []
+    for length in np.unique(lengths):
+        series = np.flatnonzero(lengths == length)
+        index = starts[series][:, None] + np.arange(length)
+        blocks.append((ids[series], ordered[index]))
+    return blocks
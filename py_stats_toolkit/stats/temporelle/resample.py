@@ -0,0 +1,376 @@
+'''
+=====================================================================
+File : resample.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Agrégation par intervalles de temps (rééchantillonnage) de séries
+horodatées : ouverture, plus haut, plus bas, clôture, moyenne, somme et
+effectif par intervalle.
+
+L'intervalle d'un point est la division entière de son horodatage
+(int64, nanosecondes) par la durée de l'intervalle. Les horodatages
+étant triés, chaque intervalle est un segment contigu de lignes, réduit
+par np.ufunc.reduceat sur les débuts de segments. En flux, l'état réduit
+du dernier intervalle (éventuellement incomplet) est reporté sur le
+tronçon suivant.
+
+tags : module, stats, temporelle, reechantillonnage
+=====================================================================
+'''
+
+import numpy as np
+import pandas as pd
+
+from ..descriptives.rolling import as_duration, as_nanoseconds
+
+AGGREGATIONS = ('open', 'high', 'low', 'close', 'mean', 'sum', 'count')
+
+DEFAULT_AGGREGATIONS = ('open', 'high', 'low', 'close', 'mean', 'count')
+
+LABELS = {
+    'open': 'Ouverture', 'high': 'Plus haut', 'low': 'Plus bas', 'close': 'Clôture',
+    'mean': 'Moyenne', 'sum': 'Somme', 'count': 'Effectif',
+}
+
+# Statistiques réduites d'un intervalle (la moyenne s'en déduit)
+STATE_KEYS = ('open', 'high', 'low', 'close', 'sum', 'count')
+
+
+def origin_nanoseconds(origin=None):
+    """Origine des intervalles en nanosecondes (epoch par défaut)."""
+    if origin is None:
+        return 0
+    if isinstance(origin, (int, np.integer)):
+        return int(origin)
+    return int(pd.Timestamp(origin).value)
+
+
+def validate_aggregations(aggregations):
+    """Vérifie et retourne la liste des agrégations demandées."""
+    aggregations = tuple(aggregations)
+    unknown = [name for name in aggregations if name not in AGGREGATIONS]
+    if unknown:
+        raise ValueError(f"Agrégations non supportées : {unknown}")
+    return aggregations
+
+
+def bucket_bounds(timestamps, freq, origin=0):
+    """
+    Intervalles présents et début de leur segment de lignes.
+
+    Args:
+        timestamps: Horodatages triés (int64, nanosecondes)
+        freq: Durée d'un intervalle (nanosecondes)
+        origin: Origine des intervalles (nanosecondes)
+
+    Returns:
+        Tuple (numéros d'intervalle, indices de début de segment)
+    """
+    if (timestamps[1:] < timestamps[:-1]).any():
+        raise ValueError("Les horodatages doivent être triés par ordre croissant")
+    ids = np.floor_divide(timestamps - origin, freq)
+    if len(ids) == 0:
+        return ids, np.empty(0, dtype=np.intp)
+    starts = np.concatenate([[0], np.flatnonzero(ids[1:] != ids[:-1]) + 1])
+    return ids[starts], starts
+
+
+def reduce_buckets(values, starts):
+    """
+    Réduit chaque segment de lignes (intervalle) d'une matrice (temps x séries).
+
+    Les valeurs manquantes sont ignorées ; un intervalle sans valeur
+    valide a un effectif et une somme nuls, et NaN ailleurs.
+
+    Args:
+        values: Matrice (temps, séries)
+        starts: Indices de début des segments
+
+    Returns:
+        Dictionnaire STATE_KEYS -> matrice (intervalles, séries)
+    """
+    # reduceat le long du temps est bien plus rapide colonne par colonne
+    values = np.asfortranarray(values)
+    n = len(values)
+    lengths = np.diff(np.append(starts, n))
+    valid = ~np.isnan(values)
+    if valid.all():
+        ends = starts + lengths - 1
+        return {
+            'open': values[starts],
+            'high': np.maximum.reduceat(values, starts, axis=0),
+            'low': np.minimum.reduceat(values, starts, axis=0),
+            'close': values[ends],
+            'sum': np.add.reduceat(values, starts, axis=0),
+            'count': np.repeat(lengths[:, None], values.shape[1], axis=1).astype(np.int64),
+        }
+    counts = np.add.reduceat(valid.astype(np.int64), starts, axis=0)
+    positions = np.arange(n)[:, None]
+    first = np.minimum.reduceat(np.where(valid, positions, n - 1), starts, axis=0)
+    last = np.maximum.reduceat(np.where(valid, positions, 0), starts, axis=0)
+    empty = counts == 0
+    return {
+        'open': np.where(empty, np.nan, np.take_along_axis(values, first, axis=0)),
+        'high': np.fmax.reduceat(values, starts, axis=0),
+        'low': np.fmin.reduceat(values, starts, axis=0),
+        'close': np.where(empty, np.nan, np.take_along_axis(values, last, axis=0)),
+        'sum': np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0),
+        'count': counts,
+    }
+
+
+def reduce_columns(values, starts, map_func=None, n_blocks=1):
+    """
+    reduce_buckets par blocs de colonnes (séries), éventuellement en parallèle.
+
+    Args:
+        values: Matrice (temps, séries)
+        starts: Indices de début des segments
+        map_func: Fonction map(func, items) (map intégré par défaut)
+        n_blocks: Nombre de blocs de colonnes
+
+    Returns:
+        Dictionnaire STATE_KEYS -> matrice (intervalles, séries)
+    """
+    k = values.shape[1]
+    size = max(1, -(-k // max(1, n_blocks)))
+    blocks = [values[:, start:start + size] for start in range(0, k, size)]
+    if len(blocks) <= 1 or map_func is None:
+        return reduce_buckets(values, starts)
+    reduced = list(map_func(_ReduceTask(starts), blocks))
+    return {key: np.hstack([part[key] for part in reduced]) for key in STATE_KEYS}
+
+
+class _ReduceTask:
+    """Réduction d'un bloc de colonnes sur des débuts de segments fixés (sérialisable)."""
+
+    def __init__(self, starts):
+        self.starts = starts
+
+    def __call__(self, values):
+        return reduce_buckets(values, self.starts)
+
+
+def combine(first, second):
+    """
+    Combine les états réduits d'un même intervalle vu en deux morceaux consécutifs.
+
+    Args:
+        first: État du morceau le plus ancien (STATE_KEYS -> vecteur)
+        second: État du morceau suivant
+
+    Returns:
+        État de l'intervalle entier
+    """
+    return {
+        'open': np.where(first['count'] > 0, first['open'], second['open']),
+        'high': np.fmax(first['high'], second['high']),
+        'low': np.fmin(first['low'], second['low']),
+        'close': np.where(second['count'] > 0, second['close'], first['close']),
+        'sum': first['sum'] + second['sum'],
+        'count': first['count'] + second['count'],
+    }
+
+
+def fill_gaps(ids, state, first_id=None):
+    """
+    Ajoute les intervalles vides entre first_id (ou ids[0]) et ids[-1].
+
+    Args:
+        ids: Numéros d'intervalle présents, croissants
+        state: États réduits correspondants
+        first_id: Premier intervalle à produire
+
+    Returns:
+        Tuple (numéros contigus, états complétés)
+    """
+    if len(ids) == 0:
+        return ids, state
+    first_id = ids[0] if first_id is None else min(int(first_id), ids[0])
+    full = np.arange(first_id, ids[-1] + 1, dtype=np.int64)
+    if len(full) == len(ids):
+        return ids, state
+    rows = ids - first_id
+    filled = {}
+    for key, values in state.items():
+        default = 0 if key in ('sum', 'count') else np.nan
+        out = np.full((len(full),) + values.shape[1:], default, dtype=values.dtype)
+        out[rows] = values
+        filled[key] = out
+    return full, filled
+
+
+def finish(state, aggregations):
+    """Agrégations demandées à partir des états réduits (moyenne = somme / effectif)."""
+    out = {}
+    for name in aggregations:
+        if name == 'mean':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out[name] = np.where(state['count'] > 0, state['sum'] / state['count'], np.nan)
+        else:
+            out[name] = state[name]
+    return out
+
+
+def to_frame(starts, aggregated, columns=None, datetime=True):
+    """
+    Met en forme le résultat d'une agrégation.
+
+    Args:
+        starts: Début de chaque intervalle (nanosecondes)
+        aggregated: Agrégation -> matrice (intervalles, séries)
+        columns: Noms des séries (None pour une série unique)
+        datetime: Index en horodatages (sinon en nanosecondes)
+
+    Returns:
+        DataFrame indexé par début d'intervalle ; colonnes par agrégation
+        pour une série, MultiIndex (série, agrégation) sinon
+    """
+    index = pd.DatetimeIndex(starts.astype('datetime64[ns]')) if datetime else pd.Index(starts)
+    index.name = 'Début'
+    if columns is None:
+        return pd.DataFrame({LABELS[name]: values[:, 0] for name, values in aggregated.items()}, index=index)
+    frames = {LABELS[name]: pd.DataFrame(values, index=index, columns=columns)
+              for name, values in aggregated.items()}
+    result = pd.concat(frames, axis=1).swaplevel(axis=1)
+    return result[columns]
+
+
+def resample(timestamps, values, freq, origin=None, aggregations=DEFAULT_AGGREGATIONS,
+             empty_buckets=False, map_func=None, n_blocks=1):
+    """
+    Agrégation par intervalles de temps d'une ou plusieurs séries (mode lot).
+
+    Args:
+        timestamps: Horodatages triés (DatetimeIndex, datetime64 ou int64 ns)
+        values: Série (n,) ou matrice (n, séries)
+        freq: Durée d'un intervalle ('1s', Timedelta...)
+        origin: Origine des intervalles (epoch par défaut)
+        aggregations: Agrégations parmi AGGREGATIONS
+        empty_buckets: Produit aussi les intervalles vides
+        map_func: Fonction map(func, items) pour les blocs de séries
+        n_blocks: Nombre de blocs de séries
+
+    Returns:
+        Tuple (débuts d'intervalle en nanosecondes, agrégation -> matrice
+        (intervalles, séries))
+    """
+    aggregations = validate_aggregations(aggregations)
+    freq, origin = as_duration(freq), origin_nanoseconds(origin)
+    timestamps = as_nanoseconds(timestamps)
+    values = np.asarray(values, dtype=np.float64)
+    values = values.reshape(-1, 1) if values.ndim == 1 else values
+    if len(timestamps) != len(values):
+        raise ValueError("Horodatages et valeurs doivent avoir la même longueur")
+    ids, starts = bucket_bounds(timestamps, freq, origin)
+    state = reduce_columns(values, starts, map_func, n_blocks) if len(starts) else \
+        {key: np.empty((0, values.shape[1])) for key in STATE_KEYS}
+    if empty_buckets:
+        ids, state = fill_gaps(ids, state)
+    return ids * freq + origin, finish(state, aggregations)
+
+
+class BucketAggregator:
+    """
+    Agrégation par intervalles de temps en flux, par tronçons triés.
+
+    Chaque update() retourne les intervalles terminés ; le dernier
+    intervalle d'un tronçon peut se poursuivre dans le suivant, son état
+    réduit (ouverture, extrêmes, clôture, somme, effectif) est donc
+    conservé et combiné avec le début du tronçon suivant. La mémoire ne
+    dépend que du nombre de séries.
+
+    Attributes:
+        freq: Durée d'un intervalle (nanosecondes)
+        origin: Origine des intervalles (nanosecondes)
+        aggregations: Agrégations produites
+        last_timestamp: Dernier horodatage reçu
+    """
+
+    def __init__(self, freq, origin=None, aggregations=DEFAULT_AGGREGATIONS, empty_buckets=False):
+        self.freq = as_duration(freq)
+        self.origin = origin_nanoseconds(origin)
+        self.aggregations = validate_aggregations(aggregations)
+        self.empty_buckets = bool(empty_buckets)
+        self.n_columns = None
+        self.last_timestamp = None
+        self._carry_id = None
+        self._carry = None
+        self._next_id = None
+
+    def update(self, timestamps, values, map_func=None, n_blocks=1):
+        """
+        Ajoute un tronçon trié et retourne les intervalles terminés.
+
+        Args:
+            timestamps: Horodatages du tronçon, postérieurs ou égaux au
+                dernier horodatage reçu
+            values: Série (n,) ou matrice (n, séries)
+            map_func: Fonction map(func, items) pour les blocs de séries
+            n_blocks: Nombre de blocs de séries
+
+        Returns:
+            Tuple (débuts d'intervalle en nanosecondes, agrégation ->
+            matrice (intervalles, séries))
+        """
+        timestamps = as_nanoseconds(timestamps)
+        values = np.asarray(values, dtype=np.float64)
+        values = values.reshape(-1, 1) if values.ndim == 1 else values
+        if len(timestamps) != len(values):
+            raise ValueError("Horodatages et valeurs doivent avoir la même longueur")
+        if self.n_columns is None:
+            self.n_columns = values.shape[1]
+        elif values.shape[1] != self.n_columns:
+            raise ValueError(f"Nombre de séries attendu : {self.n_columns}")
+        if len(timestamps) == 0:
+            return self._emit(np.empty(0, dtype=np.int64), self._empty_state())
+        if self.last_timestamp is not None and timestamps[0] < self.last_timestamp:
+            raise ValueError("Les tronçons doivent être triés et consécutifs dans le temps")
+        self.last_timestamp = int(timestamps[-1])
+
+        ids, starts = bucket_bounds(timestamps, self.freq, self.origin)
+        state = reduce_columns(values, starts, map_func, n_blocks)
+        if self._carry is not None:
+            if ids[0] == self._carry_id:
+                merged = combine(self._carry, {key: state[key][0] for key in STATE_KEYS})
+                for key in STATE_KEYS:
+                    state[key][0] = merged[key]
+            else:
+                ids = np.concatenate([[self._carry_id], ids])
+                state = {key: np.vstack([self._carry[key][None], state[key]]) for key in STATE_KEYS}
+        # Le dernier intervalle reste ouvert jusqu'au tronçon suivant
+        self._carry_id = ids[-1]
+        self._carry = {key: state[key][-1].copy() for key in STATE_KEYS}
+        return self._emit(ids[:-1], {key: state[key][:-1] for key in STATE_KEYS})
+
+    def flush(self):
+        """
+        Termine le flux et retourne le dernier intervalle (éventuellement incomplet).
+
+        Returns:
+            Tuple (débuts d'intervalle, agrégation -> matrice)
+        """
+        if self._carry is None:
+            return self._emit(np.empty(0, dtype=np.int64), self._empty_state())
+        ids = np.array([self._carry_id], dtype=np.int64)
+        state = {key: self._carry[key][None] for key in STATE_KEYS}
+        self._carry_id, self._carry = None, None
+        return self._emit(ids, state)
+
+    def _empty_state(self):
+        return {key: np.empty((0, self.n_columns or 1)) for key in STATE_KEYS}
+
+    def _emit(self, ids, state):
+        if self.empty_buckets and len(ids):
+            ids, state = fill_gaps(ids, state, self._next_id)
+        if len(ids):
+            self._next_id = int(ids[-1]) + 1
+        return ids * self.freq + self.origin, finish(state, self.aggregations)
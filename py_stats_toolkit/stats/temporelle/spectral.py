@@ -0,0 +1,328 @@
+'''
+=====================================================================
+File : spectral.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Autocorrélations, autocorrélations partielles, périodogramme de Welch et
+détection de saisonnalité, pour une série ou un lot de séries (lignes
+d'une matrice séries x temps).
+
+L'ACF de tous les décalages est obtenue par rfft avec zéros de
+complément (|F|² puis irfft), la PACF par la récursion de
+Durbin-Levinson vectorisée sur les séries. Les périodes candidates sont
+les pics du périodogramme moyenné par segments (Welch/Bartlett), chaque
+segment étant privé de sa tendance linéaire, affinées au décalage entier de
+plus forte autocorrélation puis notées par cette autocorrélation ; les
+candidats sous un score minimal sont écartés.
+
+tags : module, stats, temporelle, spectre, saisonnalite
+=====================================================================
+'''
+
+import numpy as np
+import pandas as pd
+from scipy import fft, signal
+
+# Période maximale recherchée par défaut (en observations)
+DEFAULT_MAX_PERIOD = 16384
+
+# Score ACF minimal d'une période retenue (en dessous : pas de saisonnalité)
+DEFAULT_MIN_SCORE = 0.2
+
+# Nombre maximal de segments moyennés pour la détection de saisonnalité
+SEASONALITY_SEGMENTS = 32
+
+
+def _as_rows(values):
+    """Matrice (séries, temps) float64 et indicateur d'entrée 1-D."""
+    values = np.asarray(values, dtype=np.float64)
+    single = values.ndim == 1
+    values = values.reshape(1, -1) if single else values
+    if values.ndim != 2:
+        raise ValueError("Les données doivent être une série ou une matrice (séries x temps)")
+    if np.isnan(values).any():
+        raise ValueError("Les séries ne doivent pas contenir de valeurs manquantes")
+    return values, single
+
+
+def acf(values, max_lag=None):
+    """
+    Autocorrélations (estimateur biaisé, série centrée) pour les lags 0..max_lag.
+
+    Les zéros de complément portent la longueur de transformée à
+    n + max_lag, ce qui évite le recouvrement circulaire.
+
+    Args:
+        values: Série (n,) ou matrice (séries, n)
+        max_lag: Décalage maximal (n - 1 par défaut)
+
+    Returns:
+        Tableau (max_lag + 1,) ou (séries, max_lag + 1)
+    """
+    values, single = _as_rows(values)
+    n = values.shape[1]
+    max_lag = n - 1 if max_lag is None else min(int(max_lag), n - 1)
+    centered = values - values.mean(axis=1, keepdims=True)
+    n_fft = fft.next_fast_len(n + max_lag, real=True)
+    spectrum = fft.rfft(centered, n=n_fft, axis=1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    autocovariance = fft.irfft(power, n=n_fft, axis=1)[:, :max_lag + 1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = autocovariance / autocovariance[:, :1]
+    return result[0] if single else result
+
+
+def pacf_from_acf(autocorrelation):
+    """
+    Autocorrélations partielles par la récursion de Durbin-Levinson.
+
+    Args:
+        autocorrelation: ACF (L + 1,) ou (séries, L + 1), lag 0 inclus
+
+    Returns:
+        PACF de même forme (1 au lag 0)
+    """
+    r = np.asarray(autocorrelation, dtype=np.float64)
+    single = r.ndim == 1
+    r = r.reshape(1, -1) if single else r
+    k, size = r.shape
+    out = np.ones((k, size))
+    if size < 2:
+        return out[0] if single else out
+    phi = r[:, 1:2].copy()
+    out[:, 1] = r[:, 1]
+    variance = 1.0 - r[:, 1] ** 2
+    for m in range(2, size):
+        # phi_mm = (r_m - sum_j phi_{m-1,j} r_{m-j}) / v_{m-1}
+        with np.errstate(invalid='ignore', divide='ignore'):
+            reflection = (r[:, m] - np.einsum('ij,ij->i', phi, r[:, m - 1:0:-1])) / variance
+        phi = np.concatenate([phi - reflection[:, None] * phi[:, ::-1], reflection[:, None]], axis=1)
+        variance = variance * (1.0 - reflection ** 2)
+        out[:, m] = reflection
+    return out[0] if single else out
+
+
+def pacf(values, max_lag):
+    """
+    Autocorrélations partielles pour les lags 0..max_lag.
+
+    Args:
+        values: Série (n,) ou matrice (séries, n)
+        max_lag: Décalage maximal
+
+    Returns:
+        Tableau (max_lag + 1,) ou (séries, max_lag + 1)
+    """
+    return pacf_from_acf(acf(values, max_lag))
+
+
+def welch_periodogram(values, segment_length=None, overlap=0.5):
+    """
+    Périodogramme moyenné de Welch (fenêtre de Hann, segments recouvrants).
+
+    Args:
+        values: Série (n,) ou matrice (séries, n)
+        segment_length: Longueur des segments (min(n, 4096) par défaut)
+        overlap: Fraction de recouvrement des segments
+
+    Returns:
+        Tuple (fréquences en cycles par observation, densités spectrales)
+    """
+    values, single = _as_rows(values)
+    n = values.shape[1]
+    segment_length = min(n, 4096 if segment_length is None else int(segment_length))
+    frequencies, power = signal.welch(
+        values, nperseg=segment_length, noverlap=int(segment_length * overlap),
+        window='hann', detrend='constant', axis=1,
+    )
+    return frequencies, power[0] if single else power
+
+
+def averaged_spectrum(values, segment_length, block=64, detrend=False, max_segments=None):
+    """
+    Périodogramme moyenné et autocorrélations en une passe de rfft.
+
+    La série centrée est découpée en segments contigus de longueur L,
+    complétés de zéros jusqu'à 2L : la moyenne des |F|² est le
+    périodogramme de Bartlett (Welch sans recouvrement, fenêtre
+    rectangulaire) et sa transformée inverse donne les autocovariances
+    intra-segment des lags 0..L-1, sans recouvrement circulaire. Les
+    segments sont traités par blocs pour borner la mémoire.
+
+    Args:
+        values: Matrice (séries, n) sans valeurs manquantes
+        segment_length: Longueur L des segments (tronquée à n)
+        block: Nombre de segments transformés à la fois
+        detrend: Si True, chaque segment est privé de sa droite des
+            moindres carrés au lieu de la moyenne de la série
+        max_segments: Nombre maximal de segments moyennés, répartis
+            régulièrement sur la série (tous par défaut)
+
+    Returns:
+        Tuple (fréquences (L + 1,), puissances (séries, L + 1),
+        autocorrélations (séries, L))
+    """
+    k, n = values.shape
+    length = max(2, min(int(segment_length), n))
+    n_segments = n // length
+    segments = values[:, :n_segments * length].reshape(k, n_segments, length)
+    if max_segments is not None and n_segments > max_segments:
+        chosen = np.unique(np.linspace(0, n_segments - 1, int(max_segments)).round().astype(np.intp))
+        segments = segments[:, chosen]
+        n_segments = len(chosen)
+    if detrend:
+        # Droite des moindres carrés de chaque segment : temps centré
+        time = np.arange(length) - (length - 1) / 2.0
+        time_norm = time @ time
+    else:
+        means = values.mean(axis=1)[:, None, None]
+    power = np.zeros((k, length + 1))
+    for start in range(0, n_segments, block):
+        part = segments[:, start:start + block]
+        if detrend:
+            slopes = (part @ time) / time_norm
+            part = part - part.mean(axis=2, keepdims=True) - slopes[..., None] * time
+        else:
+            part = part - means
+        spectrum = fft.rfft(part, n=2 * length, axis=2)
+        power += (spectrum.real ** 2 + spectrum.imag ** 2).sum(axis=1)
+    autocovariance = fft.irfft(power, n=2 * length, axis=1)[:, :length]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        autocorrelation = autocovariance / autocovariance[:, :1]
+    frequencies = np.arange(length + 1) / (2.0 * length)
+    return frequencies, power / (n_segments * length), autocorrelation
+
+
+def _candidate_peaks(power, n_candidates):
+    """Indices des n_candidates plus hauts maxima locaux de chaque spectre."""
+    peaks = np.full(power.shape, -np.inf)
+    inner = (power[:, 1:-1] > power[:, :-2]) & (power[:, 1:-1] >= power[:, 2:])
+    peaks[:, 1:-1] = np.where(inner, power[:, 1:-1], -np.inf)
+    n_candidates = min(n_candidates, power.shape[1])
+    index = np.argpartition(-peaks, n_candidates - 1, axis=1)[:, :n_candidates]
+    return index, np.take_along_axis(peaks, index, axis=1)
+
+
+def seasonality_candidates(values, max_period=None, n_candidates=5, segment_length=None,
+                           min_score=DEFAULT_MIN_SCORE):
+    """
+    Périodes candidates notées par l'autocorrélation.
+
+    La tendance linéaire est retirée de chaque segment : sinon elle
+    domine les basses fréquences et l'ACF, et la période retenue est la
+    plus longue autorisée. Au plus SEASONALITY_SEGMENTS segments,
+    répartis régulièrement sur la série, sont moyennés. Les pics du périodogramme moyenné donnent chacun un intervalle de
+    périodes (résolution 1 / L des segments) ; le décalage entier de plus
+    forte autocorrélation dans cet intervalle est retenu et noté par cette
+    autocorrélation. Les candidats tombant dans l'intervalle d'un pic plus
+    puissant (lobes secondaires) sont écartés. Périodogramme et ACF
+    viennent de la même passe de rfft par segments (averaged_spectrum) :
+    le coût est O(min(n, 32 L) log L).
+
+    Args:
+        values: Série (n,) ou matrice (séries, n)
+        max_period: Période maximale recherchée (min(n // 2, 16384) par
+            défaut)
+        n_candidates: Nombre de pics examinés par série
+        segment_length: Longueur des segments (par défaut la puissance de
+            2 supérieure à 4 * max_period)
+        min_score: Score ACF minimal d'un candidat (None : aucun seuil)
+
+    Returns:
+        Tuple (périodes (séries, c), scores ACF (séries, c), puissances
+        (séries, c)), triés par score décroissant ; NaN pour les candidats
+        absents ou sous le score minimal
+    """
+    values, _ = _as_rows(values)
+    k, n = values.shape
+    limit = min(n // 2, DEFAULT_MAX_PERIOD) if max_period is None else min(int(max_period), n // 2)
+    empty = np.full((k, n_candidates), np.nan)
+    if limit < 2:
+        return empty, empty.copy(), empty.copy()
+    if segment_length is None:
+        segment_length = max(256, 1 << int(np.ceil(np.log2(4 * limit))))
+    frequencies, power, autocorrelation = averaged_spectrum(
+        values, segment_length, detrend=True, max_segments=SEASONALITY_SEGMENTS
+    )
+    length = autocorrelation.shape[1]
+    limit = min(limit, length - 1)
+    resolution = 1.0 / length
+
+    index, peak_power = _candidate_peaks(power, n_candidates)
+    periods, scores = empty.copy(), empty.copy()
+    for row in range(k):
+        # Intervalles déjà couverts par un pic plus puissant (lobes secondaires)
+        covered = []
+        for column in np.argsort(-peak_power[row], kind='stable'):
+            if not np.isfinite(peak_power[row, column]):
+                break
+            frequency = frequencies[index[row, column]]
+            low = max(2, int(np.floor(1.0 / (frequency + resolution))))
+            high = min(limit, int(np.ceil(1.0 / max(frequency - resolution, 1.0 / limit))))
+            if low > high:
+                continue
+            best = low + int(np.argmax(autocorrelation[row, low:high + 1]))
+            if any(start <= best <= stop for start, stop in covered):
+                continue
+            covered.append((low, high))
+            if min_score is not None and not autocorrelation[row, best] >= min_score:
+                continue
+            periods[row, column] = best
+            scores[row, column] = autocorrelation[row, best]
+    order = np.argsort(np.where(np.isnan(scores), np.inf, -scores), axis=1, kind='stable')
+    peak_power = np.where(np.isnan(periods), np.nan, peak_power)
+    return (
+        np.take_along_axis(periods, order, axis=1),
+        np.take_along_axis(scores, order, axis=1),
+        np.take_along_axis(peak_power, order, axis=1),
+    )
+
+
+def detect_seasonality(values, max_period=None, n_candidates=5, segment_length=None,
+                       min_score=DEFAULT_MIN_SCORE):
+    """
+    Période saisonnière la mieux notée de chaque série.
+
+    Args:
+        values: Série (n,) ou matrice (séries, n)
+        max_period: Période maximale recherchée
+        n_candidates: Nombre de pics examinés par série
+        segment_length: Longueur des segments de Welch
+        min_score: Score ACF minimal de la période retenue
+
+    Returns:
+        Tuple (période, score ACF) : scalaires pour une série, tableaux
+        sinon ; NaN sans candidat atteignant min_score (bruit blanc)
+    """
+    single = np.ndim(values) == 1
+    periods, scores, _ = seasonality_candidates(values, max_period, n_candidates, segment_length,
+                                                min_score)
+    if single:
+        return periods[0, 0], scores[0, 0]
+    return periods[:, 0], scores[:, 0]
+
+
+def candidates_frame(values, max_period=None, n_candidates=5, segment_length=None,
+                     min_score=DEFAULT_MIN_SCORE):
+    """
+    Candidats d'une série sous forme de DataFrame.
+
+    Returns:
+        DataFrame (Période, Score ACF, Puissance) trié par score décroissant
+    """
+    periods, scores, power = seasonality_candidates(values, max_period, n_candidates, segment_length,
+                                                    min_score)
+    found = ~np.isnan(periods[0])
+    return pd.DataFrame({
+        'Période': periods[0, found].astype(np.int64),
+        'Score ACF': scores[0, found],
+        'Puissance': power[0, found],
+    })
@@ -0,0 +1,224 @@
+'''
+=====================================================================
+File : streaming.py
+=====================================================================
+version : 1.0.0
+release : 18/10/2026
+author : Phoenix Project
+contact : contact@phonxproject.onmicrosoft.fr
+license : MIT
+=====================================================================
+Copyright (c) 2025, Phoenix Project
+All rights reserved.
+
+Résumé en ligne d'une série temporelle, mis à jour en O(1) amorti par
+point.
+
+L'état tient en quelques scalaires : moyenne et variance de Welford,
+minimum et maximum, moments centrés (temps, valeur) pour la droite des
+moindres carrés, un t-digest pour la médiane et les derniers points
+pour la fréquence dominante. Deux résumés de tronçons consécutifs se
+fusionnent (formules de Chan).
+
+tags : module, stats, temporelle, streaming
+=====================================================================
+'''
+
+import numpy as np
+import pandas as pd
+
+from ..frequence.histogram import TDigest
+from .panel import COLUMNS, dominant_frequency
+
+# Taille du tampon de points transmis d'un bloc au t-digest
+DIGEST_BATCH = 1024
+
+
+class StreamingSummary:
+    """
+    Statistiques de TimeSeriesAnalyzer.process maintenues point par point.
+
+    Le temps est la position du point dans la série (0, 1, ...), comme
+    dans process(). La médiane est estimée par t-digest ; la fréquence
+    dominante est calculée sur les spectral_window derniers points.
+
+    Attributes:
+        n: Nombre de points
+        mean: Moyenne des valeurs
+        m2: Somme des carrés des écarts à la moyenne
+        minimum, maximum: Extrêmes
+        time_mean: Moyenne des positions
+        time_m2: Somme des carrés des écarts des positions
+        comoment: Somme des produits croisés centrés (position, valeur)
+    """
+
+    def __init__(self, compression=200, spectral_window=4096):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.time_mean = 0.0
+        self.time_m2 = 0.0
+        self.comoment = 0.0
+        self.digest = TDigest(compression)
+        self.spectral_window = int(spectral_window or 0)
+        self._window = np.empty(self.spectral_window)
+        self._window_end = 0
+        self._pending = []
+
+    def update(self, value):
+        """
+        Ajoute un point en O(1) amorti (valeurs manquantes ignorées).
+
+        Args:
+            value: Valeur du point
+
+        Returns:
+            Le résumé lui-même
+        """
+        value = float(value)
+        if value != value:
+            return self
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        # Position n - 1 : Welford sur le temps et co-moment (temps, valeur)
+        time_delta = (self.n - 1) - self.time_mean
+        self.time_mean += time_delta / self.n
+        self.time_m2 += time_delta * ((self.n - 1) - self.time_mean)
+        self.comoment += time_delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if self.spectral_window:
+            self._window[self._window_end % self.spectral_window] = value
+            self._window_end += 1
+        self._pending.append(value)
+        if len(self._pending) >= DIGEST_BATCH:
+            self._flush()
+        return self
+
+    def update_many(self, values):
+        """
+        Ajoute un bloc de points (vectorisé, équivalent à des update successifs).
+
+        Args:
+            values: Valeurs du bloc, dans l'ordre du temps
+
+        Returns:
+            Le résumé lui-même
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        return self.merge(StreamingSummary._from_block(values, self.digest.compression, self.spectral_window))
+
+    @classmethod
+    def _from_block(cls, values, compression, spectral_window):
+        """Résumé d'un bloc de valeurs calculé en une passe vectorisée."""
+        summary = cls(compression, spectral_window)
+        n = len(values)
+        if not n:
+            return summary
+        positions = np.arange(n, dtype=np.float64)
+        summary.n = n
+        summary.mean = float(values.mean())
+        centered = values - summary.mean
+        summary.m2 = float(centered @ centered)
+        summary.minimum = float(values.min())
+        summary.maximum = float(values.max())
+        summary.time_mean = (n - 1) / 2.0
+        summary.time_m2 = n * (n * n - 1) / 12.0
+        summary.comoment = float((positions - summary.time_mean) @ centered)
+        summary.digest.update(values)
+        summary._push_window(values)
+        return summary
+
+    def _push_window(self, values):
+        """Ajoute des valeurs au tampon circulaire des derniers points."""
+        if not self.spectral_window:
+            return
+        values = values[-self.spectral_window:]
+        slots = (self._window_end + np.arange(len(values))) % self.spectral_window
+        self._window[slots] = values
+        self._window_end += len(values)
+
+    def _flush(self):
+        """Transmet au t-digest les points en attente."""
+        if self._pending:
+            self.digest.update(np.array(self._pending))
+            self._pending = []
+
+    def recent(self):
+        """Derniers points conservés (au plus spectral_window), dans l'ordre."""
+        count = min(self._window_end, self.spectral_window)
+        slots = (self._window_end - count + np.arange(count)) % max(1, self.spectral_window)
+        return self._window[slots]
+
+    def merge(self, other):
+        """
+        Fusionne le résumé d'un tronçon qui suit celui-ci dans le temps.
+
+        Les positions de other sont décalées de self.n ; moments et
+        co-moments sont combinés par les formules de Chan.
+
+        Args:
+            other: StreamingSummary du tronçon suivant
+
+        Returns:
+            Le résumé lui-même
+        """
+        other._flush()
+        self._flush()
+        if other.n == 0:
+            return self
+        recent = np.concatenate([self.recent(), other.recent()])
+        if self.n == 0:
+            n, mean, m2 = other.n, other.mean, other.m2
+            time_mean, time_m2, comoment = other.time_mean, other.time_m2, other.comoment
+        else:
+            n = self.n + other.n
+            delta = other.mean - self.mean
+            time_delta = (other.time_mean + self.n) - self.time_mean
+            weight = self.n * other.n / n
+            mean = self.mean + delta * other.n / n
+            m2 = self.m2 + other.m2 + delta * delta * weight
+            time_mean = self.time_mean + time_delta * other.n / n
+            time_m2 = self.time_m2 + other.time_m2 + time_delta * time_delta * weight
+            comoment = self.comoment + other.comoment + time_delta * delta * weight
+        self.n, self.mean, self.m2 = n, mean, m2
+        self.time_mean, self.time_m2, self.comoment = time_mean, time_m2, comoment
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.digest.merge(other.digest)
+        self._window_end = 0
+        self._push_window(recent)
+        return self
+
+    def snapshot(self):
+        """
+        Statistiques courantes, mêmes champs que TimeSeriesAnalyzer.process.
+
+        Returns:
+            Series (Moyenne, Écart-type, Minimum, Maximum, Médiane, Pente,
+            Intercept, Fréquence Principale, Période Principale)
+        """
+        self._flush()
+        stats = dict.fromkeys(COLUMNS, np.nan)
+        if self.n == 0:
+            return pd.Series(stats)
+        stats['Moyenne'] = self.mean
+        stats['Minimum'] = self.minimum
+        stats['Maximum'] = self.maximum
+        stats['Médiane'] = float(self.digest.quantile(0.5))
+        if self.n > 1:
+            stats['Écart-type'] = np.sqrt(self.m2 / (self.n - 1))
+            slope = self.comoment / self.time_m2
+            stats['Pente'] = slope
+            stats['Intercept'] = self.mean - slope * self.time_mean
+        recent = self.recent()
+        if len(recent) > 2:
+            frequency, period = dominant_frequency(recent.reshape(1, -1))
+            stats['Fréquence Principale'] = frequency[0]
+            stats['Période Principale'] = period[0]
+        return pd.Series(stats)
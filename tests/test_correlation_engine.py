@@ -0,0 +1,41 @@
+"""
+Tests du moteur de corrélation par tuiles (py_stats_toolkit.stats.correlation.engine).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.correlation.engine import tile_bounds, tile_pairs, tiled_correlation
+
+
+class TestTiledCorrelation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(size=(400, 230))
+        self.data[:, 10] = 2.5 * self.data[:, 3] - 1.0
+        self.data[:, 20] = 7.0
+
+    def test_matches_pandas_for_all_tile_sizes(self):
+        expected = pd.DataFrame(self.data).corr().values
+        for tile_size in (1, 17, 64, 1000):
+            result = tiled_correlation(self.data, tile_size=tile_size, wave_size=3)
+            np.testing.assert_allclose(result, expected, atol=1e-12)
+            self.assertTrue(np.isnan(result[20]).all())
+            np.testing.assert_array_equal(result, result.T)
+
+    def test_tiles_cover_upper_triangle(self):
+        bounds = tile_bounds(230, 64)
+        self.assertEqual(bounds[-1], (192, 230))
+        covered = np.zeros((230, 230), dtype=int)
+        for i0, i1, j0, j1 in tile_pairs(bounds):
+            covered[i0:i1, j0:j1] += 1
+        np.testing.assert_array_equal(np.triu(covered), np.triu(np.ones_like(covered)))
+
+    def test_writes_into_preallocated_output(self):
+        out = np.empty((230, 230))
+        result = tiled_correlation(self.data, tile_size=50, out=out)
+        self.assertIs(result, out)
+
+
+if __name__ == '__main__':
+    unittest.main()
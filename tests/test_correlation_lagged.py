@@ -0,0 +1,63 @@
+"""
+Tests des corrélations croisées décalées (py_stats_toolkit.stats.correlation.lagged).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.correlation.lagged import lagged_correlation, peak_lags
+
+
+class TestLaggedCorrelation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        n = 150
+        self.data = rng.normal(size=(n, 5))
+        self.data[3:, 1] = self.data[:-3, 0] + 0.1 * rng.normal(size=n - 3)
+        self.data[:, 4] = np.cumsum(self.data[:, 4])
+        self.frame = pd.DataFrame(self.data)
+
+    def test_matches_shifted_pearson(self):
+        lags, profile = lagged_correlation(self.data, 6, tile_size=2, wave_size=3)
+        np.testing.assert_array_equal(lags, np.arange(-6, 7))
+        for i in range(5):
+            for j in range(5):
+                expected = [self.frame[i].corr(self.frame[j].shift(-k)) for k in lags]
+                np.testing.assert_allclose(profile[i, j], expected, atol=1e-10)
+
+    def test_odd_transform_length(self):
+        # n + L = 2025 : next_fast_len retourne une longueur impaire
+        rng = np.random.default_rng(6)
+        data = rng.normal(size=(2000, 2))
+        data[7:, 1] += data[:-7, 0]
+        frame = pd.DataFrame(data)
+        lags, profile = lagged_correlation(data, 20)
+        for i, j in ((0, 1), (1, 0), (1, 1)):
+            expected = [frame[i].corr(frame[j].shift(-k)) for k in lags]
+            np.testing.assert_allclose(profile[i, j], expected, atol=1e-10)
+
+    def test_tiling_invariance(self):
+        _, reference = lagged_correlation(self.data, 4, tile_size=5)
+        for tile_size in (1, 3):
+            _, profile = lagged_correlation(self.data, 4, tile_size=tile_size)
+            np.testing.assert_allclose(profile, reference, atol=1e-12)
+
+    def test_peak_lag(self):
+        lags, profile = lagged_correlation(self.data, 6)
+        peak_lag, peak = peak_lags(lags, profile)
+        self.assertEqual(peak_lag[0, 1], 3)
+        self.assertEqual(peak_lag[1, 0], -3)
+        self.assertGreater(peak[0, 1], 0.99)
+        np.testing.assert_array_equal(np.diag(peak_lag), 0)
+
+    def test_rejects_invalid_input(self):
+        with self.assertRaises(ValueError):
+            lagged_correlation(self.data, 149)
+        data = self.data.copy()
+        data[0, 0] = np.nan
+        with self.assertRaises(ValueError):
+            lagged_correlation(data, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
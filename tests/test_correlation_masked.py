@@ -0,0 +1,40 @@
+"""
+Tests de la corrélation sur observations complètes par paire
+(py_stats_toolkit.stats.correlation.masked).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.correlation.masked import masked_correlation
+
+
+class TestMaskedCorrelation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.data = rng.normal(loc=1e4, size=(300, 25))
+        self.data[:, 5] = self.data[:, 2] * 3 + rng.normal(size=300)
+        self.data[rng.random(self.data.shape) < 0.2] = np.nan
+        self.data[:, 7] = np.nan
+        self.data[:3, 7] = 1.0
+        self.frame = pd.DataFrame(self.data)
+
+    def test_matches_pandas_pairwise(self):
+        corr, n = masked_correlation(self.data, tile_size=6, wave_size=2)
+        np.testing.assert_allclose(corr, self.frame.corr().values, atol=1e-10)
+        present = (~np.isnan(self.data)).astype(int)
+        np.testing.assert_array_equal(n, present.T @ present)
+
+    def test_min_periods(self):
+        corr, _ = masked_correlation(self.data, tile_size=7, min_periods=200)
+        np.testing.assert_allclose(corr, self.frame.corr(min_periods=200).values, atol=1e-10)
+
+    def test_tiling_invariance(self):
+        reference, _ = masked_correlation(self.data, tile_size=25)
+        for tile_size in (1, 4, 11):
+            corr, _ = masked_correlation(self.data, tile_size=tile_size)
+            np.testing.assert_allclose(corr, reference, atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
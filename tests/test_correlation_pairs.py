@@ -0,0 +1,45 @@
+"""
+Tests de la recherche de paires corrélées (py_stats_toolkit.stats.correlation.pairs).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.correlation.pairs import correlated_pairs, top_correlations
+
+
+class TestCorrelatedPairs(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(size=(250, 90))
+        self.data[:, 10] = self.data[:, 3] + 0.3 * rng.normal(size=250)
+        self.data[:, 50] = -self.data[:, 60] + 0.1 * rng.normal(size=250)
+        self.data[:, 20] = 1.0
+        self.matrix = pd.DataFrame(self.data).corr().values
+
+    def test_threshold_pairs_match_full_matrix(self):
+        result = correlated_pairs(self.data, threshold=0.2, tile_size=16, wave_size=3)
+        i, j = np.triu_indices(90, 1)
+        mask = np.abs(self.matrix[i, j]) >= 0.2
+        self.assertEqual(len(result), mask.sum())
+        expected = set(zip(i[mask], j[mask]))
+        self.assertEqual(set(zip(result['Variable 1'], result['Variable 2'])), expected)
+        self.assertEqual((result['Variable 1'][0], result['Variable 2'][0]), (50, 60))
+        np.testing.assert_allclose(
+            result['Corrélation'], self.matrix[result['Variable 1'], result['Variable 2']], atol=1e-12
+        )
+
+    def test_top_k_per_variable(self):
+        result = top_correlations(self.data, k=4, tile_size=16)
+        strength = np.nan_to_num(np.abs(self.matrix), nan=-1.0)
+        np.fill_diagonal(strength, -1.0)
+        for variable in (0, 3, 50, 89):
+            neighbours = result[result['Variable'] == variable]
+            self.assertEqual(list(neighbours['Rang']), [1, 2, 3, 4])
+            self.assertEqual(set(neighbours['Voisin']), set(np.argsort(-strength[variable])[:4]))
+        self.assertFalse((result['Variable'] == 20).any())
+        self.assertFalse((result['Voisin'] == 20).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests des corrélations de rang (py_stats_toolkit.stats.correlation.rank).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from py_stats_toolkit.stats.correlation.rank import (
+    kendall_correlation, kendall_tau_b, rank_columns, spearman_correlation
+)
+
+
+class TestRankCorrelation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.integers(0, 15, size=(800, 7)).astype(float)
+        self.data[:, 1] = self.data[:, 0] + rng.normal(size=800)
+        self.data[:, 5] = 4.0
+        self.frame = pd.DataFrame(self.data)
+
+    def test_rank_columns_average_ties(self):
+        ranks = rank_columns([[1.0, 5.0], [2.0, 5.0], [2.0, 1.0]])
+        np.testing.assert_array_equal(ranks, [[1.0, 2.5], [2.5, 2.5], [2.5, 1.0]])
+
+    def test_spearman_matches_pandas(self):
+        result = spearman_correlation(self.data, tile_size=3)
+        np.testing.assert_allclose(result, self.frame.corr(method='spearman').values, atol=1e-12)
+
+    def test_kendall_matches_pandas(self):
+        result = kendall_correlation(self.data, wave_size=5)
+        np.testing.assert_allclose(result, self.frame.corr(method='kendall').values, atol=1e-12)
+
+    def test_kendall_tau_b_matches_scipy_across_block_sizes(self):
+        rng = np.random.default_rng(3)
+        for n in (2, 5, 31, 32, 33, 64, 100, 257, 1000):
+            x = rng.integers(1, max(2, n // 4), size=n)
+            y = rng.integers(1, max(2, n // 3), size=n)
+            expected = stats.kendalltau(x, y)[0]
+            tau = kendall_tau_b(x.astype(np.intp), y.astype(np.intp))
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(tau))
+            else:
+                self.assertAlmostEqual(tau, expected, places=12, msg=n)
+
+    def test_kendall_pairwise_missing_values_match_pandas(self):
+        data = self.data.copy()
+        rng = np.random.default_rng(1)
+        data[rng.random(data.shape) < 0.15] = np.nan
+        data[20:, 6] = np.nan
+        frame = pd.DataFrame(data)
+        for min_periods in (1, 50):
+            result = kendall_correlation(data, wave_size=5, min_periods=min_periods)
+            expected = frame.corr(method='kendall', min_periods=min_periods).values
+            np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
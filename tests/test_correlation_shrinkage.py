@@ -0,0 +1,53 @@
+"""
+Tests des estimateurs à rétrécissement (py_stats_toolkit.stats.correlation.shrinkage).
+"""
+import unittest
+import numpy as np
+from sklearn.covariance import ledoit_wolf, oas
+
+from py_stats_toolkit.stats.correlation.shrinkage import shrunk_covariance
+
+
+class TestShrinkage(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.wide = rng.normal(size=(25, 80)) + rng.normal(size=(25, 1))
+        self.tall = rng.normal(size=(200, 15)) @ rng.normal(size=(15, 15))
+        self.vector = rng.normal(size=80)
+
+    def test_matches_scikit_learn(self):
+        for data in (self.wide, self.tall):
+            for method, reference in (('ledoit_wolf', ledoit_wolf), ('oas', oas)):
+                expected, expected_intensity = reference(data)
+                matrix, intensity = shrunk_covariance(data, method)
+                self.assertAlmostEqual(intensity, expected_intensity, places=12)
+                np.testing.assert_allclose(matrix, expected, atol=1e-12)
+
+    def test_correlation_has_unit_diagonal(self):
+        matrix, _ = shrunk_covariance(self.wide, standardized=True)
+        np.testing.assert_allclose(np.diag(matrix), 1.0)
+        self.assertGreater(np.linalg.eigvalsh(matrix).min(), 0)
+
+    def test_factored_form(self):
+        dense, intensity = shrunk_covariance(self.wide, 'oas', standardized=True)
+        factored, factored_intensity = shrunk_covariance(self.wide, 'oas', standardized=True, factored=True)
+        self.assertAlmostEqual(intensity, factored_intensity, places=12)
+        self.assertEqual(factored.factor.shape, (80, 25))
+        np.testing.assert_allclose(factored @ self.vector, dense @ self.vector, atol=1e-10)
+        np.testing.assert_allclose(factored.diag(), np.diag(dense), atol=1e-12)
+        np.testing.assert_allclose(factored.solve(self.vector), np.linalg.solve(dense, self.vector), atol=1e-8)
+        np.testing.assert_allclose(factored.to_dense(), dense, atol=1e-12)
+
+    def test_factored_form_with_many_rows(self):
+        data = np.random.default_rng(3).normal(size=(20000, 10))
+        dense, intensity = shrunk_covariance(data, 'ledoit_wolf')
+        factored, factored_intensity = shrunk_covariance(data, 'ledoit_wolf', factored=True)
+        self.assertAlmostEqual(intensity, factored_intensity, places=12)
+        self.assertLessEqual(factored.factor.shape[1], 10)
+        np.testing.assert_allclose(factored.to_dense(), dense, atol=1e-12)
+        vector = self.vector[:10]
+        np.testing.assert_allclose(factored.solve(vector), np.linalg.solve(dense, vector), atol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests de la significativité matricielle (py_stats_toolkit.stats.correlation.significance).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from py_stats_toolkit.stats.correlation.engine import pairwise_counts
+from py_stats_toolkit.stats.correlation.significance import (
+    benjamini_hochberg,
+    correlation_significance,
+)
+
+
+class TestCorrelationSignificance(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.data = rng.normal(size=(60, 6))
+        self.data[:, 1] += 0.5 * self.data[:, 0]
+        self.data[:, 4] -= 0.8 * self.data[:, 2]
+
+    def test_pearson_matches_scipy(self):
+        corr = np.corrcoef(self.data, rowvar=False)
+        result = correlation_significance(corr, len(self.data))
+        for i in range(6):
+            for j in range(i + 1, 6):
+                expected = stats.pearsonr(self.data[:, i], self.data[:, j])
+                self.assertAlmostEqual(result['p_value'][i, j], expected.pvalue, places=10)
+                self.assertAlmostEqual(result['p_value'][j, i], expected.pvalue, places=10)
+                low, high = expected.confidence_interval(0.95)
+                self.assertAlmostEqual(result['ci_lower'][i, j], low, places=10)
+                self.assertAlmostEqual(result['ci_upper'][i, j], high, places=10)
+        self.assertTrue(np.isnan(np.diag(result['p_value'])).all())
+
+    def test_spearman_p_values_match_scipy(self):
+        corr = stats.spearmanr(self.data).statistic
+        result = correlation_significance(corr, len(self.data), method='spearman')
+        np.testing.assert_allclose(
+            result['p_value'][0, 1], stats.spearmanr(self.data[:, 0], self.data[:, 1]).pvalue
+        )
+
+    def test_benjamini_hochberg(self):
+        p_values = np.array([0.01, 0.04, 0.03, np.nan, 0.2])
+        expected = [0.04, 0.16 / 3, 0.16 / 3, np.nan, 0.2]
+        np.testing.assert_allclose(benjamini_hochberg(p_values), expected)
+
+    def test_q_values_cover_each_pair_once(self):
+        corr = np.corrcoef(self.data, rowvar=False)
+        result = correlation_significance(corr, len(self.data))
+        i, j = np.triu_indices(6, 1)
+        np.testing.assert_allclose(result['q_value'][i, j], benjamini_hochberg(result['p_value'][i, j]))
+        np.testing.assert_array_equal(result['q_value'], result['q_value'].T)
+
+    def test_pairwise_n_with_missing_values(self):
+        data = self.data.copy()
+        data[:10, 0] = np.nan
+        data[5:20, 3] = np.nan
+        n = pairwise_counts(data)
+        self.assertEqual(n[0, 3], 40)
+        self.assertEqual(n[0, 1], 50)
+        corr = pd.DataFrame(data).corr().values
+        result = correlation_significance(corr, n)
+        complete = ~np.isnan(data[:, 0]) & ~np.isnan(data[:, 3])
+        expected = stats.pearsonr(data[complete, 0], data[complete, 3]).pvalue
+        self.assertAlmostEqual(result['p_value'][0, 3], expected, places=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
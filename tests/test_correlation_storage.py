@@ -0,0 +1,93 @@
+"""
+Tests du stockage sur disque des matrices de corrélation
+(py_stats_toolkit.stats.correlation.storage).
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.correlation.storage import (
+    PACKED_MIN_COLUMNS, CorrelationStore, resolve_layout, stored_correlation
+)
+
+
+class TestCorrelationStore(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(6)
+        self.data = rng.normal(size=(120, 23))
+        self.data[:, 4] = self.data[:, 9] + 0.2 * rng.normal(size=120)
+        self.matrix = np.corrcoef(self.data, rowvar=False)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_layouts_match_dense_matrix(self):
+        for layout in ('upper', 'packed'):
+            store = stored_correlation(
+                self.data, self.path(f'{layout}.npy'), dtype=np.float64, layout=layout, tile_size=5
+            )
+            np.testing.assert_allclose(store[:, :], self.matrix, atol=1e-12)
+            np.testing.assert_allclose(store[3:7, 10:20], self.matrix[3:7, 10:20], atol=1e-12)
+            np.testing.assert_allclose(store[:, 4], self.matrix[:, 4], atol=1e-12)
+            self.assertAlmostEqual(store[9, 4], self.matrix[9, 4], places=12)
+        packed = np.load(self.path('packed.npy'))
+        self.assertEqual(packed.shape, (23 * 24 // 2,))
+
+    def test_float32_and_reopen(self):
+        columns = [f'v{i}' for i in range(23)]
+        stored_correlation(self.data, self.path('m.npy'), tile_size=4, columns=columns)
+        store = CorrelationStore.open(self.path('m.npy'), columns=columns)
+        self.assertEqual(store.dtype, np.float32)
+        self.assertEqual(store.layout, 'upper')
+        np.testing.assert_allclose(store[:, :], self.matrix, atol=1e-6)
+        frame = store.to_frame([0, 4], slice(8, 10))
+        self.assertEqual(list(frame.index), ['v0', 'v4'])
+        self.assertEqual(list(frame.columns), ['v8', 'v9'])
+
+    def test_reopen_restores_column_names(self):
+        for columns in ([f'v{i}' for i in range(23)], list(range(100, 123))):
+            stored_correlation(self.data, self.path('named.npy'), layout='packed', tile_size=6,
+                               columns=columns)
+            store = CorrelationStore.open(self.path('named.npy'))
+            self.assertEqual(list(store.columns), columns)
+            pairs = store.get_correlation_pairs(0.25, block_size=5)
+            self.assertEqual(pairs[0][:2], (columns[4], columns[9]))
+        stored_correlation(self.data, self.path('named.npy'), tile_size=6)
+        self.assertEqual(list(CorrelationStore.open(self.path('named.npy')).columns), list(range(23)))
+
+    def test_correlation_pairs(self):
+        store = stored_correlation(self.data, self.path('p.npy'), layout='packed', tile_size=6)
+        pairs = store.get_correlation_pairs(0.25, block_size=5)
+        i, j = np.triu_indices(23, 1)
+        mask = np.abs(self.matrix[i, j]) >= 0.25
+        self.assertEqual({(a, b) for a, b, _ in pairs}, set(zip(i[mask], j[mask])))
+        self.assertEqual(pairs[0][:2], (4, 9))
+
+    def test_missing_values(self):
+        data = self.data.copy()
+        data[::7, 2] = np.nan
+        store = stored_correlation(data, self.path('nan.npy'), dtype=np.float64, tile_size=8)
+        np.testing.assert_allclose(store[:, :], pd.DataFrame(data).corr().values, atol=1e-12)
+
+    def test_missing_values_min_periods(self):
+        data = self.data.copy()
+        data[:100, 2] = np.nan
+        data[50:, 3] = np.nan
+        store = stored_correlation(data, self.path('mp.npy'), dtype=np.float64, tile_size=8,
+                                   min_periods=30)
+        expected = pd.DataFrame(data).corr(min_periods=30).values
+        np.testing.assert_allclose(store[:, :], expected, atol=1e-12)
+        self.assertTrue(np.isnan(store[2, 3]))
+
+    def test_default_layout_depends_on_size(self):
+        self.assertEqual(resolve_layout(None, 23), 'upper')
+        self.assertEqual(resolve_layout(None, PACKED_MIN_COLUMNS), 'packed')
+        self.assertEqual(resolve_layout('upper', PACKED_MIN_COLUMNS), 'upper')
+
+
+if __name__ == '__main__':
+    unittest.main()
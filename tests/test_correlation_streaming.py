@@ -0,0 +1,45 @@
+"""
+Tests de l'accumulateur de corrélation (py_stats_toolkit.stats.correlation.streaming).
+"""
+import pickle
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.correlation.streaming import StreamingCorrelation
+
+
+class TestStreamingCorrelation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        common = rng.normal(size=(12000, 1))
+        self.data = pd.DataFrame(
+            rng.normal(1e4, 1.0, size=(12000, 6)) + common, columns=list('abcdef')
+        )
+
+    def test_chunks_and_partitions_match_pandas(self):
+        first, second = StreamingCorrelation(), StreamingCorrelation()
+        for start in range(0, 7000, 613):
+            first.partial_fit(self.data.iloc[start:min(start + 613, 7000)])
+        second.partial_fit(self.data.iloc[7000:])
+        first.merge(pickle.loads(pickle.dumps(second)))
+        self.assertEqual(first.n, len(self.data))
+        pd.testing.assert_frame_equal(first.finalize(), self.data.corr(), atol=1e-10, rtol=0)
+        np.testing.assert_allclose(first.covariance(), self.data.cov().values, rtol=1e-9)
+
+    def test_incomplete_rows_are_ignored(self):
+        values = self.data.to_numpy()
+        with_nan = values.copy()
+        with_nan[::50, 2] = np.nan
+        result = StreamingCorrelation().partial_fit(with_nan).finalize()
+        complete = values[np.arange(len(values)) % 50 != 0]
+        np.testing.assert_allclose(result, np.corrcoef(complete.T), atol=1e-10)
+
+    def test_rejects_mismatched_columns(self):
+        accumulator = StreamingCorrelation().partial_fit(self.data.iloc[:10])
+        with self.assertRaises(ValueError):
+            accumulator.partial_fit(self.data.iloc[10:20, :3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Tests de la moyenne mobile exponentielle (py_stats_toolkit.stats.descriptives.ewm).
+"""
+import pickle
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.descriptives.ewm import ExponentialMovingState, resolve_alpha
+
+
+class TestExponentialMovingState(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(50, 2, 10000)
+        self.data[rng.integers(0, len(self.data), 100)] = np.nan
+        self.data[:3] = np.nan
+        self.cuts = np.sort(rng.integers(0, len(self.data), 20))
+
+    def run_in_chunks(self, state):
+        parts = []
+        prev = 0
+        for cut in list(self.cuts) + [len(self.data)]:
+            parts.append(state.update(self.data[prev:cut]))
+            prev = cut
+        return np.concatenate(parts)
+
+    def test_matches_pandas(self):
+        ewm = pd.Series(self.data).ewm(alpha=0.05, adjust=False, ignore_na=True, min_periods=5)
+        for statistic in ('mean', 'var', 'std'):
+            for bias in (False, True):
+                result = ExponentialMovingState(0.05, statistic, bias, min_periods=5).update(self.data)
+                expected = ewm.mean() if statistic == 'mean' else getattr(ewm, statistic)(bias=bias)
+                np.testing.assert_allclose(result, expected.values, rtol=1e-9)
+
+    def test_chunked_is_bitwise_identical(self):
+        single = ExponentialMovingState(0.05, 'var').update(self.data)
+        np.testing.assert_array_equal(self.run_in_chunks(ExponentialMovingState(0.05, 'var')), single)
+
+    def test_state_round_trip(self):
+        single = ExponentialMovingState(0.05, 'std').update(self.data)
+        first = ExponentialMovingState(0.05, 'std')
+        head = first.update(self.data[:777])
+        restored = ExponentialMovingState.from_state(pickle.loads(pickle.dumps(first.get_state())))
+        np.testing.assert_array_equal(np.concatenate([head, restored.update(self.data[777:])]), single)
+
+    def test_resolve_alpha(self):
+        self.assertAlmostEqual(resolve_alpha(span=19), 0.1)
+        self.assertAlmostEqual(resolve_alpha(com=9), 0.1)
+        self.assertAlmostEqual(resolve_alpha(halflife=1), 0.5)
+        with self.assertRaises(ValueError):
+            resolve_alpha(alpha=0.1, span=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests des tables de comptage fusionnables (py_stats_toolkit.stats.frequence.counts).
+"""
+import pickle
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.frequence.counts import (
+    FrequencyCounter, FrequencyTable, contingency_table, count_values, factorize,
+    frequency_table, merge_counts
+)
+
+
+class TestFrequencyCounter(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.series = pd.Series(
+            rng.choice(['a', 'b', 'c', 'd', None], 20000, p=[0.4, 0.3, 0.15, 0.1, 0.05]),
+            name='categorie'
+        )
+
+    def test_chunked_matches_value_counts(self):
+        counter = FrequencyCounter()
+        for start in range(0, len(self.series), 777):
+            counter.update(self.series[start:start + 777])
+        self.assertEqual(counter.n_rows, len(self.series))
+        expected = self.series.value_counts()
+        pd.testing.assert_series_equal(
+            counter.finalize()['Fréquence'], expected.rename('Fréquence')
+        )
+        np.testing.assert_allclose(
+            counter.finalize(normalize=True)['Fréquence Relative Cumulée'].values,
+            self.series.value_counts(normalize=True).cumsum().values
+        )
+
+    def test_merge_is_associative(self):
+        parts = [count_values(self.series[i:i + 5000], dropna=False) for i in range(0, 20000, 5000)]
+        left = merge_counts([merge_counts(parts[:2], False), merge_counts(parts[2:], False)], False)
+        right = merge_counts([parts[0], merge_counts(parts[1:], False)], False)
+        pd.testing.assert_series_equal(left, right)
+        pd.testing.assert_frame_equal(
+            FrequencyTable(left).to_frame(),
+            FrequencyTable(count_values(self.series, dropna=False)).to_frame()
+        )
+
+    def test_counters_merge_across_processes(self):
+        first = FrequencyCounter().update(self.series[:8000])
+        second = pickle.loads(pickle.dumps(FrequencyCounter().update(self.series[8000:])))
+        first.merge(second)
+        pd.testing.assert_frame_equal(
+            first.finalize().to_frame(), FrequencyCounter().update(self.series).finalize().to_frame()
+        )
+
+
+class TestFrequencyTable(unittest.TestCase):
+    def setUp(self):
+        self.series = pd.Series([3, 1, 2, 3, 3, 1, 5, 2, 3, 1])
+        self.table = FrequencyTable(count_values(self.series))
+
+    def test_views_match_value_counts(self):
+        np.testing.assert_array_equal(self.table.absolute.values, self.series.value_counts().values)
+        np.testing.assert_array_equal(self.table.absolute.index, self.series.value_counts().index)
+        np.testing.assert_allclose(
+            self.table.cumulative_relative.values,
+            self.series.value_counts(normalize=True).cumsum().values
+        )
+        self.assertEqual(list(self.table.top(2).index), [3, 1])
+        self.assertEqual(list(self.table.reverse.index), [5, 2, 1, 3])
+        self.assertEqual(list(self.table.to_frame(normalize=True).columns),
+                         ['Fréquence Relative', 'Fréquence Relative Cumulée'])
+
+    def test_views_are_memoized(self):
+        self.assertIs(self.table.relative, self.table.relative)
+        self.assertIs(self.table['Fréquence'], self.table.absolute)
+
+    def test_percentile_rank(self):
+        ranks = self.table.percentile_rank
+        self.assertEqual(list(ranks.index), [1, 2, 3, 5])
+        np.testing.assert_allclose(ranks.values, [15.0, 40.0, 70.0, 95.0])
+
+
+class TestCodedCounts(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.a = pd.Series(rng.choice(['x', 'y', 'z'], 5000))
+        self.b = pd.Series(rng.choice([1.0, 2.0, 3.0, 4.0, np.nan], 5000))
+
+    def test_frequency_table_matches_value_counts(self):
+        for dropna in (True, False):
+            table = frequency_table(self.b, dropna=dropna)
+            expected = self.b.value_counts(dropna=dropna)
+            np.testing.assert_array_equal(table.absolute.values, expected.values)
+            np.testing.assert_array_equal(table.absolute.index, expected.index)
+
+    def test_contingency_matches_crosstab(self):
+        codes_a, categories_a = factorize(self.a)
+        codes_b, categories_b = factorize(self.b)
+        expected = pd.crosstab(self.a, self.b)
+        dense = contingency_table(codes_a, categories_a, codes_b, categories_b)
+        np.testing.assert_array_equal(
+            dense.loc[expected.index, expected.columns].values, expected.values
+        )
+        sparse = contingency_table(codes_a, categories_a, codes_b, categories_b, sparse=True)
+        np.testing.assert_array_equal(sparse.sparse.to_dense().values, dense.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
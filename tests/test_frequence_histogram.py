@@ -0,0 +1,53 @@
+"""
+Tests des résumés de distribution (py_stats_toolkit.stats.frequence.histogram).
+"""
+import unittest
+import numpy as np
+
+from py_stats_toolkit.stats.frequence.histogram import BinnedHistogram, TDigest
+
+
+class TestBinnedHistogram(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.lognormal(0, 1, 100000)
+        self.data[:10] = np.nan
+
+    def test_matches_numpy_histogram(self):
+        for log in (False, True):
+            histogram = BinnedHistogram(0.05, 20.0, bins=30, log=log).update(self.data)
+            valid = self.data[~np.isnan(self.data)]
+            expected, _ = np.histogram(valid, bins=histogram.edges)
+            np.testing.assert_array_equal(histogram.counts, expected)
+            self.assertEqual(histogram.underflow, np.sum(valid < 0.05))
+            self.assertEqual(histogram.overflow, np.sum(valid > 20.0))
+            self.assertEqual(histogram.missing, 10)
+
+    def test_merge_matches_single_pass(self):
+        single = BinnedHistogram(0.0, 10.0, bins=25).update(self.data)
+        merged = BinnedHistogram(0.0, 10.0, bins=25)
+        for chunk in np.array_split(self.data, 7):
+            merged.merge(BinnedHistogram(0.0, 10.0, bins=25).update(chunk))
+        np.testing.assert_array_equal(merged.counts, single.counts)
+        self.assertEqual(merged.to_table().total, single.counts.sum())
+        with self.assertRaises(ValueError):
+            merged.merge(BinnedHistogram(0.0, 10.0, bins=20))
+
+
+class TestTDigest(unittest.TestCase):
+    def test_quantile_rank_error(self):
+        rng = np.random.default_rng(1)
+        data = rng.standard_t(3, 400000)
+        digest = TDigest(200)
+        for chunk in np.array_split(data, 16):
+            digest.merge(TDigest(200).update(chunk))
+        self.assertEqual(digest.total, len(data))
+        levels = np.array([0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999])
+        ranks = np.searchsorted(np.sort(data), digest.quantile(levels)) / len(data)
+        np.testing.assert_allclose(ranks, levels, atol=2e-3)
+        self.assertEqual(digest.quantile(0.0), data.min())
+        self.assertEqual(digest.quantile(1.0), data.max())
+
+
+if __name__ == '__main__':
+    unittest.main()
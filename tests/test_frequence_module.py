@@ -0,0 +1,27 @@
+"""
+Tests des entrées de FrequenceModule.process (py_stats_toolkit.stats.frequence.FrequenceModule).
+"""
+import unittest
+import pandas as pd
+
+try:
+    from py_stats_toolkit.stats.frequence.FrequenceModule import FrequenceModule
+except ImportError:
+    FrequenceModule = None
+
+
+@unittest.skipIf(FrequenceModule is None, "classes de base du module indisponibles")
+class TestFrequenceModuleInputs(unittest.TestCase):
+    def test_iterable_containers_are_series(self):
+        for data in (pd.Categorical([1, 2, 2]), pd.array([1, 2, 2], dtype='Int64'), [1, 2, 2]):
+            table = FrequenceModule(n_jobs=1).process(data)
+            self.assertEqual(dict(table.absolute), {1: 1, 2: 2})
+
+    def test_iterator_is_counted_by_chunks(self):
+        chunks = iter([pd.Series([1, 2]), pd.Series([2])])
+        table = FrequenceModule(n_jobs=1).process(chunks)
+        self.assertEqual(dict(table.absolute), {1: 1, 2: 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
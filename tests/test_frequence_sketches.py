@@ -0,0 +1,103 @@
+"""
+Tests des résumés approximatifs (py_stats_toolkit.stats.frequence.sketches).
+"""
+import io
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.frequence.sketches import (
+    CountMinSketch, FrequencySketch, HyperLogLog, MisraGries
+)
+
+
+class TestSketches(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.series = pd.Series(rng.zipf(1.3, 200000) % 20000).astype(str)
+        self.counts = self.series.value_counts()
+        self.chunks = [self.series[i:i + 25000] for i in range(0, len(self.series), 25000)]
+
+    def test_count_min_bounds(self):
+        sketch = CountMinSketch(epsilon=1e-3, delta=1e-3)
+        for chunk in self.chunks:
+            sketch.update(chunk)
+        estimated = sketch.estimate(pd.Series(self.counts.index))
+        self.assertTrue(np.all(estimated >= self.counts.values))
+        self.assertLessEqual((estimated - self.counts.values).max(), 1e-3 * len(self.series))
+
+    def test_misra_gries_merge_bounds(self):
+        summary = MisraGries(k=20)
+        for chunk in self.chunks:
+            summary.merge(MisraGries(k=20).update(chunk))
+        self.assertLessEqual(len(summary.counts), 20)
+        self.assertLessEqual(summary.error, len(self.series) / 21)
+        true = self.counts[summary.counts.index].values
+        self.assertTrue(np.all(summary.counts.values <= true))
+        self.assertTrue(np.all(summary.counts.values >= true - summary.error))
+        self.assertEqual(list(summary.top(3).index), list(self.counts.index[:3]))
+
+    def test_misra_gries_small_blocks_keep_bounds(self):
+        summary = MisraGries(k=20, block_size=1000).update(self.series)
+        self.assertLessEqual(len(summary.counts), 20)
+        self.assertLessEqual(summary.error, len(self.series) / 21)
+        self.assertEqual(summary.total, len(self.series))
+        true = self.counts[summary.counts.index].values
+        self.assertTrue(np.all(summary.counts.values <= true))
+        self.assertTrue(np.all(summary.counts.values >= true - summary.error))
+
+    def test_misra_gries_bytes_without_pickle(self):
+        for values in (self.series, self.series.astype(int)):
+            summary = MisraGries(k=20).update(values)
+            restored = MisraGries.from_bytes(summary.to_bytes())
+            self.assertEqual(restored.counts.to_dict(), summary.counts.to_dict())
+            self.assertEqual((restored.error, restored.total), (summary.error, summary.total))
+        buffer = io.BytesIO()
+        np.savez(buffer, keys=np.array([object()], dtype=object), counts=np.array([1]),
+                 header=np.array([20, 0, 1, 1000]))
+        with self.assertRaises(ValueError):
+            MisraGries.from_bytes(buffer.getvalue())
+
+    def test_signed_zeros_share_a_counter(self):
+        values = pd.Series([0.0, -0.0, -0.0, 1.5])
+        sketch = FrequencySketch(k=5).update(values)
+        self.assertEqual(sketch.estimate(pd.Series([0.0]))[0], 3)
+        self.assertEqual(sketch.estimate(pd.Series([-0.0]))[0], 3)
+        self.assertAlmostEqual(sketch.distinct(), 2, delta=0.1)
+
+    def test_int_and_float_chunks_merge(self):
+        integers = pd.Series([1] * 100 + [2] * 50)
+        floats = pd.Series([1.0] * 100 + [np.nan])
+        merged = FrequencySketch(k=10).update(integers).merge(FrequencySketch(k=10).update(floats))
+        top = merged.top()
+        self.assertTrue(np.all(top['Fréquence Estimée'] >= top['Fréquence Minimale']))
+        np.testing.assert_array_equal(merged.estimate(pd.Series([1, 2])), [200, 50])
+        np.testing.assert_array_equal(merged.estimate(pd.Series([1.0, 2.0])), [200, 50])
+        self.assertAlmostEqual(merged.distinct(), 2, delta=0.1)
+
+    def test_hyperloglog_error(self):
+        merged = HyperLogLog(error=0.01)
+        for chunk in self.chunks:
+            part = HyperLogLog(error=0.01)
+            part.update(chunk)
+            merged.merge(part)
+        self.assertAlmostEqual(merged.estimate() / self.series.nunique(), 1.0, delta=0.04)
+        for n in (10, 100000):
+            hll = HyperLogLog(precision=14)
+            hll.update(np.arange(n))
+            self.assertAlmostEqual(hll.estimate() / n, 1.0, delta=0.04)
+
+    def test_serialized_merge_matches_single_pass(self):
+        single = FrequencySketch(k=10, epsilon=1e-3).update(self.series)
+        merged = FrequencySketch(k=10, epsilon=1e-3)
+        for chunk in self.chunks:
+            payload = FrequencySketch(k=10, epsilon=1e-3).update(chunk).to_bytes()
+            merged.merge(FrequencySketch.from_bytes(payload))
+        np.testing.assert_array_equal(merged.cms.table, single.cms.table)
+        np.testing.assert_array_equal(merged.hll.registers, single.hll.registers)
+        self.assertEqual(merged.total, len(self.series))
+        self.assertEqual(list(merged.top(3).index), list(self.counts.index[:3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Tests du mode flux de MoyenneGlissanteModule (py_stats_toolkit.stats.descriptives.MoyenneGlissanteModule).
+"""
+import unittest
+import numpy as np
+
+try:
+    from py_stats_toolkit.stats.descriptives.MoyenneGlissanteModule import MoyenneGlissanteModule
+except ImportError:
+    MoyenneGlissanteModule = None
+
+
+@unittest.skipIf(MoyenneGlissanteModule is None, "classes de base du module indisponibles")
+class TestMoyenneGlissanteStream(unittest.TestCase):
+    def test_partial_process_after_process_is_rejected(self):
+        module = MoyenneGlissanteModule(n_jobs=1)
+        module.process(np.arange(10.0), window_size=3)
+        with self.assertRaises(ValueError):
+            module.partial_process(np.arange(10.0, 13.0))
+        module.reset_state()
+        np.testing.assert_array_equal(module.partial_process(np.arange(10.0, 13.0)).values,
+                                      [np.nan, np.nan, 11.0])
+
+    def test_stream_reproduces_process(self):
+        values = np.random.default_rng(2).normal(size=50)
+        expected = MoyenneGlissanteModule(n_jobs=1).process(values, window_size=5)
+        module = MoyenneGlissanteModule(n_jobs=1)
+        parts = [module.partial_process(part, window_size=5) for part in np.array_split(values, 4)]
+        np.testing.assert_allclose(np.concatenate([part.values for part in parts]), expected.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Tests du moteur de fenêtres glissantes (py_stats_toolkit.stats.descriptives.rolling).
+"""
+import pickle
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.descriptives.rolling import (
+    BlockPrefixSum, RollingExtremum, RollingMean, RollingMeanBank, RollingQuantile,
+    RollingTimeMean, RollingVariance, as_duration, as_nanoseconds, chunk_tasks,
+    max_points_per_window, resolve_block_size
+)
+
+
+def run_in_chunks(state, values, cuts):
+    parts = []
+    prev = 0
+    for cut in list(cuts) + [len(values)]:
+        parts.append(state.update(values[prev:cut]))
+        prev = cut
+    return np.concatenate(parts)
+
+
+class TestRollingMean(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.data = rng.normal(1e4, 10, 20000)
+        self.data[rng.integers(0, len(self.data), 100)] = np.nan
+        self.cuts = np.sort(rng.integers(0, len(self.data), 25))
+
+    def test_matches_pandas(self):
+        for window in (1, 5, 300, 5000):
+            result = RollingMean(window).update(self.data)
+            expected = pd.Series(self.data).rolling(window).mean().values
+            np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_min_periods(self):
+        result = RollingMean(50, min_periods=10).update(self.data)
+        expected = pd.Series(self.data).rolling(50, min_periods=10).mean().values
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_chunked_is_bitwise_identical(self):
+        for window in (5, 300, 5000):
+            single = RollingMean(window).update(self.data)
+            chunked = run_in_chunks(RollingMean(window), self.data, self.cuts)
+            np.testing.assert_array_equal(chunked, single)
+
+    def test_parallel_tasks_are_bitwise_identical(self):
+        window = 300
+        block_size = resolve_block_size(window)
+        single = RollingMean(window).update(self.data)
+        parts = [
+            RollingMean(window, block_size=block_size).update(self.data[halo:stop])[start - halo:]
+            for halo, start, stop in chunk_tasks(len(self.data), 7000, window, block_size)
+        ]
+        np.testing.assert_array_equal(np.concatenate(parts), single)
+
+    def test_state_round_trip(self):
+        window = 300
+        single = RollingMean(window).update(self.data)
+        first = RollingMean(window)
+        head = first.update(self.data[:12345])
+        restored = RollingMean.from_state(pickle.loads(pickle.dumps(first.get_state())))
+        tail = run_in_chunks(restored, self.data[12345:], [1, 2, 500])
+        np.testing.assert_array_equal(np.concatenate([head, tail]), single)
+
+    def test_bank_matches_single_windows(self):
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(3000, 4))
+        data[rng.integers(0, 3000, 20), rng.integers(0, 4, 20)] = np.nan
+        windows = [5, 20, 200]
+        result = run_in_chunks(RollingMeanBank(windows, n_columns=4), data, [7, 1500])
+        self.assertEqual(result.shape, (3000, 4, 3))
+        for j, window in enumerate(windows):
+            np.testing.assert_array_equal(
+                result[:, :, j], RollingMean(window, n_columns=4).update(data)
+            )
+            expected = pd.DataFrame(data).rolling(window).mean().values
+            np.testing.assert_allclose(result[:, :, j], expected, rtol=1e-9)
+
+    def test_window_spanning_several_blocks(self):
+        window = 1000
+
+        def rolling_sum(cuts):
+            engine = BlockPrefixSum(block_size=64, history=window)
+            parts = []
+            prev = 0
+            for cut in list(cuts) + [len(self.data)]:
+                start = engine.position
+                engine.extend(self.data[prev:cut])
+                ends = np.arange(start, engine.position)
+                parts.append(engine.window_sums(ends, np.maximum(ends - window + 1, 0))[0])
+                prev = cut
+            return np.concatenate(parts).ravel()
+
+        single = rolling_sum([])
+        np.testing.assert_array_equal(rolling_sum(self.cuts), single)
+        expected = pd.Series(np.nan_to_num(self.data)).rolling(window, min_periods=1).sum()
+        np.testing.assert_allclose(single, expected.values, rtol=1e-9)
+
+class TestRollingTimeMean(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        n = 20000
+        gaps = np.cumsum(rng.exponential(2.0, n)).round(3)
+        self.index = pd.Timestamp('2024-01-01') + pd.to_timedelta(gaps, unit='s')
+        self.data = rng.normal(50, 5, n)
+        self.data[rng.integers(0, n, 80)] = np.nan
+        self.cuts = np.sort(rng.integers(0, n, 20))
+
+    def test_matches_pandas(self):
+        for duration in ('5min', '3h'):
+            result = RollingTimeMean(duration, block_size=64).update(self.data, self.index)
+            expected = pd.Series(self.data, index=self.index).rolling(duration).mean().values
+            np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_chunked_and_parallel_are_bitwise_identical(self):
+        times = as_nanoseconds(self.index)
+        max_count = max_points_per_window(times, as_duration('5min'))
+        block_size = resolve_block_size(max_count)
+        single = RollingTimeMean('5min', block_size=block_size).update(self.data, times)
+
+        state = RollingTimeMean('5min', block_size=block_size)
+        parts = []
+        prev = 0
+        for cut in list(self.cuts) + [len(self.data)]:
+            parts.append(state.update(self.data[prev:cut], times[prev:cut]))
+            prev = cut
+            if cut == self.cuts[5]:
+                state = RollingTimeMean.from_state(pickle.loads(pickle.dumps(state.get_state())))
+        np.testing.assert_array_equal(np.concatenate(parts), single)
+        self.assertLessEqual(len(state._times), max_count)
+
+        parts = [
+            RollingTimeMean('5min', block_size=block_size).update(
+                self.data[halo:stop], times[halo:stop])[start - halo:]
+            for halo, start, stop in chunk_tasks(len(self.data), 3000, max_count, block_size)
+        ]
+        np.testing.assert_array_equal(np.concatenate(parts), single)
+
+    def test_rejects_unsorted_timestamps(self):
+        state = RollingTimeMean('1min')
+        state.update([1.0, 2.0], self.index[5:7])
+        with self.assertRaises(ValueError):
+            state.update([3.0], self.index[:1])
+
+
+class TestRollingStatistics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.data = rng.normal(1e6, 5, 20000)
+        self.data[rng.integers(0, len(self.data), 50)] = np.nan
+        self.cuts = np.sort(rng.integers(0, len(self.data), 15))
+        self.series = pd.Series(self.data)
+
+    def assert_chunk_invariant(self, make_state):
+        single = make_state().update(self.data)
+        np.testing.assert_array_equal(run_in_chunks(make_state(), self.data, self.cuts), single)
+        return single
+
+    def test_variance(self):
+        for window in (3, 500):
+            result = self.assert_chunk_invariant(lambda: RollingVariance(window))
+            # Référence à deux passes (pandas perd de la précision à cette moyenne)
+            windows = np.lib.stride_tricks.sliding_window_view(self.data, window)
+            expected = np.concatenate([np.full(window - 1, np.nan), np.var(windows, axis=1, ddof=1)])
+            np.testing.assert_allclose(result, expected, rtol=1e-7)
+
+    def test_variance_is_stable_on_large_offsets(self):
+        values = np.array([1e9 + 0.125, 1e9 + 0.375, 1e9 + 0.25])
+        np.testing.assert_allclose(RollingVariance(2).update(values)[1:], [0.03125, 0.0078125])
+
+    def test_extrema(self):
+        for kind in ('min', 'max'):
+            result = self.assert_chunk_invariant(lambda: RollingExtremum(100, min_periods=1, kind=kind))
+            expected = getattr(self.series.rolling(100, min_periods=1), kind)().values
+            np.testing.assert_array_equal(result, expected)
+
+    def test_median_and_quantiles(self):
+        result = self.assert_chunk_invariant(lambda: RollingQuantile(200))
+        np.testing.assert_allclose(result, self.series.rolling(200).median().values)
+
+        clean = np.nan_to_num(self.data, nan=1e6)
+        quantiles = RollingQuantile(50, [0.1, 0.9], min_periods=1).update(clean)
+        for j, q in enumerate((0.1, 0.9)):
+            expected = pd.Series(clean).rolling(50, min_periods=1).quantile(q).values
+            np.testing.assert_allclose(quantiles[:, j], expected)
+
+    def test_quantiles_use_sorted_list_only_around_missing_values(self):
+        state = RollingQuantile(200)
+        covered = []
+        slide = state._slide_sorted
+
+        def counting(y, first, stop, out):
+            covered.append(stop - first)
+            slide(y, first, stop, out)
+
+        state._slide_sorted = counting
+        result = state.update(self.data)
+        np.testing.assert_allclose(result, self.series.rolling(200).median().values)
+        # Début de série plus, au plus, w fenêtres par valeur manquante
+        self.assertLessEqual(sum(covered), 199 + 200 * int(np.isnan(self.data).sum()))
+        self.assertLess(sum(covered), len(self.data))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests des détecteurs d'anomalies (py_stats_toolkit.stats.temporelle.anomaly).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.temporelle.anomaly import MAD_SCALE, detect, make_detector
+
+
+class TestAnomalyDetectors(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(24)
+        self.values = rng.normal(size=(600, 3))
+        self.values[[150, 420], 1] += 15.0
+        self.values[[77, 310], 2] = np.nan
+
+    def test_batch_chunked_and_point_updates_are_identical(self):
+        for method in ('zscore', 'mad', 'ewma'):
+            scores, flags = detect(self.values, method, window=40)
+            chunked = make_detector(method, window=40, n_columns=3)
+            parts = np.vstack([chunked.update(part) for part in np.array_split(self.values, 7)])
+            pointwise = make_detector(method, window=40, n_columns=3)
+            points = np.vstack([pointwise.update(self.values[i:i + 1]) for i in range(len(self.values))])
+            np.testing.assert_array_equal(parts, scores, err_msg=method)
+            np.testing.assert_array_equal(points, scores, err_msg=method)
+            np.testing.assert_array_equal(pointwise.flags(points), flags, err_msg=method)
+
+    def test_mad_sorted_window_with_ties_and_missing_values(self):
+        values = np.random.default_rng(5).integers(0, 4, size=(300, 2)).astype(np.float64)
+        values[::7, 0] = np.nan
+        scores, _ = detect(values, 'mad', window=12, min_periods=5)
+        detector = make_detector('mad', window=12, min_periods=5, n_columns=2)
+        parts = np.vstack([detector.update(part) for part in np.array_split(values, 40)])
+        np.testing.assert_array_equal(parts, scores)
+
+    def test_zscore_uses_previous_window(self):
+        series = pd.DataFrame(self.values)
+        rolling = series.rolling(40)
+        expected = (series - rolling.mean().shift()) / rolling.std().shift()
+        scores, _ = detect(self.values, 'zscore', window=40)
+        np.testing.assert_allclose(scores, expected.to_numpy(), rtol=1e-9, atol=1e-12)
+
+    def test_mad_matches_reference(self):
+        x = self.values[:, 1]
+        scores, _ = detect(x, 'mad', window=25)
+        for i in (25, 151, 421, 599):
+            window = x[i - 25:i]
+            median = np.median(window)
+            mad = np.median(np.abs(window - median)) * MAD_SCALE
+            self.assertAlmostEqual(scores[i], (x[i] - median) / mad, places=12)
+        self.assertTrue(np.isnan(scores[:25]).all())
+
+    def test_injected_spikes_are_flagged(self):
+        for method in ('zscore', 'mad', 'ewma'):
+            _, flags = detect(self.values[:, 1], method, window=40)
+            self.assertTrue(flags[150] and flags[420], method)
+            self.assertLess(flags.sum(), 10, method)
+
+    def test_missing_values_are_not_flagged(self):
+        for method in ('zscore', 'mad', 'ewma'):
+            scores, flags = detect(self.values[:, 2], method, window=40, min_periods=30)
+            self.assertTrue(np.isnan(scores[[77, 310]]).all(), method)
+            self.assertFalse(flags[[77, 310]].any(), method)
+            self.assertFalse(np.isnan(scores[78:100]).any(), method)
+
+    def test_constant_series(self):
+        scores, flags = detect(np.ones(100), 'zscore', window=10)
+        self.assertTrue((scores[10:] == 0).all())
+        self.assertFalse(flags.any())
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            make_detector('iforest')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests du mode panel des séries temporelles (py_stats_toolkit.stats.temporelle.panel).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.temporelle.panel import (
+    COLUMNS,
+    long_to_blocks,
+    panel_summary,
+    split_rows,
+)
+
+
+def reference_summary(values):
+    """Statistiques calculées série par série comme TimeSeriesAnalyzer.process."""
+    series = pd.Series(values)
+    slope, intercept = np.polyfit(np.arange(len(values)), values, 1)
+    fft = np.fft.fft(values)
+    freqs = np.fft.fftfreq(len(values))
+    index = np.argmax(np.abs(fft[1:len(fft) // 2])) + 1
+    return [
+        series.mean(), series.std(), series.min(), series.max(), series.median(),
+        slope, intercept, freqs[index], 1 / freqs[index],
+    ]
+
+
+class TestPanelSummary(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        t = np.arange(60)
+        self.values = rng.normal(size=(9, 60)) + np.sin(2 * np.pi * t / 12) + 0.05 * t
+
+    def test_matches_per_series_analysis(self):
+        expected = np.array([reference_summary(row) for row in self.values])
+        np.testing.assert_allclose(panel_summary(self.values), expected, atol=1e-10)
+
+    def test_chunking_invariance(self):
+        chunks = split_rows(self.values, 4, max_rows=2)
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 2, 2, 1])
+        np.testing.assert_allclose(
+            np.concatenate([panel_summary(chunk) for chunk in chunks]), panel_summary(self.values),
+            rtol=1e-12, atol=1e-12,
+        )
+
+    def test_short_series(self):
+        summary = panel_summary(np.array([[1.0, 2.0, 4.0]]))
+        self.assertEqual(summary[0, COLUMNS.index('Pente')], 1.5)
+        self.assertTrue(np.isnan(summary[0, COLUMNS.index('Période Principale')]))
+
+    def test_long_format_groups_by_length(self):
+        data = pd.DataFrame({
+            'id': ['b'] * 4 + ['a'] * 3 + ['c'] * 4 + [None],
+            't': [3, 2, 1, 0, 0, 1, 2, 0, 1, 2, 3, 0],
+            'v': [4.0, 3.0, 2.0, 1.0, 5.0, 6.0, 7.0, 1.0, 1.0, 2.0, 2.0, 9.0],
+        })
+        blocks = dict((len(ids), (list(ids), values)) for ids, values in long_to_blocks(data, 'id', 'v', 't'))
+        self.assertEqual(blocks[1][0], ['a'])
+        np.testing.assert_array_equal(blocks[1][1], [[5.0, 6.0, 7.0]])
+        self.assertEqual(blocks[2][0], ['b', 'c'])
+        np.testing.assert_array_equal(blocks[2][1], [[1.0, 2.0, 3.0, 4.0], [1.0, 1.0, 2.0, 2.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests de l'agrégation par intervalles de temps (py_stats_toolkit.stats.temporelle.resample).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.temporelle.resample import AGGREGATIONS, BucketAggregator, resample, to_frame
+
+REFERENCE = {
+    'Ouverture': 'first', 'Plus haut': 'max', 'Plus bas': 'min', 'Clôture': 'last',
+    'Moyenne': 'mean', 'Somme': 'sum', 'Effectif': 'count',
+}
+
+
+class TestResample(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(25)
+        index = pd.date_range('2026-03-01 12:00:00.250', periods=30000, freq='1ms')
+        values = rng.normal(size=(30000, 3))
+        values[rng.integers(0, 30000, 4000), 1] = np.nan
+        values[3000:5500, 2] = np.nan
+        # Trou d'horodatages : intervalles vides
+        keep = np.ones(30000, dtype=bool)
+        keep[9000:12600] = False
+        self.frame = pd.DataFrame(values[keep], index=index[keep], columns=['a', 'b', 'c'])
+
+    def assert_matches_pandas(self, result, frame, freq):
+        expected = frame.resample(freq)
+        for label, how in REFERENCE.items():
+            reference = getattr(expected, how)()
+            self.assertTrue(result.index.equals(reference.index))
+            np.testing.assert_allclose(result.xs(label, axis=1, level=1), reference, rtol=1e-12,
+                                       err_msg=label)
+
+    def test_matches_pandas_resample(self):
+        starts, aggregated = resample(self.frame.index, self.frame.to_numpy(), '1s',
+                                      aggregations=AGGREGATIONS, empty_buckets=True)
+        self.assert_matches_pandas(to_frame(starts, aggregated, self.frame.columns), self.frame, '1s')
+
+    def test_streaming_chunks_carry_partial_buckets(self):
+        starts, aggregated = resample(self.frame.index, self.frame.to_numpy(), '1s',
+                                      aggregations=AGGREGATIONS, empty_buckets=True)
+        aggregator = BucketAggregator('1s', aggregations=AGGREGATIONS, empty_buckets=True)
+        cuts = np.array_split(np.arange(len(self.frame)), 11)
+        parts = [aggregator.update(self.frame.index[cut], self.frame.to_numpy()[cut]) for cut in cuts]
+        parts.append(aggregator.flush())
+        np.testing.assert_array_equal(np.concatenate([part[0] for part in parts]), starts)
+        for name in AGGREGATIONS:
+            streamed = np.vstack([part[1][name] for part in parts])
+            if name in ('mean', 'sum'):
+                np.testing.assert_allclose(streamed, aggregated[name], rtol=1e-12, err_msg=name)
+            else:
+                np.testing.assert_array_equal(streamed, aggregated[name], err_msg=name)
+
+    def test_parallel_column_blocks(self):
+        values = self.frame.to_numpy()
+        serial = resample(self.frame.index, values, '250ms')[1]
+        blocked = resample(self.frame.index, values, '250ms', map_func=map, n_blocks=3)[1]
+        for name, expected in serial.items():
+            np.testing.assert_array_equal(blocked[name], expected)
+
+    def test_single_series_and_origin(self):
+        series = self.frame['a']
+        starts, aggregated = resample(series.index, series.to_numpy(), '1min', origin='2026-03-01 11:59:30')
+        frame = to_frame(starts, aggregated)
+        expected = series.resample('1min', origin='2026-03-01 11:59:30').ohlc()
+        self.assertTrue(frame.index.equals(expected.index))
+        np.testing.assert_array_equal(frame['Ouverture'], expected['open'])
+        np.testing.assert_array_equal(frame['Clôture'], expected['close'])
+
+    def test_unsorted_input(self):
+        index = self.frame.index[::-1]
+        with self.assertRaises(ValueError):
+            resample(index, self.frame.to_numpy(), '1s')
+        aggregator = BucketAggregator('1s')
+        aggregator.update(self.frame.index[1000:2000], self.frame.to_numpy()[1000:2000])
+        with self.assertRaises(ValueError):
+            aggregator.update(self.frame.index[:1000], self.frame.to_numpy()[:1000])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests du moteur spectral des séries temporelles (py_stats_toolkit.stats.temporelle.spectral).
+"""
+import unittest
+import numpy as np
+from scipy.linalg import solve_toeplitz
+
+from py_stats_toolkit.stats.temporelle.spectral import (
+    acf,
+    averaged_spectrum,
+    candidates_frame,
+    detect_seasonality,
+    pacf,
+    welch_periodogram,
+)
+
+
+class TestSpectral(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(9)
+        noise = rng.normal(size=600)
+        self.series = np.convolve(noise, [1.0, 0.6, 0.3], mode='same')
+        t = np.arange(3000)
+        self.panel = np.stack([
+            np.sin(2 * np.pi * t / period) + 0.4 * rng.normal(size=3000) for period in (7, 12, 48)
+        ])
+
+    def reference_acf(self, values, max_lag):
+        centered = values - values.mean()
+        n = len(values)
+        return np.array([centered[:n - k] @ centered[k:] for k in range(max_lag + 1)]) / (centered @ centered)
+
+    def test_acf_matches_direct_sums(self):
+        np.testing.assert_allclose(acf(self.series, 30), self.reference_acf(self.series, 30), atol=1e-12)
+        self.assertEqual(len(acf(self.series)), 600)
+        batch = acf(self.panel, 10)
+        self.assertEqual(batch.shape, (3, 11))
+        np.testing.assert_allclose(batch[1], self.reference_acf(self.panel[1], 10), atol=1e-12)
+
+    def test_pacf_matches_yule_walker(self):
+        r = self.reference_acf(self.series, 8)
+        expected = [1.0] + [solve_toeplitz(r[:m], r[1:m + 1])[-1] for m in range(1, 9)]
+        np.testing.assert_allclose(pacf(self.series, 8), expected, atol=1e-12)
+
+    def test_averaged_spectrum_single_segment_is_exact_acf(self):
+        _, _, autocorrelation = averaged_spectrum(self.series.reshape(1, -1), 600)
+        np.testing.assert_allclose(autocorrelation[0, :20], self.reference_acf(self.series, 19), atol=1e-12)
+
+    def test_welch_peak(self):
+        frequencies, power = welch_periodogram(self.panel, segment_length=480)
+        self.assertAlmostEqual(frequencies[np.argmax(power[1])], 1 / 12, delta=1 / 480)
+
+    def test_detect_seasonality(self):
+        periods, scores = detect_seasonality(self.panel)
+        np.testing.assert_array_equal(periods, [7, 12, 48])
+        self.assertTrue(np.all(scores > 0.5))
+        period, _ = detect_seasonality(self.panel[2], max_period=100)
+        self.assertEqual(period, 48)
+        candidates = candidates_frame(self.panel[1])
+        self.assertEqual(candidates['Période'].iloc[0], 12)
+        self.assertTrue(candidates['Score ACF'].is_monotonic_decreasing)
+
+    def test_white_noise_has_no_period(self):
+        noise = np.random.default_rng(4).normal(size=(3, 5000))
+        periods, scores = detect_seasonality(noise)
+        self.assertTrue(np.all(np.isnan(periods)))
+        self.assertTrue(np.all(np.isnan(scores)))
+        self.assertTrue(np.all(np.isfinite(detect_seasonality(noise, min_score=None)[0])))
+
+    def test_trend_is_removed(self):
+        t = np.arange(3000)
+        series = np.sin(2 * np.pi * t / 24) + 0.05 * t + 0.3 * np.random.default_rng(5).normal(size=3000)
+        period, score = detect_seasonality(series)
+        self.assertEqual(period, 24)
+        self.assertGreater(score, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests du résumé en ligne des séries temporelles (py_stats_toolkit.stats.temporelle.streaming).
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from py_stats_toolkit.stats.temporelle.panel import COLUMNS, panel_summary
+from py_stats_toolkit.stats.temporelle.streaming import StreamingSummary
+
+EXACT = [
+    'Moyenne', 'Écart-type', 'Minimum', 'Maximum', 'Pente', 'Intercept',
+    'Fréquence Principale', 'Période Principale',
+]
+
+
+class TestStreamingSummary(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(10)
+        t = np.arange(3000)
+        self.values = rng.normal(size=3000) + 0.002 * t + np.sin(2 * np.pi * t / 25)
+        self.expected = pd.Series(panel_summary(self.values.reshape(1, -1))[0], index=COLUMNS)
+
+    def test_point_updates_match_batch_statistics(self):
+        summary = StreamingSummary()
+        for value in self.values:
+            summary.update(value)
+        snapshot = summary.snapshot()
+        np.testing.assert_allclose(snapshot[EXACT], self.expected[EXACT], rtol=1e-10, atol=1e-12)
+        self.assertAlmostEqual(snapshot['Médiane'], self.expected['Médiane'], delta=0.02)
+
+    def test_merge_of_consecutive_shards(self):
+        first, second, third = StreamingSummary(), StreamingSummary(), StreamingSummary()
+        first.update_many(self.values[:700])
+        second.update_many(self.values[700:2100])
+        for value in self.values[2100:]:
+            third.update(value)
+        merged = first.merge(second).merge(third).snapshot()
+        np.testing.assert_allclose(merged[EXACT], self.expected[EXACT], rtol=1e-10, atol=1e-12)
+
+    def test_recent_window(self):
+        summary = StreamingSummary(spectral_window=100)
+        summary.update_many(self.values[:250])
+        for value in self.values[250:260]:
+            summary.update(value)
+        np.testing.assert_array_equal(summary.recent(), self.values[160:260])
+
+    def test_missing_values_and_empty_state(self):
+        self.assertTrue(StreamingSummary().snapshot().isna().all())
+        summary = StreamingSummary()
+        summary.update_many([1.0, np.nan, 3.0])
+        summary.update(np.nan)
+        self.assertEqual(summary.n, 2)
+        self.assertEqual(summary.snapshot()['Moyenne'], 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()